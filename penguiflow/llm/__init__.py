@@ -75,6 +75,7 @@ from .profiles import (
     ModelProfile,
     get_profile,
     register_profile,
+    unregister_profile,
 )
 
 # Protocol adapter
@@ -200,6 +201,7 @@ __all__ = [
     "ModelProfile",
     "get_profile",
     "register_profile",
+    "unregister_profile",
     # Providers
     "AnthropicProvider",
     "BedrockProvider",
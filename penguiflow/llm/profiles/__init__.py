@@ -5,14 +5,22 @@ Declarative capability descriptions per model, adapted from PydanticAI patterns.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Literal
+from functools import lru_cache
+from importlib import import_module
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, Literal
 
 if TYPE_CHECKING:
     from ..schema.transformer import JsonSchemaTransformer
 
 
-@dataclass
+# Shared by every profile whose model emits inline <think>...</think> reasoning
+THINK_TAGS: Final[tuple[str, str]] = ("<think>", "</think>")
+
+
+@dataclass(frozen=True, slots=True)
 class ModelProfile:
     """Describes capabilities and configuration for a specific model.
 
@@ -67,18 +75,28 @@ class ModelProfile:
 # Profile Registry
 # ---------------------------------------------------------------------------
 
+# Returned for unknown models; safe to share because ModelProfile is frozen
+_DEFAULT_PROFILE: Final[ModelProfile] = ModelProfile()
+
 # Import profiles from submodules at runtime to avoid circular imports
 _PROFILES: dict[str, ModelProfile] | None = None
 
+# Bumped on every register/unregister so callers can key caches on registry state
+_REGISTRY_VERSION = 0
+
+# Character trie over profile keys for longest-prefix lookup; "" marks a key end.
+_PREFIX_TRIE: dict[str, Any] = {}
+
 
 def _profile_candidates(model: str) -> list[str]:
     """Generate exact and normalized candidates for nested model identifiers."""
     seen: set[str] = set()
     candidates: list[str] = []
 
-    parts = model.split("/")
-    for idx in range(len(parts)):
-        candidate = "/".join(parts[idx:])
+    # Each "/"-separated suffix is a candidate ("nim/qwen/x" -> "nim/qwen/x", "qwen/x", "x").
+    candidate = model
+    sep = "/"
+    while sep:
         if candidate and candidate not in seen:
             seen.add(candidate)
             candidates.append(candidate)
@@ -88,6 +106,8 @@ def _profile_candidates(model: str) -> list[str]:
             seen.add(normalized)
             candidates.append(normalized)
 
+        _, sep, candidate = candidate.partition("/")
+
     return candidates
 
 
@@ -106,14 +126,55 @@ def _load_profiles() -> dict[str, ModelProfile]:
     return profiles
 
 
-def get_profiles() -> dict[str, ModelProfile]:
-    """Get all registered profiles."""
+def _trie_insert(key: str) -> None:
+    node = _PREFIX_TRIE
+    for char in key:
+        node = node.setdefault(char, {})
+    node[""] = key
+
+
+def _rebuild_trie(profiles: dict[str, ModelProfile]) -> None:
+    _PREFIX_TRIE.clear()
+    for key in profiles:
+        _trie_insert(key)
+
+
+def _longest_prefix(candidate: str) -> str | None:
+    """Return the longest registered profile key that prefixes ``candidate``."""
+    node = _PREFIX_TRIE
+    match: str | None = node.get("")
+    for char in candidate:
+        child = node.get(char)
+        if child is None:
+            break
+        node = child
+        match = node.get("", match)
+    return match
+
+
+def _registry() -> dict[str, ModelProfile]:
+    """Return the mutable profile registry, loading it on first use."""
     global _PROFILES
     if _PROFILES is None:
         _PROFILES = _load_profiles()
+        _rebuild_trie(_PROFILES)
     return _PROFILES
 
 
+def get_profiles() -> Mapping[str, ModelProfile]:
+    """Get a read-only view of all registered profiles.
+
+    Use ``register_profile`` / ``unregister_profile`` to change the registry so
+    cached lookups stay consistent.
+    """
+    return MappingProxyType(_registry())
+
+
+def registry_version() -> int:
+    """Return a counter that changes whenever a profile is registered or removed."""
+    return _REGISTRY_VERSION
+
+
 def get_profile(model: str) -> ModelProfile:
     """Get profile for a model, with fallback to defaults.
 
@@ -123,22 +184,30 @@ def get_profile(model: str) -> ModelProfile:
     Returns:
         The model profile, or a default profile if not found.
     """
-    profiles = get_profiles()
+    profile = _lookup_profile(model)
+    return profile if profile is not None else _DEFAULT_PROFILE
+
+
+@lru_cache(maxsize=512)
+def _lookup_profile(model: str) -> ModelProfile | None:
+    """Resolve a model identifier to its registered profile (cached per raw id)."""
+    profiles = _registry()
 
     candidates = _profile_candidates(model)
 
     for candidate in candidates:
-        if candidate in profiles:
-            return profiles[candidate]
+        profile = profiles.get(candidate)
+        if profile is not None:
+            return profile
 
-    # Prefix matching for versioned models (e.g., "gpt-4o-2024-08-06" -> "gpt-4o")
-    for key, profile in profiles.items():
-        for candidate in candidates:
-            if candidate.startswith(key):
-                return profile
+    # Prefix matching for versioned models (e.g., "gpt-4o-2024-08-06" -> "gpt-4o").
+    # The longest registered key wins so "gpt-4.1-mini-…" doesn't resolve to "gpt-4".
+    for candidate in candidates:
+        key = _longest_prefix(candidate)
+        if key is not None:
+            return profiles[key]
 
-    # Default fallback
-    return ModelProfile()
+    return None
 
 
 def register_profile(model: str, profile: ModelProfile) -> None:
@@ -148,8 +217,25 @@ def register_profile(model: str, profile: ModelProfile) -> None:
         model: The model identifier.
         profile: The model profile.
     """
-    profiles = get_profiles()
-    profiles[model] = profile
+    global _REGISTRY_VERSION
+    _registry()[model] = profile
+    _trie_insert(model)
+    _lookup_profile.cache_clear()
+    _REGISTRY_VERSION += 1
+
+
+def unregister_profile(model: str) -> None:
+    """Remove a registered profile. Unknown identifiers are ignored.
+
+    Args:
+        model: The model identifier.
+    """
+    global _REGISTRY_VERSION
+    profiles = _registry()
+    profiles.pop(model, None)
+    _rebuild_trie(profiles)
+    _lookup_profile.cache_clear()
+    _REGISTRY_VERSION += 1
 
 
 # ---------------------------------------------------------------------------
@@ -157,6 +243,29 @@ def register_profile(model: str, profile: ModelProfile) -> None:
 # ---------------------------------------------------------------------------
 
 
+# Built-in transformer name -> schema submodule that registers it on import
+_TRANSFORMER_MODULES: dict[str, str] = {
+    "OpenAIJsonSchemaTransformer": "openai",
+    "AnthropicJsonSchemaTransformer": "anthropic",
+    "GoogleJsonSchemaTransformer": "google",
+    "BedrockJsonSchemaTransformer": "bedrock",
+    "DatabricksJsonSchemaTransformer": "databricks",
+}
+
+
+def _transformer_class(name: str) -> type[JsonSchemaTransformer] | None:
+    """Look up a registered transformer, importing its built-in module on first use."""
+    from ..schema.transformer import get_registered_transformer
+
+    transformer_cls = get_registered_transformer(name)
+    if transformer_cls is None:
+        module_name = _TRANSFORMER_MODULES.get(name)
+        if module_name is not None:
+            import_module(f"..schema.{module_name}", __package__)
+            transformer_cls = get_registered_transformer(name)
+    return transformer_cls
+
+
 def get_schema_transformer(
     profile: ModelProfile,
     schema: dict[str, Any],
@@ -176,23 +285,9 @@ def get_schema_transformer(
     if not profile.schema_transformer_name:
         return None
 
-    # Import transformer classes dynamically
-    from ..schema import anthropic as anthropic_schema
-    from ..schema import bedrock as bedrock_schema
-    from ..schema import databricks as databricks_schema
-    from ..schema import google as google_schema
-    from ..schema import openai as openai_schema
-
-    transformer_map = {
-        "OpenAIJsonSchemaTransformer": openai_schema.OpenAIJsonSchemaTransformer,
-        "AnthropicJsonSchemaTransformer": anthropic_schema.AnthropicJsonSchemaTransformer,
-        "GoogleJsonSchemaTransformer": google_schema.GoogleJsonSchemaTransformer,
-        "BedrockJsonSchemaTransformer": bedrock_schema.BedrockJsonSchemaTransformer,
-        "DatabricksJsonSchemaTransformer": databricks_schema.DatabricksJsonSchemaTransformer,
-    }
-
-    transformer_cls = transformer_map.get(profile.schema_transformer_name)
+    transformer_cls = _transformer_class(profile.schema_transformer_name)
+    # Instances are not cached: transform() accumulates per-run state (warnings, recursive refs).
     if transformer_cls:
-        return transformer_cls(schema, strict=strict)  # type: ignore[abstract]
+        return transformer_cls(schema, strict=strict)
 
     return None
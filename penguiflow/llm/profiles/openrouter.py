@@ -23,7 +23,7 @@ Model variant suffixes:
 
 from __future__ import annotations
 
-from . import ModelProfile
+from . import THINK_TAGS, ModelProfile
 
 # Provider prefix to profile mapping for OpenRouter
 PROVIDER_PROFILE_MAPPING = {
@@ -240,7 +240,7 @@ PROFILES: dict[str, ModelProfile] = {
         supports_streaming=True,
         default_output_mode="tools",
         native_structured_kind="openai_compatible_tools",
-        thinking_tags=("<think>", "</think>"),
+        thinking_tags=THINK_TAGS,
         strict_mode_default=False,
         max_context_tokens=163000,
         max_output_tokens=8192,
@@ -253,7 +253,7 @@ PROFILES: dict[str, ModelProfile] = {
         supports_streaming=True,
         default_output_mode="tools",
         native_structured_kind="openai_compatible_tools",
-        thinking_tags=("<think>", "</think>"),
+        thinking_tags=THINK_TAGS,
         strict_mode_default=False,
         max_context_tokens=163000,
         max_output_tokens=8192,
@@ -278,7 +278,7 @@ PROFILES: dict[str, ModelProfile] = {
         supports_streaming=True,
         default_output_mode="tools",
         native_structured_kind="openai_compatible_tools",
-        thinking_tags=("<think>", "</think>"),
+        thinking_tags=THINK_TAGS,
         strict_mode_default=False,
         max_context_tokens=163000,
         max_output_tokens=8192,
@@ -291,7 +291,7 @@ PROFILES: dict[str, ModelProfile] = {
         supports_streaming=True,
         default_output_mode="tools",
         native_structured_kind="openai_compatible_tools",
-        thinking_tags=("<think>", "</think>"),
+        thinking_tags=THINK_TAGS,
         strict_mode_default=False,
         max_context_tokens=163000,
         max_output_tokens=8192,
@@ -7,8 +7,10 @@ from .plan import OutputMode, SchemaPlan, choose_output_mode, plan_schema
 from .transformer import (
     JsonSchemaTransformer,
     estimate_object_key_count,
+    get_registered_transformer,
     has_composition_keywords,
     has_refs,
+    register_transformer,
 )
 
 __all__ = [
@@ -17,7 +19,9 @@ __all__ = [
     "SchemaPlan",
     "choose_output_mode",
     "estimate_object_key_count",
+    "get_registered_transformer",
     "has_composition_keywords",
     "has_refs",
     "plan_schema",
+    "register_transformer",
 ]
@@ -5,12 +5,12 @@ Handles Bedrock's schema requirements for tool use via Converse API.
 
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Any
 
-from .transformer import JsonSchemaTransformer
+from .transformer import JsonSchemaTransformer, copy_schema, register_transformer
 
 
+@register_transformer
 class BedrockJsonSchemaTransformer(JsonSchemaTransformer):
     """AWS Bedrock schema transformer.
 
@@ -56,13 +56,13 @@ class BedrockJsonSchemaTransformer(JsonSchemaTransformer):
             if def_name in defs:
                 # Check if already transformed
                 if def_name in self._transformed_defs:
-                    return deepcopy(self._transformed_defs[def_name])
+                    return copy_schema(self._transformed_defs[def_name])
 
                 self._refs_stack.append(ref)
-                inlined = self._walk(deepcopy(defs[def_name]))
+                inlined = self._walk(copy_schema(defs[def_name]))
                 self._refs_stack.pop()
                 self._transformed_defs[def_name] = inlined
-                return deepcopy(inlined)
+                return copy_schema(inlined)
 
         # Unknown ref format - keep as-is
         self._warnings.append(f"Unknown ref format (kept as-is): {ref}")
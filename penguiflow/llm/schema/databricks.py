@@ -7,9 +7,10 @@ from __future__ import annotations
 
 from typing import Any
 
-from .transformer import JsonSchemaTransformer
+from .transformer import JsonSchemaTransformer, copy_schema, register_transformer
 
 
+@register_transformer
 class DatabricksJsonSchemaTransformer(JsonSchemaTransformer):
     """Databricks schema transformer.
 
@@ -120,16 +121,14 @@ class DatabricksJsonSchemaTransformer(JsonSchemaTransformer):
             defs = self.original_schema.get("$defs", {})
 
             if def_name in defs:
-                from copy import deepcopy
-
                 if def_name in self._transformed_defs:
-                    return deepcopy(self._transformed_defs[def_name])
+                    return copy_schema(self._transformed_defs[def_name])
 
                 self._refs_stack.append(ref)
-                inlined = self._walk(deepcopy(defs[def_name]))
+                inlined = self._walk(copy_schema(defs[def_name]))
                 self._refs_stack.pop()
                 self._transformed_defs[def_name] = inlined
-                return deepcopy(inlined)
+                return copy_schema(inlined)
 
         # Unknown ref - return placeholder
         self.is_strict_compatible = False
@@ -7,9 +7,10 @@ from __future__ import annotations
 
 from typing import Any
 
-from .transformer import JsonSchemaTransformer
+from .transformer import JsonSchemaTransformer, register_transformer
 
 
+@register_transformer
 class GoogleJsonSchemaTransformer(JsonSchemaTransformer):
     """Google/Gemini schema transformer.
 
@@ -8,7 +8,37 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from copy import deepcopy
-from typing import Any
+from typing import Any, TypeVar
+
+_T = TypeVar("_T", bound="type[JsonSchemaTransformer]")
+
+# Transformer classes by class name; profiles refer to them via ``schema_transformer_name``.
+_TRANSFORMER_REGISTRY: dict[str, type[JsonSchemaTransformer]] = {}
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def copy_schema(value: Any) -> Any:
+    """Copy a JSON schema tree; faster than ``deepcopy`` for plain dicts/lists/scalars."""
+    if isinstance(value, dict):
+        return {key: copy_schema(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_schema(item) for item in value]
+    if isinstance(value, _JSON_SCALARS):
+        return value
+    return deepcopy(value)
+
+
+def register_transformer(cls: _T) -> _T:
+    """Class decorator registering a transformer under its class name."""
+    _TRANSFORMER_REGISTRY[cls.__name__] = cls
+    return cls
+
+
+def get_registered_transformer(name: str) -> type[JsonSchemaTransformer] | None:
+    """Return the transformer class registered under ``name``, if any."""
+    return _TRANSFORMER_REGISTRY.get(name)
 
 
 class JsonSchemaTransformer(ABC):
@@ -37,7 +67,7 @@ class JsonSchemaTransformer(ABC):
             schema: The JSON schema to transform.
             strict: Whether to use strict mode (provider-specific meaning).
         """
-        self.original_schema = deepcopy(schema)
+        self.original_schema = copy_schema(schema)
         self.strict = strict
         self.is_strict_compatible = True
         self._prefer_inline_refs = False
@@ -144,13 +174,13 @@ class JsonSchemaTransformer(ABC):
             if def_name in defs:
                 # Check if already transformed
                 if def_name in self._transformed_defs:
-                    return deepcopy(self._transformed_defs[def_name])
+                    return copy_schema(self._transformed_defs[def_name])
 
                 self._refs_stack.append(ref)
-                inlined = self._walk(deepcopy(defs[def_name]))
+                inlined = self._walk(copy_schema(defs[def_name]))
                 self._refs_stack.pop()
                 self._transformed_defs[def_name] = inlined
-                return deepcopy(inlined)
+                return copy_schema(inlined)
 
         # Keep as $ref when allowed by provider
         return node
@@ -22,7 +22,7 @@ from .models import (
     RuleCost,
     StopSpec,
 )
-from .protocols import DecisionPolicy, GuardrailRule, RiskRouter
+from .protocols import DecisionPolicy, GuardrailRule, RiskRouter, SyncGuardrailRule
 from .registry import RuleRegistry
 from .routing import DefaultRiskRouter, RiskRoutingDecision
 from .rules import (
@@ -58,6 +58,7 @@ __all__ = [
     "RuleRegistry",
     "SecretRedactionRule",
     "StopSpec",
+    "SyncGuardrailRule",
     "ToolRiskInfo",
     "ToolRiskTier",
     "ToolAllowlistRule",
@@ -3,19 +3,35 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from .context import ContextSnapshotV1, GuardrailEvent
-from .models import GuardrailDecision
-from .protocols import GuardrailRule
+from .models import GuardrailAction, GuardrailDecision, GuardrailSeverity
+from .protocols import GuardrailRule, _sync_evaluator
 from .registry import RuleRegistry
 
 if TYPE_CHECKING:
     from penguiflow.steering.guard_inbox import SteeringGuardEvent
 
+_SEVERITY_RANK = {
+    GuardrailSeverity.LOW: 0,
+    GuardrailSeverity.MEDIUM: 1,
+    GuardrailSeverity.HIGH: 2,
+    GuardrailSeverity.CRITICAL: 3,
+}
+
 
 class AsyncRuleEvaluator:
-    """Evaluates deep (async) rules for a submitted event."""
+    """Evaluates deep (async) rules for a submitted event.
+
+    Matching rules run concurrently and decisions are returned in registry
+    rule order, whatever order they complete in. Once a STOP lands whose
+    severity is at least that of every rule still in flight, those rules are
+    cancelled, since none of them is more important than the STOP. The
+    cancelled rules produce no decision, so their effects (for example
+    ``increment_strike``) are never applied.
+    """
 
     def __init__(self, registry: RuleRegistry) -> None:
         self._registry = registry
@@ -43,15 +59,48 @@ class AsyncRuleEvaluator:
 
         async def safe_eval(rule: GuardrailRule) -> GuardrailDecision | None:
             try:
-                decision = await rule.evaluate(guardrail_event, context_snapshot)
+                evaluate_sync = _sync_evaluator(rule)
+                if evaluate_sync is not None:
+                    decision = evaluate_sync(guardrail_event, context_snapshot)
+                else:
+                    decision = await rule.evaluate(guardrail_event, context_snapshot)
                 if decision:
                     decision.was_sync = False
                 return decision
             except Exception:
                 return None
 
-        results = await asyncio.gather(*[safe_eval(rule) for rule in rules])
-        return [decision for decision in results if decision is not None]
+        if len(rules) == 1:
+            decision = await safe_eval(rules[0])
+            return [decision] if decision is not None else []
+
+        # A STOP outranks every other action, so once one lands that is at least as
+        # severe as every rule still in flight, the remaining (typically slow,
+        # classifier-backed) rules cannot change the outcome.
+        results: dict[int, GuardrailDecision] = {}
+        pending = {asyncio.create_task(safe_eval(rule)): index for index, rule in enumerate(rules)}
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = pending.pop(task)
+                    decision = task.result()
+                    if decision is not None:
+                        results[index] = decision
+                if pending and self._stop_is_final(results.values(), (rules[index] for index in pending.values())):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return [results[index] for index in sorted(results)]
 
+    @staticmethod
+    def _stop_is_final(decisions: Iterable[GuardrailDecision], pending_rules: Iterable[GuardrailRule]) -> bool:
+        stop_ranks = [_SEVERITY_RANK[d.severity] for d in decisions if d.action == GuardrailAction.STOP]
+        if not stop_ranks:
+            return False
+        return max(stop_ranks) >= max(_SEVERITY_RANK[rule.severity] for rule in pending_rules)
 
 __all__ = ["AsyncRuleEvaluator"]
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import re
 from collections.abc import Mapping
+from copy import deepcopy
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal, cast
 
 import yaml  # type: ignore[import-untyped,unused-ignore]
+from pydantic_core import from_json
 
 from .context import ContextSnapshotBuilder, ToolRiskTier
 from .gateway import GatewayConfig, GuardrailGateway
@@ -17,6 +20,11 @@ from .registry import RuleRegistry
 from .routing import DefaultRiskRouter
 from .rules import InjectionPatternRule, JailbreakIntent, SecretRedactionRule, ToolAllowlistRule
 
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml-backed, same semantics as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment,unused-ignore]
+
 
 @dataclass(frozen=True)
 class GuardrailPolicyPack:
@@ -28,11 +36,32 @@ class GuardrailPolicyPack:
 
 
 def load_policy_pack(path: str | Path, *, env: str | None = None) -> GuardrailPolicyPack:
-    """Load and validate a guardrail policy pack from YAML."""
+    """Load and validate a guardrail policy pack from YAML or JSON.
+
+    Files ending in ``.json`` are parsed as JSON, which is much faster than
+    YAML; deployments can ship packs pre-converted at build time. Parsed packs
+    are cached per file path, modification time, size and environment, so
+    reloading an unchanged file skips parsing and validation. Each call
+    returns its own copy of the pack data.
+    """
+
+    source = Path(path).resolve()
+    stat = source.stat()
+    payload = _load_policy_payload(str(source), stat.st_mtime_ns, stat.st_size, env)
+
+    policy_id = str(payload.get("policy_pack"))
+    version = str(payload.get("version"))
+    return GuardrailPolicyPack(policy_id=policy_id, version=version, data=deepcopy(payload))
 
-    source = Path(path)
-    raw = source.read_text(encoding="utf-8")
-    data = yaml.safe_load(raw)
+
+@lru_cache(maxsize=32)
+def _load_policy_payload(path: str, mtime_ns: int, size: int, env: str | None) -> dict[str, Any]:
+    del mtime_ns, size  # cache key only
+    raw = Path(path).read_text(encoding="utf-8")
+    if path.endswith(".json"):
+        data = from_json(raw)
+    else:
+        data = yaml.load(raw, Loader=_SafeLoader)
     if not isinstance(data, Mapping):
         raise ValueError("Policy pack must be a mapping")
 
@@ -43,10 +72,7 @@ def load_policy_pack(path: str | Path, *, env: str | None = None) -> GuardrailPo
             payload = _deep_merge(payload, envs[env])
 
     _validate_policy_pack(payload)
-
-    policy_id = str(payload.get("policy_pack"))
-    version = str(payload.get("version"))
-    return GuardrailPolicyPack(policy_id=policy_id, version=version, data=dict(payload))
+    return payload
 
 
 def apply_policy_config(
@@ -134,6 +160,9 @@ def _apply_rule_configs(registry: RuleRegistry, rules: list[Any], *, is_async: b
         if isinstance(config, Mapping):
             _apply_rule_config(rule, config)
 
+    # Generic config keys may have changed a rule's supports_event_types.
+    registry.reindex()
+
 
 def _apply_rule_config(rule: Any, config: Mapping[str, Any]) -> None:
     if isinstance(rule, ToolAllowlistRule):
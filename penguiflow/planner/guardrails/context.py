@@ -60,9 +60,12 @@ class ToolRiskInfo:
     risk_tier: ToolRiskTier
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ContextSnapshotV1:
-    """Standardized context for guardrail evaluation."""
+    """Standardized context for guardrail evaluation.
+
+    Immutable, so a single snapshot can be shared by every rule evaluating an event.
+    """
 
     schema_version: Literal["1"] = "1"
     user_text: str = ""
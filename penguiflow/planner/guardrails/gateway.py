@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Literal
 
@@ -10,7 +11,7 @@ if TYPE_CHECKING:
     from penguiflow.steering.guard_inbox import SteeringGuardInbox
 from .context import ContextSnapshotBuilder, ContextSnapshotV1, GuardrailContext, GuardrailEvent
 from .models import GuardrailAction, GuardrailDecision, GuardrailSeverity, PauseSpec, RedactionSpec, StopSpec
-from .protocols import DecisionPolicy, GuardrailRule, RiskRouter
+from .protocols import DecisionPolicy, GuardrailRule, RiskRouter, _sync_evaluator
 from .registry import RuleRegistry
 from .routing import DefaultRiskRouter, RiskRoutingDecision
 
@@ -99,8 +100,29 @@ class GuardrailGateway:
     risk_router: RiskRouter = field(default_factory=DefaultRiskRouter)
     context_builder: ContextSnapshotBuilder = field(default_factory=ContextSnapshotBuilder)
 
-    async def evaluate(self, ctx: GuardrailContext, event: GuardrailEvent) -> GuardrailDecision:
-        context_snapshot = self.context_builder.build(event, ctx)
+    async def evaluate(
+        self,
+        ctx: GuardrailContext,
+        event: GuardrailEvent,
+        *,
+        context_snapshot: ContextSnapshotV1 | None = None,
+    ) -> GuardrailDecision:
+        """Evaluate ``event`` against the registered rules.
+
+        ``context_snapshot`` lets callers that defer evaluation freeze the
+        context at the time the event happened instead of when it runs.
+        """
+        sync_rules = self.registry.get_sync_rules(event.event_type)
+        if not sync_rules and not self.config.async_enabled:
+            # Nothing can fire for this event, so skip building the snapshot.
+            return GuardrailDecision(
+                action=GuardrailAction.ALLOW,
+                rule_id="__default__",
+                reason="No rules triggered",
+            )
+
+        if context_snapshot is None:
+            context_snapshot = self.context_builder.build(event, ctx)
         routing = self.risk_router.route(event, context_snapshot)
 
         if routing.skip_evaluation:
@@ -110,7 +132,7 @@ class GuardrailGateway:
                 reason="Skipped by risk router",
             )
 
-        sync_decisions = await self._evaluate_sync(event, context_snapshot)
+        sync_decisions = await self._evaluate_sync(sync_rules, event, context_snapshot)
         sync_stops = [d for d in sync_decisions if d.action == GuardrailAction.STOP]
         if sync_stops:
             final = self.decision_policy.resolve(sync_stops, event, context_snapshot)
@@ -143,10 +165,10 @@ class GuardrailGateway:
 
     async def _evaluate_sync(
         self,
+        rules: list[GuardrailRule],
         event: GuardrailEvent,
         context_snapshot: ContextSnapshotV1,
     ) -> list[GuardrailDecision]:
-        rules = self.registry.get_sync_rules(event.event_type)
         if not rules:
             return []
 
@@ -157,39 +179,55 @@ class GuardrailGateway:
                     timeout=self.config.sync_timeout_ms / 1000,
                 )
             except TimeoutError as exc:
-                if self.config.sync_fail_open:
-                    return None
-                return GuardrailDecision(
-                    action=GuardrailAction.STOP,
-                    rule_id=rule.rule_id,
-                    reason=f"Sync guardrail '{rule.rule_id}' timed out (fail-closed)",
-                    severity=GuardrailSeverity.CRITICAL,
-                    stop=StopSpec(
-                        error_code="GUARDRAIL_SYNC_TIMEOUT",
-                        internal_reason=f"{type(exc).__name__}: {exc}",
-                    ),
-                )
+                return self._sync_failure(rule, exc, timed_out=True)
             except Exception as exc:
-                if self.config.sync_fail_open:
-                    return None
-                return GuardrailDecision(
-                    action=GuardrailAction.STOP,
-                    rule_id=rule.rule_id,
-                    reason=f"Sync guardrail '{rule.rule_id}' errored (fail-closed)",
-                    severity=GuardrailSeverity.CRITICAL,
-                    stop=StopSpec(
-                        error_code="GUARDRAIL_SYNC_ERROR",
-                        internal_reason=f"{type(exc).__name__}: {exc}",
-                    ),
-                )
+                return self._sync_failure(rule, exc, timed_out=False)
+
+        # CPU-only rules run inline: no coroutine, no wait_for task per rule.
+        results: list[GuardrailDecision | None] = []
+        awaitable_rules: list[GuardrailRule] = []
+        timeout_s = self.config.sync_timeout_ms / 1000
+        for rule in rules:
+            evaluate_sync = _sync_evaluator(rule)
+            if evaluate_sync is None:
+                awaitable_rules.append(rule)
+                continue
+            started = time.perf_counter()
+            try:
+                decision = evaluate_sync(event, context_snapshot)
+            except Exception as exc:
+                results.append(self._sync_failure(rule, exc, timed_out=False))
+                continue
+            elapsed = time.perf_counter() - started
+            if elapsed > timeout_s:
+                # Inline calls cannot be interrupted, so an overrun is handled after the fact.
+                overrun = TimeoutError(f"evaluate_sync took {elapsed * 1000:.1f}ms")
+                results.append(self._sync_failure(rule, overrun, timed_out=True))
+            else:
+                results.append(decision)
 
         if self.config.sync_parallel:
-            results = await asyncio.gather(*[safe_eval(rule) for rule in rules])
+            results.extend(await asyncio.gather(*[safe_eval(rule) for rule in awaitable_rules]))
         else:
-            results = [await safe_eval(rule) for rule in rules]
+            results.extend([await safe_eval(rule) for rule in awaitable_rules])
 
         return [decision for decision in results if decision is not None]
 
+    def _sync_failure(self, rule: GuardrailRule, exc: BaseException, *, timed_out: bool) -> GuardrailDecision | None:
+        if self.config.sync_fail_open:
+            return None
+        outcome = "timed out" if timed_out else "errored"
+        return GuardrailDecision(
+            action=GuardrailAction.STOP,
+            rule_id=rule.rule_id,
+            reason=f"Sync guardrail '{rule.rule_id}' {outcome} (fail-closed)",
+            severity=GuardrailSeverity.CRITICAL,
+            stop=StopSpec(
+                error_code="GUARDRAIL_SYNC_TIMEOUT" if timed_out else "GUARDRAIL_SYNC_ERROR",
+                internal_reason=f"{type(exc).__name__}: {exc}",
+            ),
+        )
+
     async def _submit_async(
         self,
         event: GuardrailEvent,
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Protocol, cast
 
 from .context import ContextSnapshotV1, GuardrailEvent
 from .models import GuardrailDecision, GuardrailSeverity, RuleCost
@@ -26,6 +28,44 @@ class GuardrailRule(Protocol):
     ) -> GuardrailDecision | None: ...
 
 
+class SyncGuardrailRule(GuardrailRule, Protocol):
+    """Guardrail rule that can also be evaluated without a coroutine.
+
+    CPU-only rules (regex scans, set lookups) may implement ``evaluate_sync``;
+    evaluators call it directly instead of awaiting ``evaluate``. It is only
+    used when defined on the same class as ``evaluate`` or a subclass of it, so
+    a subclass that overrides just ``evaluate`` keeps its own logic. Such calls
+    cannot be interrupted; the gateway instead treats one that overruns
+    ``GatewayConfig.sync_timeout_ms`` as timed out.
+    """
+
+    def evaluate_sync(
+        self,
+        event: GuardrailEvent,
+        context_snapshot: ContextSnapshotV1,
+    ) -> GuardrailDecision | None: ...
+
+
+@lru_cache(maxsize=128)
+def _uses_evaluate_sync(rule_type: type) -> bool:
+    mro = rule_type.__mro__
+    sync_owner = next((index for index, klass in enumerate(mro) if "evaluate_sync" in vars(klass)), None)
+    async_owner = next((index for index, klass in enumerate(mro) if "evaluate" in vars(klass)), None)
+    if sync_owner is None:
+        return False
+    # Lower MRO index means more derived: evaluate_sync must not be older than evaluate.
+    return async_owner is None or sync_owner <= async_owner
+
+
+def _sync_evaluator(
+    rule: GuardrailRule,
+) -> Callable[[GuardrailEvent, ContextSnapshotV1], GuardrailDecision | None] | None:
+    """Return the rule's ``evaluate_sync`` if it can stand in for ``evaluate``."""
+    if not _uses_evaluate_sync(type(rule)):
+        return None
+    return cast(SyncGuardrailRule, rule).evaluate_sync
+
+
 class DecisionPolicy(Protocol):
     """Protocol for custom decision resolution."""
 
@@ -50,4 +90,5 @@ __all__ = [
     "DecisionPolicy",
     "GuardrailRule",
     "RiskRouter",
+    "SyncGuardrailRule",
 ]
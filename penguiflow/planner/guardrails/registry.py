@@ -2,43 +2,101 @@
 
 from __future__ import annotations
 
+import sys
+
 from .models import RuleCost
 from .protocols import GuardrailRule
 
 
 class RuleRegistry:
-    """Registry for guardrail rules."""
+    """Registry for guardrail rules.
+
+    Rules are indexed by ``supports_event_types`` when registered, so lookups
+    per event are a dict access rather than a scan over every rule. ``enabled``
+    is still checked on each lookup because policy packs toggle it in place.
+    Call ``reindex`` after changing a registered rule's ``supports_event_types``.
+    """
 
     def __init__(self) -> None:
         self._sync_rules: list[GuardrailRule] = []
         self._async_rules: list[GuardrailRule] = []
+        self._sync_by_event: dict[str, list[GuardrailRule]] = {}
+        self._async_by_event: dict[str, list[GuardrailRule]] = {}
+        self._all_rules: tuple[GuardrailRule, ...] | None = None
 
     def register(self, rule: GuardrailRule) -> None:
         """Register a rule based on its cost."""
 
         if rule.cost == RuleCost.FAST:
-            self._sync_rules.append(rule)
+            self._add(rule, self._sync_rules, self._sync_by_event)
         else:
-            self._async_rules.append(rule)
+            self._add(rule, self._async_rules, self._async_by_event)
 
     def register_sync(self, rule: GuardrailRule) -> None:
         """Force-register a rule as synchronous."""
-        self._sync_rules.append(rule)
+        self._add(rule, self._sync_rules, self._sync_by_event)
 
     def get_sync_rules(self, event_type: str) -> list[GuardrailRule]:
         """Get sync rules applicable to an event type."""
 
-        return [rule for rule in self._sync_rules if rule.enabled and event_type in rule.supports_event_types]
+        return [rule for rule in self._sync_by_event.get(event_type, ()) if rule.enabled]
 
     def get_async_rules(self, event_type: str) -> list[GuardrailRule]:
         """Get async rules applicable to an event type."""
 
-        return [rule for rule in self._async_rules if rule.enabled and event_type in rule.supports_event_types]
-
-    def all_rules(self) -> list[GuardrailRule]:
-        """Return all registered rules (sync + async)."""
-
-        return [*self._sync_rules, *self._async_rules]
+        return [rule for rule in self._async_by_event.get(event_type, ()) if rule.enabled]
+
+    def all_rules(self) -> tuple[GuardrailRule, ...]:
+        """Return all registered rules (sync + async).
+
+        The tuple is cached until the next registration. It used to be a fresh
+        list; copy it with ``list(...)`` if you need to modify it.
+        """
+
+        if self._all_rules is None:
+            self._all_rules = (*self._sync_rules, *self._async_rules)
+        return self._all_rules
+
+    def snapshot(self) -> tuple[tuple[GuardrailRule, ...], tuple[GuardrailRule, ...]]:
+        """Return the registered (sync, async) rules for a later ``restore``."""
+
+        return tuple(self._sync_rules), tuple(self._async_rules)
+
+    def restore(self, snapshot: tuple[tuple[GuardrailRule, ...], tuple[GuardrailRule, ...]]) -> None:
+        """Replace the registered rules with a ``snapshot`` taken earlier."""
+
+        sync_rules, async_rules = snapshot
+        self._sync_rules = list(sync_rules)
+        self._async_rules = list(async_rules)
+        self._all_rules = None
+        self.reindex()
+
+    def reindex(self) -> None:
+        """Rebuild the event-type index from the rules' current ``supports_event_types``."""
+
+        self._sync_by_event = self._index(self._sync_rules)
+        self._async_by_event = self._index(self._async_rules)
+
+    @staticmethod
+    def _index(rules: list[GuardrailRule]) -> dict[str, list[GuardrailRule]]:
+        by_event: dict[str, list[GuardrailRule]] = {}
+        for rule in rules:
+            for event_type in rule.supports_event_types:
+                by_event.setdefault(sys.intern(event_type), []).append(rule)
+        return by_event
+
+    def _add(
+        self,
+        rule: GuardrailRule,
+        rules: list[GuardrailRule],
+        by_event: dict[str, list[GuardrailRule]],
+    ) -> None:
+        self._all_rules = None
+        rules.append(rule)
+        for event_type in rule.supports_event_types:
+            # Interned keys match the planner's literal event types by identity on lookup,
+            # even when the rule's types were loaded from a policy file.
+            by_event.setdefault(sys.intern(event_type), []).append(rule)
 
 
 __all__ = ["RuleRegistry"]
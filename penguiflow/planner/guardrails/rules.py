@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 from .context import ContextSnapshotV1, GuardrailEvent
 from .models import (
@@ -28,6 +30,45 @@ class JailbreakIntent(str, Enum):
     BENIGN = "benign"
 
 
+_DEFAULT_SECRET_PATTERNS: dict[str, re.Pattern[str]] = {
+    "OPENAI_KEY": re.compile(r"sk-[a-zA-Z0-9]{20,}"),
+    "ANTHROPIC_KEY": re.compile(r"sk-ant-[a-zA-Z0-9\-]{20,}"),
+    "AWS_KEY": re.compile(r"AKIA[0-9A-Z]{16}"),
+    "GITHUB_TOKEN": re.compile(r"ghp_[a-zA-Z0-9]{36}"),
+}
+
+# Literal prefixes of the default signatures. A substring check is far cheaper than a regex scan
+# and lets most stream chunks skip every pattern; a combined alternation would lose re's own
+# literal-prefix search and scan slower than the individual patterns.
+_DEFAULT_SECRET_PREFIXES: dict[str, str] = {
+    "OPENAI_KEY": "sk-",
+    "ANTHROPIC_KEY": "sk-ant-",
+    "AWS_KEY": "AKIA",
+    "GITHUB_TOKEN": "ghp_",
+}
+
+# Searched one at a time, in order: the first pattern to match decides the reported intent, and a
+# single IGNORECASE alternation of these scans slower with re than the individual searches.
+_DEFAULT_INJECTION_PATTERNS: tuple[tuple[str, JailbreakIntent], ...] = (
+    (r"ignore\s+(all\s+)?previous\s+instructions", JailbreakIntent.JB_OVERRIDE),
+    (r"disregard\s+(your\s+)?(instructions|rules)", JailbreakIntent.JB_OVERRIDE),
+    (r"you\s+are\s+now\s+(in\s+)?(\w+\s+)?mode", JailbreakIntent.JB_OVERRIDE),
+    (r"\bDAN\b.*mode", JailbreakIntent.JB_OVERRIDE),
+    (r"jailbreak", JailbreakIntent.JB_OVERRIDE),
+    (r"(show|reveal|print)\s+(your|the)\s+system\s*prompt", JailbreakIntent.EXFIL_PROMPT),
+    (r"what\s+(is|are)\s+your\s+(system\s+)?instructions", JailbreakIntent.EXFIL_PROMPT),
+    (r"(run|execute)\s+(as\s+)?(root|admin|sudo)", JailbreakIntent.TOOL_ESCALATION),
+    (r"bypass\s+(tool\s+)?restrictions", JailbreakIntent.TOOL_ESCALATION),
+)
+
+
+@lru_cache(maxsize=32)
+def _compile_injection_patterns(
+    patterns: tuple[tuple[str, JailbreakIntent], ...],
+) -> tuple[tuple[re.Pattern[str], JailbreakIntent], ...]:
+    return tuple((re.compile(pattern, re.IGNORECASE), intent) for pattern, intent in patterns)
+
+
 @dataclass
 class ToolAllowlistRule:
     """Block unauthorized tool execution."""
@@ -41,10 +82,23 @@ class ToolAllowlistRule:
     denied_tools: frozenset[str] = frozenset()
     allowed_tools: frozenset[str] | None = None
 
+    def __post_init__(self) -> None:
+        # Accept any iterable of names but keep membership checks O(1).
+        self.denied_tools = frozenset(self.denied_tools)
+        if self.allowed_tools is not None:
+            self.allowed_tools = frozenset(self.allowed_tools)
+
     async def evaluate(
         self,
         event: GuardrailEvent,
         context_snapshot: ContextSnapshotV1,
+    ) -> GuardrailDecision | None:
+        return self.evaluate_sync(event, context_snapshot)
+
+    def evaluate_sync(
+        self,
+        event: GuardrailEvent,
+        context_snapshot: ContextSnapshotV1,
     ) -> GuardrailDecision | None:
         tool_name = event.tool_name
         if not tool_name:
@@ -90,34 +144,43 @@ class SecretRedactionRule:
 
     def __post_init__(self) -> None:
         if not self.patterns:
-            self.patterns = {
-                "OPENAI_KEY": re.compile(r"sk-[a-zA-Z0-9]{20,}"),
-                "ANTHROPIC_KEY": re.compile(r"sk-ant-[a-zA-Z0-9\-]{20,}"),
-                "AWS_KEY": re.compile(r"AKIA[0-9A-Z]{16}"),
-                "GITHUB_TOKEN": re.compile(r"ghp_[a-zA-Z0-9]{36}"),
-            }
+            self.patterns = dict(_DEFAULT_SECRET_PATTERNS)
+
+    def _iter_matches(self, text: str) -> Iterator[tuple[str, re.Match[str]]]:
+        for secret_type, pattern in self.patterns.items():
+            is_default = pattern is _DEFAULT_SECRET_PATTERNS.get(secret_type)
+            if is_default and _DEFAULT_SECRET_PREFIXES[secret_type] not in text:
+                continue
+            for match in pattern.finditer(text):
+                yield secret_type, match
 
     async def evaluate(
         self,
         event: GuardrailEvent,
         context_snapshot: ContextSnapshotV1,
+    ) -> GuardrailDecision | None:
+        return self.evaluate_sync(event, context_snapshot)
+
+    def evaluate_sync(
+        self,
+        event: GuardrailEvent,
+        context_snapshot: ContextSnapshotV1,
     ) -> GuardrailDecision | None:
         text = event.text_content
         if not text:
             return None
 
         redactions: list[RedactionSpec] = []
-        for secret_type, pattern in self.patterns.items():
-            for match in pattern.finditer(text):
-                redactions.append(
-                    RedactionSpec(
-                        path="text",
-                        replacement=f"[{secret_type}]",
-                        entity_type=secret_type,
-                        start_offset=match.start(),
-                        end_offset=match.end(),
-                    )
+        for secret_type, match in self._iter_matches(text):
+            redactions.append(
+                RedactionSpec(
+                    path="text",
+                    replacement=f"[{secret_type}]",
+                    entity_type=secret_type,
+                    start_offset=match.start(),
+                    end_offset=match.end(),
                 )
+            )
 
         if redactions:
             return GuardrailDecision(
@@ -145,29 +208,29 @@ class InjectionPatternRule:
 
     def __post_init__(self) -> None:
         if not self.patterns:
-            self.patterns = (
-                (r"ignore\s+(all\s+)?previous\s+instructions", JailbreakIntent.JB_OVERRIDE),
-                (r"disregard\s+(your\s+)?(instructions|rules)", JailbreakIntent.JB_OVERRIDE),
-                (r"you\s+are\s+now\s+(in\s+)?(\w+\s+)?mode", JailbreakIntent.JB_OVERRIDE),
-                (r"\bDAN\b.*mode", JailbreakIntent.JB_OVERRIDE),
-                (r"jailbreak", JailbreakIntent.JB_OVERRIDE),
-                (r"(show|reveal|print)\s+(your|the)\s+system\s*prompt", JailbreakIntent.EXFIL_PROMPT),
-                (r"what\s+(is|are)\s+your\s+(system\s+)?instructions", JailbreakIntent.EXFIL_PROMPT),
-                (r"(run|execute)\s+(as\s+)?(root|admin|sudo)", JailbreakIntent.TOOL_ESCALATION),
-                (r"bypass\s+(tool\s+)?restrictions", JailbreakIntent.TOOL_ESCALATION),
-            )
+            self.patterns = _DEFAULT_INJECTION_PATTERNS
+        else:
+            # Accept lists too; the compiled-pattern cache needs a hashable key.
+            self.patterns = tuple((pattern, intent) for pattern, intent in self.patterns)
 
     async def evaluate(
         self,
         event: GuardrailEvent,
         context_snapshot: ContextSnapshotV1,
+    ) -> GuardrailDecision | None:
+        return self.evaluate_sync(event, context_snapshot)
+
+    def evaluate_sync(
+        self,
+        event: GuardrailEvent,
+        context_snapshot: ContextSnapshotV1,
     ) -> GuardrailDecision | None:
         text = event.text_content
         if not text:
             return None
 
-        for pattern, intent in self.patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern, intent in _compile_injection_patterns(self.patterns):
+            match = pattern.search(text)
             if match:
                 return GuardrailDecision(
                     action=GuardrailAction.STOP,
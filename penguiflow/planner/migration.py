@@ -18,6 +18,7 @@ from collections.abc import Mapping, Sequence
 from typing import Any
 
 from pydantic import ValidationError
+from pydantic_core import from_json
 
 from .models import PlannerAction
 
@@ -362,10 +363,10 @@ def _coerce_mapping(raw: str | Mapping[str, Any]) -> Mapping[str, Any] | None:
     if not text:
         return None
 
-    # Fast path: direct JSON object.
+    # Fast path: direct JSON object. pydantic_core's parser is several times faster than json.loads.
     if text.startswith("{"):
         try:
-            parsed = json.loads(text)
+            parsed = from_json(text)
             return parsed if isinstance(parsed, Mapping) else None
         except Exception:
             pass
@@ -418,7 +419,7 @@ def normalize_action_with_debug(raw: str | Mapping[str, Any]) -> tuple[PlannerAc
     # Fast path: direct JSON object.
     if text.startswith("{"):
         try:
-            parsed = json.loads(text)
+            parsed = from_json(text)
             if isinstance(parsed, Mapping):
                 payload = _normalize_to_unified_payload(parsed)
                 return PlannerAction.model_validate(payload), None
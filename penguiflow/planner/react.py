@@ -6,6 +6,7 @@ import asyncio
 import json
 import logging
 from collections.abc import Awaitable, Callable, Mapping, Sequence
+from functools import partial
 from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel, ValidationError
@@ -407,6 +408,7 @@ class ReactPlanner:
     _init_kwargs: dict[str, Any] | None
     _guardrail_stream_handler: _GuardrailStreamHandler | None
     _guardrail_stream_decision: GuardrailDecision | None
+    _guardrail_shadow_tasks: set[asyncio.Task[GuardrailDecision]]
     _session_dispatch_enabled: bool
     _session_registry_lock: asyncio.Lock
     _session_locks: dict[str, asyncio.Lock]
@@ -585,6 +587,7 @@ class ReactPlanner:
         )
         self._guardrail_stream_handler = None
         self._guardrail_stream_decision = None
+        self._guardrail_shadow_tasks = set()
         self._llm_context_hooks = list(llm_context_hooks or [])
 
     def fork(
@@ -765,6 +768,7 @@ class ReactPlanner:
                 )
             finally:
                 self._steering = previous
+                await self.flush_guardrail_shadow_tasks()
 
     async def resume(
         self,
@@ -840,6 +844,7 @@ class ReactPlanner:
                 )
             finally:
                 self._steering = previous
+                await self.flush_guardrail_shadow_tasks()
 
     def _resolve_memory_key(
         self,
@@ -1314,8 +1319,57 @@ class ReactPlanner:
         ctx = self._guardrail_context
         if gateway is None or ctx is None:
             return None
+        if not self._guardrails_enforced():
+            # Shadow decisions are only observed, so evaluate off the hot path.
+            # The snapshot is taken now so later context mutations don't leak in.
+            snapshot = gateway.context_builder.build(event, ctx)
+            task = asyncio.create_task(gateway.evaluate(ctx, event, context_snapshot=snapshot))
+            self._guardrail_shadow_tasks.add(task)
+            task.add_done_callback(partial(self._log_shadow_guardrail_decision, event.event_type))
+            return None
         return await gateway.evaluate(ctx, event)
 
+    def _log_shadow_guardrail_decision(self, event_type: str, task: asyncio.Task[GuardrailDecision]) -> None:
+        self._guardrail_shadow_tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning(
+                "guardrail_shadow_evaluation_failed",
+                extra={"event_type": event_type, "error": f"{type(exc).__name__}: {exc}"},
+            )
+            return
+        decision = task.result()
+        if event_type == "llm_before":
+            logger.info(
+                "guardrail_decision",
+                extra={
+                    "action": decision.action.value,
+                    "rule_id": decision.rule_id,
+                    "reason": decision.reason,
+                    "enforced": False,
+                },
+            )
+        logger.info(
+            "guardrail_decision_shadow",
+            extra={
+                "event_type": event_type,
+                "action": decision.action.value,
+                "rule_id": decision.rule_id,
+                "reason": decision.reason,
+            },
+        )
+
+    async def flush_guardrail_shadow_tasks(self) -> None:
+        """Wait for pending shadow-mode guardrail evaluations to finish.
+
+        ``run`` and ``resume`` call this before returning, so shadow decisions
+        are logged within the call that produced them.
+        """
+        while self._guardrail_shadow_tasks:
+            await asyncio.gather(*tuple(self._guardrail_shadow_tasks), return_exceptions=True)
+
     def _guardrail_decision_payload(self, decision: GuardrailDecision) -> dict[str, Any]:
         stop = decision.stop
         return {
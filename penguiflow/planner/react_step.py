@@ -216,15 +216,6 @@ async def step(planner: Any, trajectory: Trajectory) -> PlannerAction:
                         "enforced": planner._guardrails_enforced(),
                     },
                 )
-            if decision and not planner._guardrails_enforced():
-                logger.info(
-                    "guardrail_decision_shadow",
-                    extra={
-                        "action": decision.action.value,
-                        "rule_id": decision.rule_id,
-                        "reason": decision.reason,
-                    },
-                )
             if decision and planner._guardrails_enforced():
                 if decision.action.value == "STOP":
                     stop_message = decision.stop.user_message if decision.stop else None
@@ -8,12 +8,15 @@ from dataclasses import dataclass
 
 from .models import StateUpdate, UpdateType
 
+_CRITICAL_TYPES = frozenset({UpdateType.RESULT, UpdateType.ERROR, UpdateType.NOTIFICATION, UpdateType.STATUS_CHANGE})
+
 
 @dataclass(slots=True)
 class _Subscription:
     queue: asyncio.Queue[StateUpdate]
     task_ids: set[str] | None
     update_types: set[UpdateType] | None
+    cancelled: bool = False
 
 
 class UpdateBroker:
@@ -22,6 +25,7 @@ class UpdateBroker:
     def __init__(self, *, max_queue_size: int = 0) -> None:
         self._lock = asyncio.Lock()
         self._subs: list[_Subscription] = []
+        self._cancelled_count = 0
         self._max_queue_size = max_queue_size
 
     async def subscribe(
@@ -40,22 +44,39 @@ class UpdateBroker:
             self._subs.append(sub)
 
         async def _unsubscribe() -> None:
+            # Flag the subscription instead of searching the list; publish() skips
+            # cancelled entries and the list is rebuilt once they dominate it.
+            if sub.cancelled:
+                return
+            sub.cancelled = True
             async with self._lock:
-                if sub in self._subs:
-                    self._subs.remove(sub)
+                self._cancelled_count += 1
+                if self._cancelled_count * 2 >= len(self._subs):
+                    self._compact()
 
         return queue, _unsubscribe
 
+    async def compact(self) -> None:
+        """Drop cancelled subscriptions from the registry."""
+        async with self._lock:
+            self._compact()
+
+    def _compact(self) -> None:
+        # Rebind rather than mutate so an in-flight publish() keeps iterating a stable list.
+        self._subs = [sub for sub in self._subs if not sub.cancelled]
+        self._cancelled_count = 0
+
     def publish(self, update: StateUpdate) -> None:
-        critical_types = {UpdateType.RESULT, UpdateType.ERROR, UpdateType.NOTIFICATION, UpdateType.STATUS_CHANGE}
-        for sub in list(self._subs):
+        for sub in self._subs:
+            if sub.cancelled:
+                continue
             if sub.task_ids is not None and update.task_id not in sub.task_ids:
                 continue
             if sub.update_types is not None and update.update_type not in sub.update_types:
                 continue
             try:
                 if sub.queue.full():
-                    if update.update_type in critical_types:
+                    if update.update_type in _CRITICAL_TYPES:
                         try:
                             sub.queue.get_nowait()
                         except asyncio.QueueEmpty:
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import secrets
-from collections.abc import Callable, Mapping
-from typing import Any
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, TypeVar
 
 from pydantic import BaseModel
 
@@ -26,6 +27,8 @@ from .session import TaskResult, TaskRuntime
 PlannerFactory = Callable[[], ReactPlanner]
 PlannerEventSink = Callable[[PlannerEvent, str | None], None]
 
+_T = TypeVar("_T")
+
 
 def _is_artifact_ref_dict(value: Any) -> bool:
     """Check if a dict looks like a serialized ArtifactRef."""
@@ -149,6 +152,39 @@ def _build_context_patch(
     )
 
 
+async def _await_unless_cancelled(awaitable: Awaitable[_T], steering: Any) -> _T:
+    """Await ``awaitable`` while watching the steering cancel signal.
+
+    The planner only polls steering between steps, so a CANCEL arriving mid-step
+    would otherwise wait for the step to finish. Racing against the inbox's
+    ``cancel_event`` (which does not consume queued events) lets cancellation
+    preempt the planner. Inboxes without a ``cancel_event`` are awaited directly.
+    """
+    cancel_event = getattr(steering, "cancel_event", None)
+    if not isinstance(cancel_event, asyncio.Event):
+        return await awaitable
+
+    work_task = asyncio.ensure_future(awaitable)
+    cancel_task = asyncio.create_task(cancel_event.wait())
+    try:
+        done, _pending = await asyncio.wait(
+            {work_task, cancel_task},
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+    except BaseException:
+        work_task.cancel()
+        cancel_task.cancel()
+        await asyncio.gather(work_task, cancel_task, return_exceptions=True)
+        raise
+    if work_task not in done and steering.cancelled:
+        work_task.cancel()
+        await asyncio.gather(work_task, return_exceptions=True)
+        raise SteeringCancelled(steering.cancel_reason)
+    cancel_task.cancel()
+    await asyncio.gather(cancel_task, return_exceptions=True)
+    return await work_task
+
+
 class PlannerTaskPipeline:
     """Run a ReactPlanner inside a StreamingSession task."""
 
@@ -193,11 +229,14 @@ class PlannerTaskPipeline:
         tool_context["task_id"] = runtime.state.task_id
 
         query = runtime.context_snapshot.query or runtime.context_snapshot.spawn_reason or ""
-        result: PlannerFinish | PlannerPause = await planner.run(
-            query=query,
-            llm_context=llm_context,
-            tool_context=tool_context,
-            steering=runtime.steering,
+        result: PlannerFinish | PlannerPause = await _await_unless_cancelled(
+            planner.run(
+                query=query,
+                llm_context=llm_context,
+                tool_context=tool_context,
+                steering=runtime.steering,
+            ),
+            runtime.steering,
         )
 
         while isinstance(result, PlannerPause):
@@ -233,11 +272,14 @@ class PlannerTaskPipeline:
                             UpdateType.STATUS_CHANGE,
                             {"status": "RUNNING", "reason": "resume"},
                         )
-                        result = await planner.resume(
-                            result.resume_token,
-                            user_input=user_input,
-                            tool_context=tool_context,
-                            steering=runtime.steering,
+                        result = await _await_unless_cancelled(
+                            planner.resume(
+                                result.resume_token,
+                                user_input=user_input,
+                                tool_context=tool_context,
+                                steering=runtime.steering,
+                            ),
+                            runtime.steering,
                         )
                         break
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import weakref
 from collections.abc import Awaitable, Callable, Mapping, Sequence
 from typing import Any
 
@@ -27,15 +28,38 @@ conversational update to inform the user. If the results suggest further action,
 use your tools.
 """
 
+ProactiveGenerator = Callable[[ProactiveReportRequest], Awaitable[None]]
+
+# Generators close over ``planner_factory`` and ``session``, so both stay alive (and
+# their ids stay unique) for as long as the cache entry does.
+_GENERATOR_CACHE: weakref.WeakValueDictionary[tuple[int, int, int], ProactiveGenerator] = weakref.WeakValueDictionary()
+
 
 def create_default_proactive_generator(
     planner_factory: Callable[[], Any],
     session: StreamingSession,
     *,
     max_hops: int = 2,
-) -> Callable[[ProactiveReportRequest], Awaitable[None]]:
-    """Create a default proactive report generator using a full planner loop."""
+) -> ProactiveGenerator:
+    """Create a default proactive report generator using a full planner loop.
+
+    Generators are memoized per ``(planner_factory, session, max_hops)`` so that
+    repeated setup for the same session (e.g. on reconnect) reuses one callable.
+    """
+    key = (id(planner_factory), id(session), max_hops)
+    generator = _GENERATOR_CACHE.get(key)
+    if generator is None:
+        generator = _build_generator(planner_factory, session, max_hops=max_hops)
+        _GENERATOR_CACHE[key] = generator
+    return generator
 
+
+def _build_generator(
+    planner_factory: Callable[[], Any],
+    session: StreamingSession,
+    *,
+    max_hops: int,
+) -> ProactiveGenerator:
     async def _generator(request: ProactiveReportRequest) -> None:
         hops_remaining = request.proactive_hops_remaining
         if hops_remaining is None:
@@ -296,6 +296,8 @@ class StreamingSession:
             raise TypeError("state_store must implement SessionStateStore or StateStore")
         self._registry = TaskRegistry(persist_task=self._state_store.save_task)
         self._broker = UpdateBroker(max_queue_size=self._limits.update_queue_size)
+        self._persist_queue: asyncio.Queue[StateUpdate] = asyncio.Queue()
+        self._persist_task: asyncio.Task[None] | None = None
         self._steering_inboxes: dict[str, SteeringInbox] = {}
         self._task_handles: dict[str, asyncio.Task[None]] = {}
         self._pending_controls: dict[str, SteeringEvent] = {}
@@ -469,7 +471,24 @@ class StreamingSession:
 
     def _publish(self, update: StateUpdate) -> None:
         self._broker.publish(update)
-        asyncio.create_task(self._state_store.save_update(update))
+        # Persistence goes through a single writer task instead of one task per update,
+        # which keeps saves in publish order and off the planner's hot path.
+        self._persist_queue.put_nowait(update)
+        if self._persist_task is None or self._persist_task.done():
+            self._persist_task = asyncio.create_task(self._drain_persist_queue())
+
+    async def _drain_persist_queue(self) -> None:
+        while not self._persist_queue.empty():
+            update = self._persist_queue.get_nowait()
+            try:
+                await self._state_store.save_update(update)
+            except Exception:
+                _LOGGER.warning(
+                    "Failed to persist update %s for session %s",
+                    update.update_id,
+                    self.session_id,
+                    exc_info=True,
+                )
 
     def update_context(
         self,
@@ -1282,6 +1301,10 @@ class StreamingSession:
             await self._registry.update_task(task_id, status=TaskStatus.CANCELLED, error="session_closed")
         self._task_handles.clear()
         self._steering_inboxes.clear()
+        # Flush updates that were published but not yet written.
+        if self._persist_task is not None:
+            await self._persist_task
+            self._persist_task = None
 
     # -------------------------------------------------------------------------
     # Task Group Methods
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from types import TracebackType
 from typing import Any
 
 from penguiflow.artifacts import ArtifactStore, discover_artifact_store
@@ -101,6 +102,72 @@ async def list_planner_events_compat(store: object, trace_id: str) -> list[Plann
     raise TypeError("StateStore missing list_planner_events/get_events")
 
 
+class TxnBatch:
+    """Collect task/steering/update writes and flush them in one bulk call.
+
+    Stores exposing ``bulk_save({"tasks": [...], "steering": [...], "updates": [...]})``
+    receive a single call on exit; other stores fall back to the per-row compat
+    helpers in the original save order. Nothing is written if the block raises.
+
+    Example::
+
+        async with TxnBatch(store) as batch:
+            await batch.save_task(task)
+            await batch.save_steering(event)
+            await batch.save_update(update)
+    """
+
+    def __init__(self, store: object) -> None:
+        self._store = store
+        self._tasks: list[TaskState] = []
+        self._steering: list[SteeringEvent] = []
+        self._updates: list[StateUpdate] = []
+        self._order: list[TaskState | SteeringEvent | StateUpdate] = []
+
+    async def __aenter__(self) -> TxnBatch:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            await self.flush()
+
+    async def save_task(self, state: TaskState) -> None:
+        self._tasks.append(state)
+        self._order.append(state)
+
+    async def save_steering(self, event: SteeringEvent) -> None:
+        self._steering.append(event)
+        self._order.append(event)
+
+    async def save_update(self, update: StateUpdate) -> None:
+        self._updates.append(update)
+        self._order.append(update)
+
+    async def flush(self) -> None:
+        if not self._order:
+            return
+        bulk_save = getattr(self._store, "bulk_save", None)
+        if bulk_save is not None:
+            await bulk_save({"tasks": self._tasks, "steering": self._steering, "updates": self._updates})
+        else:
+            for item in self._order:
+                if isinstance(item, TaskState):
+                    await save_task_compat(self._store, item)
+                elif isinstance(item, SteeringEvent):
+                    await save_steering_compat(self._store, item)
+                else:
+                    await save_update_compat(self._store, item)
+        self._tasks = []
+        self._steering = []
+        self._updates = []
+        self._order = []
+
+
 async def maybe_save_remote_binding(store: StateStore | None, binding: Any) -> None:
     if store is None:
         return
@@ -108,6 +175,7 @@ async def maybe_save_remote_binding(store: StateStore | None, binding: Any) -> N
 
 
 __all__ = [
+    "TxnBatch",
     "get_artifact_store",
     "list_planner_events_compat",
     "list_steering_compat",
@@ -10,7 +10,7 @@ import asyncio
 import hashlib
 import json
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from dataclasses import replace
 from typing import Any
 
@@ -316,7 +316,10 @@ class InMemoryStateStore:
 
     async def save_task(self, state: TaskState) -> None:
         async with self._lock:
-            self._tasks.setdefault(state.session_id, {})[state.task_id] = _clone_task(state)
+            self._save_task_locked(state)
+
+    def _save_task_locked(self, state: TaskState) -> None:
+        self._tasks.setdefault(state.session_id, {})[state.task_id] = _clone_task(state)
 
     async def list_tasks(self, session_id: str) -> Sequence[TaskState]:
         async with self._lock:
@@ -325,10 +328,13 @@ class InMemoryStateStore:
 
     async def save_update(self, update: StateUpdate) -> None:
         async with self._lock:
-            updates = self._updates[update.session_id]
-            updates.append(_clone_update(update))
-            if self._max_updates_per_session > 0 and len(updates) > self._max_updates_per_session:
-                self._updates[update.session_id] = updates[-self._max_updates_per_session :]
+            self._save_update_locked(update)
+
+    def _save_update_locked(self, update: StateUpdate) -> None:
+        updates = self._updates[update.session_id]
+        updates.append(_clone_update(update))
+        if self._max_updates_per_session > 0 and len(updates) > self._max_updates_per_session:
+            self._updates[update.session_id] = updates[-self._max_updates_per_session :]
 
     async def list_updates(
         self,
@@ -377,10 +383,13 @@ class InMemoryStateStore:
     async def save_steering(self, event: SteeringEvent) -> None:
         sanitized = sanitize_steering_event(event)
         async with self._lock:
-            events = self._steering[event.session_id]
-            events.append(sanitized)
-            if self._max_steering_per_session > 0 and len(events) > self._max_steering_per_session:
-                self._steering[event.session_id] = events[-self._max_steering_per_session :]
+            self._save_steering_locked(sanitized)
+
+    def _save_steering_locked(self, sanitized: SteeringEvent) -> None:
+        events = self._steering[sanitized.session_id]
+        events.append(sanitized)
+        if self._max_steering_per_session > 0 and len(events) > self._max_steering_per_session:
+            self._steering[sanitized.session_id] = events[-self._max_steering_per_session :]
 
     async def list_steering(
         self,
@@ -407,6 +416,20 @@ class InMemoryStateStore:
             filtered.append(event.model_copy(deep=True))
         return filtered[-limit:]
 
+    # ---------------------------------------------------------------------
+    # Optional - Bulk writes (see penguiflow.state.adapters.TxnBatch)
+    # ---------------------------------------------------------------------
+
+    async def bulk_save(self, items: Mapping[str, Sequence[Any]]) -> None:
+        sanitized = [sanitize_steering_event(event) for event in items.get("steering", ())]
+        async with self._lock:
+            for state in items.get("tasks", ()):
+                self._save_task_locked(state)
+            for event in sanitized:
+                self._save_steering_locked(event)
+            for update in items.get("updates", ()):
+                self._save_update_locked(update)
+
     # ---------------------------------------------------------------------
     # Optional - Trajectories
     # ---------------------------------------------------------------------
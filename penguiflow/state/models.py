@@ -7,14 +7,15 @@ protocols downstream teams must implement.
 from __future__ import annotations
 
 import json
+import sys
 import uuid
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
 
 from penguiflow.metrics import FlowEvent
 
@@ -23,6 +24,16 @@ def _utc_now() -> datetime:
     return datetime.now(UTC)
 
 
+def _intern_id(value: str) -> str:
+    # Session and task ids repeat across every update/steering event of a task and are
+    # used as dict/set keys by brokers and stores; interning shares one string object
+    # per id and lets key comparisons short-circuit on identity.
+    return sys.intern(value) if type(value) is str else value
+
+
+_InternedId = Annotated[str, AfterValidator(_intern_id)]
+
+
 @dataclass(slots=True)
 class StoredEvent:
     """Representation of a runtime event persisted by a state store."""
@@ -84,8 +95,8 @@ class TaskType(str, Enum):
 
 
 class TaskContextSnapshot(BaseModel):
-    session_id: str
-    task_id: str
+    session_id: _InternedId
+    task_id: _InternedId
     trace_id: str | None = None
     spawned_from_task_id: str = "foreground"
     spawned_from_event_id: str | None = None
@@ -103,8 +114,8 @@ class TaskContextSnapshot(BaseModel):
 
 
 class StateUpdate(BaseModel):
-    session_id: str
-    task_id: str
+    session_id: _InternedId
+    task_id: _InternedId
     trace_id: str | None = None
     update_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     update_type: UpdateType
@@ -130,14 +141,18 @@ class TaskState:
     created_at: datetime = field(default_factory=_utc_now)
     updated_at: datetime = field(default_factory=_utc_now)
 
+    def __post_init__(self) -> None:
+        self.task_id = _intern_id(self.task_id)
+        self.session_id = _intern_id(self.session_id)
+
     def update_status(self, status: TaskStatus) -> None:
         self.status = status
         self.updated_at = _utc_now()
 
 
 class TaskStateModel(BaseModel):
-    task_id: str
-    session_id: str
+    task_id: _InternedId
+    session_id: _InternedId
     status: TaskStatus
     task_type: TaskType
     priority: int
@@ -182,8 +197,8 @@ class SteeringEventType(str, Enum):
 
 
 class SteeringEvent(BaseModel):
-    session_id: str
-    task_id: str
+    session_id: _InternedId
+    task_id: _InternedId
     event_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     event_type: SteeringEventType
     payload: dict[str, Any] = Field(default_factory=dict)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 from uuid import uuid4
@@ -20,6 +21,14 @@ class SteeringGuardInbox(ABC):
         """Submit event for async evaluation. Returns correlation_id."""
         raise NotImplementedError
 
+    async def submit_batch(self, events: Sequence[SteeringGuardEvent]) -> list[str]:
+        """Submit several independent events. Returns correlation_ids in order.
+
+        The default submits one at a time; transports with per-call overhead
+        (e.g. a remote evaluation service) can override this with a single request.
+        """
+        return [await self.submit(event) for event in events]
+
     @abstractmethod
     async def await_response(self, correlation_id: str, timeout_s: float) -> SteeringGuardResponse:
         """Wait for response. Raises TimeoutError if exceeded."""
@@ -54,19 +63,75 @@ class SteeringGuardResponse:
 
 
 class InMemoryGuardInbox(SteeringGuardInbox):
-    """In-process async evaluation."""
+    """In-process async evaluation.
+
+    Submitted events go onto a bounded queue drained by at most
+    ``max_concurrency`` worker tasks, so a burst of events never creates more
+    than that many tasks. Workers exit once the queue is empty and are started
+    again by the next submission. When ``max_queued`` events are waiting,
+    ``submit`` blocks until a worker frees a slot.
+
+    Pending and completed responses are keyed by correlation id, and completed
+    ids are also grouped by run so ``drain_responses`` only touches that run.
+    """
 
-    def __init__(self, evaluator: AsyncRuleEvaluator) -> None:
+    def __init__(
+        self,
+        evaluator: AsyncRuleEvaluator,
+        *,
+        max_concurrency: int = 16,
+        max_queued: int = 1024,
+    ) -> None:
         self._evaluator = evaluator
+        self._max_workers = max(1, max_concurrency)
+        self._queue: asyncio.Queue[tuple[SteeringGuardEvent, asyncio.Future[SteeringGuardResponse]]] = asyncio.Queue(
+            maxsize=max(1, max_queued)
+        )
         self._pending: dict[str, asyncio.Future[SteeringGuardResponse]] = {}
         self._completed: dict[str, SteeringGuardResponse] = {}
+        self._completed_by_run: dict[str, list[str]] = {}
+        self._workers: set[asyncio.Task[None]] = set()
 
     async def submit(self, event: SteeringGuardEvent) -> str:
-        future: asyncio.Future[SteeringGuardResponse] = asyncio.Future()
+        future: asyncio.Future[SteeringGuardResponse] = asyncio.get_running_loop().create_future()
         self._pending[event.correlation_id] = future
-        asyncio.create_task(self._evaluate(event, future))
+        await self._queue.put((event, future))
+        self._ensure_worker()
         return event.correlation_id
 
+    async def submit_batch(self, events: Sequence[SteeringGuardEvent]) -> list[str]:
+        """Enqueue all events, then start the workers they need in one go."""
+        loop = asyncio.get_running_loop()
+        for event in events:
+            future: asyncio.Future[SteeringGuardResponse] = loop.create_future()
+            self._pending[event.correlation_id] = future
+            if self._queue.full():
+                # Workers must be running before waiting for a free slot.
+                self._ensure_worker()
+                await self._queue.put((event, future))
+            else:
+                self._queue.put_nowait((event, future))
+        for _ in range(min(len(events), self._max_workers)):
+            self._ensure_worker()
+        return [event.correlation_id for event in events]
+
+    def _ensure_worker(self) -> None:
+        # A worker that just found the queue empty is done but may not have run its
+        # discard callback yet, so only count workers that will poll the queue again.
+        if sum(not worker.done() for worker in self._workers) >= self._max_workers:
+            return
+        worker = asyncio.create_task(self._worker())
+        self._workers.add(worker)
+        worker.add_done_callback(self._workers.discard)
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                event, future = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await self._evaluate(event, future)
+
     async def _evaluate(
         self,
         event: SteeringGuardEvent,
@@ -85,6 +150,7 @@ class InMemoryGuardInbox(SteeringGuardInbox):
             )
 
         self._completed[event.correlation_id] = response
+        self._completed_by_run.setdefault(event.run_id, []).append(event.correlation_id)
         self._pending.pop(event.correlation_id, None)
 
         if not future.done():
@@ -98,10 +164,10 @@ class InMemoryGuardInbox(SteeringGuardInbox):
         if future is None:
             raise KeyError(f"Unknown correlation_id: {correlation_id}")
 
-        return await asyncio.wait_for(future, timeout=timeout_s)
+        # Shield so a timed-out waiter does not cancel the shared future; the
+        # evaluation still completes and can be drained as a late decision.
+        return await asyncio.wait_for(asyncio.shield(future), timeout=timeout_s)
 
     def drain_responses(self, run_id: str) -> list[SteeringGuardResponse]:
-        # NOTE: Simple implementation drains globally.
-        responses = list(self._completed.values())
-        self._completed.clear()
-        return responses
+        correlation_ids = self._completed_by_run.pop(run_id, [])
+        return [self._completed.pop(cid) for cid in correlation_ids if cid in self._completed]
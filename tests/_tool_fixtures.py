@@ -0,0 +1,67 @@
+"""Tool functions and models shared by the catalog and tool-search tests."""
+
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from penguiflow.catalog import tool
+
+
+class EchoArgs(BaseModel):
+    message: str
+
+
+class EchoOut(BaseModel):
+    echoed: str
+
+
+@tool(desc="Echo a message", tags=["utility", "utility"], side_effects="read")
+async def echo(args: EchoArgs, ctx: object) -> EchoOut:
+    """Echo helper."""
+
+    return EchoOut(echoed=args.message)
+
+
+async def describe(args: EchoArgs, ctx: object) -> EchoOut:
+    """Describe the payload."""
+
+    return EchoOut(echoed=f"desc:{args.message}")
+
+
+@tool(
+    desc="Echo with examples",
+    examples=[
+        {"args": {"message": "hello"}, "description": "Basic echo", "tags": ["minimal"]},
+        {"args": {"message": "hi"}, "description": "Short input", "tags": ["common"]},
+    ],
+)
+async def echo_with_examples(args: EchoArgs, ctx: object) -> EchoOut:
+    return EchoOut(echoed=args.message)
+
+
+class DummyArgs(BaseModel):
+    text: str
+
+
+class DummyOut(BaseModel):
+    text: str
+
+
+@tool(desc="Dummy tool")
+async def dummy_tool(args: DummyArgs, ctx):
+    del ctx
+    return DummyOut(text=args.text)
+
+
+class ChartArgs(BaseModel):
+    x: str
+
+
+class ChartOut(BaseModel):
+    y: str
+
+
+@tool(desc="Charting tool", tags=["mcp", "charting"])
+async def charting_tool(args: ChartArgs, ctx):
+    del ctx
+    return ChartOut(y=args.x)
@@ -1,7 +1,35 @@
 import sys
+from collections.abc import Callable, Sequence
+from functools import cache
 from pathlib import Path
 
+import pytest
+
+from penguiflow.catalog import NodeSpec, build_catalog
+from penguiflow.node import Node
+from penguiflow.registry import ModelRegistry
+
 # Ensure repository root (where examples/ lives) is on sys.path for test imports.
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@cache
+def _cached_catalog(nodes: tuple[Node, ...], registry: ModelRegistry) -> tuple[NodeSpec, ...]:
+    # Keyed on the objects themselves (not their ids) so a recycled id can never return stale specs.
+    return tuple(build_catalog(nodes, registry))
+
+
+@pytest.fixture(scope="session")
+def cached_build_catalog() -> Callable[[Sequence[Node], ModelRegistry], list[NodeSpec]]:
+    """``build_catalog`` memoised on node and registry identity.
+
+    Only share registries that are fully populated before the first call; later
+    registrations are not seen by cached catalogs.
+    """
+
+    def _build(nodes: Sequence[Node], registry: ModelRegistry) -> list[NodeSpec]:
+        return list(_cached_catalog(tuple(nodes), registry))
+
+    return _build
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -10,10 +11,10 @@ from penguiflow.catalog import ToolLoadingMode, build_catalog, tool
 from penguiflow.node import Node
 from penguiflow.planner import PlannerEvent, PlannerPause, ReactPlanner, ToolSearchConfig
 from penguiflow.registry import ModelRegistry
-from penguiflow.sessions.models import TaskStatus, TaskType
+from penguiflow.sessions.models import TaskStatus, TaskType, UpdateType
 from penguiflow.sessions.planner import PlannerTaskPipeline
 from penguiflow.state.models import SteeringEvent, SteeringEventType, TaskContextSnapshot, TaskState
-from penguiflow.steering import SteeringCancelled
+from penguiflow.steering import SteeringCancelled, SteeringInbox
 
 
 @dataclass(slots=True)
@@ -62,11 +63,11 @@ class _Runtime:
     state: TaskState
     context_snapshot: TaskContextSnapshot
     session: _Session
-    steering: _Steering
-    updates: list[tuple[str, Any]] = field(default_factory=list)
+    steering: _Steering | SteeringInbox
+    updates: list[tuple[UpdateType, Any]] = field(default_factory=list)
 
-    def emit_update(self, update_type: Any, payload: Any) -> None:  # noqa: ANN001 - test stub
-        self.updates.append((str(update_type), payload))
+    def emit_update(self, update_type: UpdateType, payload: Any) -> None:
+        self.updates.append((update_type, payload))
 
 
 class _StubPlanner:
@@ -83,6 +84,22 @@ class _StubPlanner:
         raise AssertionError("resume should not be called in these tests")
 
 
+class _HangingPlanner:
+    def __init__(self) -> None:
+        self._event_callback = None
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def run(self, *args: Any, **kwargs: Any) -> PlannerPause:  # noqa: ANN002, ANN003 - test stub
+        self.started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        raise AssertionError("unreachable")
+
+
 class _EchoArgs(BaseModel):
     text: str
 
@@ -174,6 +191,25 @@ async def test_pipeline_raises_on_reject_event() -> None:
         await pipeline(runtime)  # type: ignore[arg-type]
 
 
+@pytest.mark.asyncio
+async def test_pipeline_cancel_preempts_running_planner() -> None:
+    inbox = SteeringInbox()
+    planner = _HangingPlanner()
+    runtime = _make_runtime(task_type=TaskType.FOREGROUND, steering=_Steering())
+    runtime.steering = inbox
+    pipeline = PlannerTaskPipeline(planner_factory=lambda: planner)  # type: ignore[arg-type, return-value]
+
+    task = asyncio.create_task(pipeline(runtime))  # type: ignore[arg-type]
+    await asyncio.wait_for(planner.started.wait(), timeout=1.0)
+    await inbox.push(
+        SteeringEvent(session_id="s", task_id="t", event_type=SteeringEventType.CANCEL, payload={"reason": "stop"})
+    )
+
+    with pytest.raises(SteeringCancelled, match="stop"):
+        await asyncio.wait_for(task, timeout=1.0)
+    assert planner.cancelled
+
+
 @pytest.mark.asyncio
 async def test_background_pipeline_parallel_can_activate_deferred_tool(tmp_path) -> None:
     registry = ModelRegistry()
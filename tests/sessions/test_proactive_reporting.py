@@ -123,6 +123,19 @@ async def test_proactive_generator_noop_when_hops_exhausted() -> None:
     assert session.consumed == []
 
 
+def test_proactive_generator_is_memoized_per_factory_session_and_hops() -> None:
+    session = _FakeSession(published=[], consumed=[])
+
+    def factory() -> _FakePlanner:
+        return _FakePlanner()
+
+    first = create_default_proactive_generator(factory, cast(Any, session), max_hops=2)
+    assert create_default_proactive_generator(factory, cast(Any, session), max_hops=2) is first
+    assert create_default_proactive_generator(factory, cast(Any, session), max_hops=1) is not first
+    other_session = _FakeSession(published=[], consumed=[])
+    assert create_default_proactive_generator(factory, cast(Any, other_session), max_hops=2) is not first
+
+
 def test_setup_proactive_reporting_disabled_is_noop() -> None:
     session = _FakeSession(published=[], consumed=[])
     setup_proactive_reporting(
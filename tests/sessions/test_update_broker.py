@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from asyncio import QueueEmpty, QueueFull
+
 import pytest
 
 from penguiflow.sessions.broker import UpdateBroker
@@ -50,10 +52,10 @@ async def test_update_broker_filters_and_evicts_for_critical_updates() -> None:
     original_put_nowait = sub.queue.put_nowait
     try:
         def _raise_empty() -> None:
-            raise __import__("asyncio").QueueEmpty
+            raise QueueEmpty
 
         def _raise_full(_update: StateUpdate) -> None:
-            raise __import__("asyncio").QueueFull
+            raise QueueFull
 
         sub.queue.get_nowait = _raise_empty  # type: ignore[method-assign]
         broker.publish(
@@ -72,3 +74,26 @@ async def test_update_broker_filters_and_evicts_for_critical_updates() -> None:
 
     await filtered_unsub()
     await unsubscribe()
+
+
+@pytest.mark.asyncio
+async def test_update_broker_unsubscribe_is_lazy_and_compacts() -> None:
+    broker = UpdateBroker()
+    subs = [await broker.subscribe(task_ids=["t1"]) for _ in range(4)]
+    (first_queue, first_unsub), (second_queue, second_unsub) = subs[0], subs[1]
+
+    await first_unsub()
+    await first_unsub()  # idempotent
+    assert len(broker._subs) == 4  # noqa: SLF001 - test-only access
+
+    broker.publish(StateUpdate(session_id="s", task_id="t1", update_type=UpdateType.THINKING, content={"x": 1}))
+    assert first_queue.empty()
+    assert second_queue.qsize() == 1
+
+    # Once half of the registry is cancelled it gets rebuilt.
+    await second_unsub()
+    assert len(broker._subs) == 2  # noqa: SLF001 - test-only access
+
+    await subs[2][1]()
+    await broker.compact()
+    assert len(broker._subs) == 1  # noqa: SLF001 - test-only access
@@ -4,6 +4,7 @@ import pytest
 
 from penguiflow.planner import PlannerEvent
 from penguiflow.state.adapters import (
+    TxnBatch,
     list_planner_events_compat,
     list_steering_compat,
     list_tasks_compat,
@@ -29,13 +30,17 @@ from penguiflow.state.models import (
 class _CompatStore:
     def __init__(self) -> None:
         self.saved_updates: list[StateUpdate] = []
-        self.saved_events: list[tuple[str, PlannerEvent]] = []
+        self.saved_events: dict[str, list[PlannerEvent]] = {}
         self.saved_tasks: list[TaskState] = []
         self.saved_steering: list[SteeringEvent] = []
         self.saved_bindings: list[object] = []
+        self._updates_by_session: dict[str, list[StateUpdate]] = {}
+        self._tasks_by_session: dict[str, list[TaskState]] = {}
+        self._steering_by_session: dict[str, list[SteeringEvent]] = {}
 
     async def save_task_update(self, update: StateUpdate) -> None:
         self.saved_updates.append(update)
+        self._updates_by_session.setdefault(update.session_id, []).append(update)
 
     async def list_task_updates(
         self,
@@ -46,22 +51,24 @@ class _CompatStore:
         limit: int = 500,
     ) -> list[StateUpdate]:
         _ = (task_id, since_id, limit)
-        return [u for u in self.saved_updates if u.session_id == session_id]
+        return list(self._updates_by_session.get(session_id, ()))
 
     async def save_event(self, trace_id: str, event: PlannerEvent) -> None:
-        self.saved_events.append((trace_id, event))
+        self.saved_events.setdefault(trace_id, []).append(event)
 
     async def get_events(self, trace_id: str) -> list[PlannerEvent]:
-        return [event for tid, event in self.saved_events if tid == trace_id]
+        return list(self.saved_events.get(trace_id, ()))
 
     async def save_task(self, state: TaskState) -> None:
         self.saved_tasks.append(state)
+        self._tasks_by_session.setdefault(state.session_id, []).append(state)
 
     async def list_tasks(self, session_id: str) -> list[TaskState]:
-        return [task for task in self.saved_tasks if task.session_id == session_id]
+        return list(self._tasks_by_session.get(session_id, ()))
 
     async def save_steering(self, event: SteeringEvent) -> None:
         self.saved_steering.append(event)
+        self._steering_by_session.setdefault(event.session_id, []).append(event)
 
     async def list_steering(
         self,
@@ -72,10 +79,10 @@ class _CompatStore:
         limit: int = 500,
     ) -> list[SteeringEvent]:
         _ = (since_id, limit)
-        events = [evt for evt in self.saved_steering if evt.session_id == session_id]
+        events = self._steering_by_session.get(session_id, ())
         if task_id is not None:
-            events = [evt for evt in events if evt.task_id == task_id]
-        return events
+            return [evt for evt in events if evt.task_id == task_id]
+        return list(events)
 
     async def save_remote_binding(self, binding: object) -> None:
         self.saved_bindings.append(binding)
@@ -136,3 +143,61 @@ async def test_task_and_steering_compat_helpers_and_remote_binding() -> None:
     binding = object()
     await maybe_save_remote_binding(store, binding)
     assert store.saved_bindings == [binding]
+
+
+class _BulkStore(_CompatStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self.bulk_calls: list[dict[str, list[object]]] = []
+
+    async def bulk_save(self, items: dict[str, list[object]]) -> None:
+        self.bulk_calls.append({key: list(value) for key, value in items.items()})
+
+
+def _task_steering_update() -> tuple[TaskState, SteeringEvent, StateUpdate]:
+    task = TaskState(
+        task_id="t",
+        session_id="s",
+        status=TaskStatus.PENDING,
+        task_type=TaskType.FOREGROUND,
+        priority=0,
+        context_snapshot=TaskContextSnapshot(session_id="s", task_id="t"),
+    )
+    steering = SteeringEvent(session_id="s", task_id="t", event_type=SteeringEventType.USER_MESSAGE)
+    update = StateUpdate(session_id="s", task_id="t", update_type=UpdateType.THINKING, content=None)
+    return task, steering, update
+
+
+@pytest.mark.asyncio
+async def test_txn_batch_uses_single_bulk_save_when_available() -> None:
+    store = _BulkStore()
+    task, steering, update = _task_steering_update()
+    async with TxnBatch(store) as batch:
+        await batch.save_task(task)
+        await batch.save_steering(steering)
+        await batch.save_update(update)
+        assert store.bulk_calls == []
+
+    assert store.bulk_calls == [{"tasks": [task], "steering": [steering], "updates": [update]}]
+    assert store.saved_tasks == []
+
+
+@pytest.mark.asyncio
+async def test_txn_batch_falls_back_to_per_row_saves_and_discards_on_error() -> None:
+    store = _CompatStore()
+    task, steering, update = _task_steering_update()
+    async with TxnBatch(store) as batch:
+        await batch.save_update(update)
+        await batch.save_task(task)
+        await batch.save_steering(steering)
+
+    assert store.saved_updates == [update]
+    assert store.saved_tasks == [task]
+    assert store.saved_steering == [steering]
+
+    fresh = _CompatStore()
+    with pytest.raises(RuntimeError):
+        async with TxnBatch(fresh) as batch:
+            await batch.save_task(task)
+            raise RuntimeError("abort")
+    assert fresh.saved_tasks == []
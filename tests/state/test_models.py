@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from penguiflow.state.models import (
+    StateUpdate,
+    SteeringEvent,
+    SteeringEventType,
+    TaskContextSnapshot,
+    TaskState,
+    TaskStatus,
+    TaskType,
+    UpdateType,
+)
+
+
+def test_session_and_task_ids_are_interned() -> None:
+    # Build the ids at runtime so they are distinct objects before validation.
+    session_id = "".join(["sess", "-", "1"])
+    task_id = "".join(["task", "-", "1"])
+
+    first = StateUpdate(session_id=session_id, task_id=task_id, update_type=UpdateType.THINKING, content=None)
+    second = StateUpdate(
+        session_id="".join(["sess", "-", "1"]),
+        task_id="".join(["task", "-", "1"]),
+        update_type=UpdateType.RESULT,
+        content=None,
+    )
+    assert first.session_id is second.session_id
+    assert first.task_id is second.task_id
+
+    steering = SteeringEvent(
+        session_id="".join(["sess", "-", "1"]),
+        task_id="".join(["task", "-", "1"]),
+        event_type=SteeringEventType.CANCEL,
+    )
+    assert steering.task_id is first.task_id
+
+    state = TaskState(
+        task_id="".join(["task", "-", "1"]),
+        session_id="".join(["sess", "-", "1"]),
+        status=TaskStatus.PENDING,
+        task_type=TaskType.FOREGROUND,
+        priority=0,
+        context_snapshot=TaskContextSnapshot(session_id=session_id, task_id=task_id),
+    )
+    assert state.task_id is first.task_id
+    assert state.session_id is first.session_id
+    assert state.context_snapshot.task_id is first.task_id
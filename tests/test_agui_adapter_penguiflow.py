@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import Any
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, NamedTuple
 
 import pytest
 from ag_ui.core import EventType, RunAgentInput
@@ -10,12 +10,27 @@ from penguiflow.agui_adapter.penguiflow import PenguiFlowAdapter
 from penguiflow.cli.playground_wrapper import AgentWrapper, ChatResult
 from penguiflow.planner import PlannerEvent
 
+# Share one event loop across the module; these tests do not depend on a fresh loop.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-class FakeAgentWrapper(AgentWrapper):
-    def __init__(self, events: list[PlannerEvent]) -> None:
+
+class _ScriptedWrapper(AgentWrapper):
+    """Agent wrapper whose chat replays planner events and then returns or raises a scripted outcome."""
+
+    def __init__(
+        self,
+        events: Sequence[PlannerEvent] = (),
+        *,
+        answer: str | None = "Final answer",
+        pause: dict[str, Any] | None = None,
+        error: Exception | None = None,
+    ) -> None:
         self._events = events
-        self.last_llm_context: dict[str, Any] | None = None
-        self.last_tool_context: dict[str, Any] | None = None
+        self._answer = answer
+        self._pause = pause
+        self._error = error
+        self.last_llm_context: Mapping[str, Any] | None = None
+        self.last_tool_context: Mapping[str, Any] | None = None
         self.last_query: str | None = None
 
     async def initialize(self) -> None:
@@ -36,7 +51,7 @@ class FakeAgentWrapper(AgentWrapper):
         steering: Any = None,
     ) -> ChatResult:
         del steering
-        raise RuntimeError("resume not supported in FakeAgentWrapper")
+        raise RuntimeError("resume not supported in _ScriptedWrapper")
 
     async def chat(
         self,
@@ -51,172 +66,254 @@ class FakeAgentWrapper(AgentWrapper):
     ) -> ChatResult:
         del steering
         self.last_query = query
-        self.last_llm_context = dict(llm_context or {})
-        self.last_tool_context = dict(tool_context or {})
+        # The adapter hands over freshly built dicts, so no defensive copy is needed.
+        self.last_llm_context = llm_context or {}
+        self.last_tool_context = tool_context or {}
         if event_consumer:
             for event in self._events:
                 event_consumer(event, trace_id_hint)
+        if self._error is not None:
+            raise self._error
         return ChatResult(
-            answer="Final answer",
+            answer=self._answer,
             trace_id=trace_id_hint or "trace-1",
             session_id=session_id,
             metadata={},
-            pause=None,
+            pause=self._pause,
         )
 
 
-@pytest.mark.asyncio
-async def test_penguiflow_adapter_maps_events() -> None:
-    planner_events = [
-        PlannerEvent(
-            event_type="step_start",
-            ts=0.0,
-            trajectory_step=0,
-            extra={"action_seq": 1},
-        ),
-        PlannerEvent(
-            event_type="tool_call_start",
-            ts=0.01,
-            trajectory_step=0,
-            extra={
-                "tool_call_id": "call_1_0",
-                "tool_name": "search",
-                "args_json": '{"query":"penguiflow"}',
-            },
-        ),
-        PlannerEvent(
-            event_type="tool_call_end",
-            ts=0.02,
-            trajectory_step=0,
-            extra={"tool_call_id": "call_1_0"},
-        ),
-        PlannerEvent(
-            event_type="tool_call_result",
-            ts=0.03,
-            trajectory_step=0,
-            extra={"tool_call_id": "call_1_0", "result_json": '{"result":"ok"}'},
-        ),
-        PlannerEvent(
-            event_type="llm_stream_chunk",
-            ts=0.04,
-            trajectory_step=0,
-            extra={"text": "Hello", "done": False, "channel": "answer"},
-        ),
-        PlannerEvent(
-            event_type="llm_stream_chunk",
-            ts=0.05,
-            trajectory_step=0,
-            extra={"text": "", "done": True, "channel": "answer"},
-        ),
-        PlannerEvent(
-            event_type="artifact_stored",
-            ts=0.06,
-            trajectory_step=0,
-            extra={
-                "artifact_id": "art-1",
-                "mime_type": "text/plain",
-                "size_bytes": 12,
-                "artifact_filename": "note.txt",
-                "source": {"namespace": "tools"},
-            },
-        ),
-        PlannerEvent(
-            event_type="artifact_chunk",
-            ts=0.065,
-            trajectory_step=0,
-            extra={
-                "stream_id": "ui",
-                "seq": 0,
-                "chunk": {"component": "markdown", "props": {"content": "Hello"}},
-                "done": True,
-                "artifact_type": "ui_component",
-                "meta": {"source_tool": "render_component"},
-            },
-        ),
-        PlannerEvent(
-            event_type="resource_updated",
-            ts=0.07,
-            trajectory_step=0,
-            extra={"namespace": "tools", "uri": "file:///test.txt"},
-        ),
-        PlannerEvent(
-            event_type="step_complete",
-            ts=0.08,
-            trajectory_step=0,
-            node_name="search",
-        ),
-    ]
-
-    wrapper = FakeAgentWrapper(planner_events)
-    adapter = PenguiFlowAdapter(wrapper)
-
-    input_payload = RunAgentInput(
-        thread_id="thread-1",
-        run_id="run-1",
-        messages=[{"id": "msg-1", "role": "user", "content": "Hi"}],
-        tools=[],
-        context=[],
-        state={},
-        forwarded_props={"penguiflow": {"llm_context": {"tone": "test"}, "tool_context": {"tenant_id": "t1"}}},
-    )
-
-    output_events = []
+_STEP_START = PlannerEvent(
+    event_type="step_start",
+    ts=0.0,
+    trajectory_step=0,
+    extra={"action_seq": 1},
+)
+_TOOL_CALL_START = PlannerEvent(
+    event_type="tool_call_start",
+    ts=0.01,
+    trajectory_step=0,
+    extra={
+        "tool_call_id": "call_1_0",
+        "tool_name": "search",
+        "args_json": '{"query":"penguiflow"}',
+    },
+)
+_TOOL_CALL_END = PlannerEvent(
+    event_type="tool_call_end",
+    ts=0.02,
+    trajectory_step=0,
+    extra={"tool_call_id": "call_1_0"},
+)
+_TOOL_CALL_RESULT = PlannerEvent(
+    event_type="tool_call_result",
+    ts=0.03,
+    trajectory_step=0,
+    extra={"tool_call_id": "call_1_0", "result_json": '{"result":"ok"}'},
+)
+_ANSWER_CHUNK = PlannerEvent(
+    event_type="llm_stream_chunk",
+    ts=0.04,
+    trajectory_step=0,
+    extra={"text": "Hello", "done": False, "channel": "answer"},
+)
+_ANSWER_DONE = PlannerEvent(
+    event_type="llm_stream_chunk",
+    ts=0.05,
+    trajectory_step=0,
+    extra={"text": "", "done": True, "channel": "answer"},
+)
+_ARTIFACT_STORED = PlannerEvent(
+    event_type="artifact_stored",
+    ts=0.06,
+    trajectory_step=0,
+    extra={
+        "artifact_id": "art-1",
+        "mime_type": "text/plain",
+        "size_bytes": 12,
+        "artifact_filename": "note.txt",
+        "source": {"namespace": "tools"},
+    },
+)
+_ARTIFACT_CHUNK = PlannerEvent(
+    event_type="artifact_chunk",
+    ts=0.065,
+    trajectory_step=0,
+    extra={
+        "stream_id": "ui",
+        "seq": 0,
+        "chunk": {"component": "markdown", "props": {"content": "Hello"}},
+        "done": True,
+        "artifact_type": "ui_component",
+        "meta": {"source_tool": "render_component"},
+    },
+)
+_RESOURCE_UPDATED = PlannerEvent(
+    event_type="resource_updated",
+    ts=0.07,
+    trajectory_step=0,
+    extra={"namespace": "tools", "uri": "file:///test.txt"},
+)
+_STEP_COMPLETE = PlannerEvent(
+    event_type="step_complete",
+    ts=0.08,
+    trajectory_step=0,
+    node_name="search",
+)
+
+_MAPPING_TEST_EVENTS: tuple[PlannerEvent, ...] = (
+    _STEP_START,
+    _TOOL_CALL_START,
+    _TOOL_CALL_END,
+    _TOOL_CALL_RESULT,
+    _ANSWER_CHUNK,
+    _ANSWER_DONE,
+    _ARTIFACT_STORED,
+    _ARTIFACT_CHUNK,
+    _RESOURCE_UPDATED,
+    _STEP_COMPLETE,
+)
+_MAPPING_EXPECTED: frozenset[EventType] = frozenset(
+    {
+        EventType.RUN_STARTED,
+        EventType.RUN_FINISHED,
+        EventType.STEP_STARTED,
+        EventType.STEP_FINISHED,
+        EventType.TOOL_CALL_START,
+        EventType.TOOL_CALL_ARGS,
+        EventType.TOOL_CALL_END,
+        EventType.TOOL_CALL_RESULT,
+        EventType.TEXT_MESSAGE_CONTENT,
+        EventType.CUSTOM,
+    }
+)
+
+
+# Input validation is not under test here, so the shared payloads skip it.
+_INPUT = RunAgentInput.model_construct(
+    thread_id="thread-1",
+    run_id="run-1",
+    messages=[{"id": "msg-1", "role": "user", "content": "Hi"}],
+    tools=[],
+    context=[],
+    state={},
+    forwarded_props={},
+)
+_FORWARDED_INPUT = _INPUT.model_copy(
+    update={
+        "forwarded_props": {"penguiflow": {"llm_context": {"tone": "test"}, "tool_context": {"tenant_id": "t1"}}},
+    }
+)
+
+AdapterFactory = Callable[..., tuple[PenguiFlowAdapter, _ScriptedWrapper]]
+
+
+@pytest.fixture
+def adapter_factory() -> AdapterFactory:
+    def _factory(
+        planner_events: Sequence[PlannerEvent] = (), **adapter_kwargs: Any
+    ) -> tuple[PenguiFlowAdapter, _ScriptedWrapper]:
+        wrapper = _ScriptedWrapper(tuple(planner_events))
+        return PenguiFlowAdapter(wrapper, **adapter_kwargs), wrapper
+
+    return _factory
+
+
+class _Observed(NamedTuple):
+    types: set[EventType]
+    custom_names: set[str]
+    deltas: set[str]
+
+
+async def _observe(adapter: PenguiFlowAdapter, input_payload: RunAgentInput = _INPUT) -> _Observed:
+    """Drain the adapter stream, keeping only what the assertions look at."""
+    observed = _Observed(set(), set(), set())
     async for event in adapter.run(input_payload):
-        output_events.append(event)
-
-    types = [event.type for event in output_events]
-    assert EventType.RUN_STARTED in types
-    assert EventType.RUN_FINISHED in types
-    assert EventType.STEP_STARTED in types
-    assert EventType.STEP_FINISHED in types
-    assert EventType.TOOL_CALL_START in types
-    assert EventType.TOOL_CALL_ARGS in types
-    assert EventType.TOOL_CALL_END in types
-    assert EventType.TOOL_CALL_RESULT in types
-    assert EventType.TEXT_MESSAGE_CONTENT in types
-    assert EventType.CUSTOM in types
-
-    custom_events = [event for event in output_events if event.type == EventType.CUSTOM]
-    assert any(event.name == "artifact_stored" for event in custom_events)
-    assert any(event.name == "artifact_chunk" for event in custom_events)
-    assert any(event.name == "resource_updated" for event in custom_events)
-
-    message_chunks = [event for event in output_events if event.type == EventType.TEXT_MESSAGE_CONTENT]
-    assert any(event.delta == "Hello" for event in message_chunks)
+        observed.types.add(event.type)
+        if event.type == EventType.CUSTOM:
+            observed.custom_names.add(event.name)
+        elif event.type == EventType.TEXT_MESSAGE_CONTENT:
+            observed.deltas.add(event.delta)
+    return observed
+
+
+@pytest.mark.parametrize(
+    ("planner_events", "expected_type"),
+    [
+        pytest.param([], EventType.RUN_STARTED, id="run_started"),
+        pytest.param([], EventType.RUN_FINISHED, id="run_finished"),
+        pytest.param([_STEP_START], EventType.STEP_STARTED, id="step_start"),
+        pytest.param([_STEP_COMPLETE], EventType.STEP_FINISHED, id="step_complete"),
+        pytest.param([_TOOL_CALL_START], EventType.TOOL_CALL_START, id="tool_call_start"),
+        pytest.param([_TOOL_CALL_START], EventType.TOOL_CALL_ARGS, id="tool_call_args"),
+        pytest.param([_TOOL_CALL_START, _TOOL_CALL_END], EventType.TOOL_CALL_END, id="tool_call_end"),
+        pytest.param([_TOOL_CALL_START, _TOOL_CALL_RESULT], EventType.TOOL_CALL_RESULT, id="tool_call_result"),
+        pytest.param([_ANSWER_CHUNK, _ANSWER_DONE], EventType.TEXT_MESSAGE_CONTENT, id="answer_chunk"),
+    ],
+)
+async def test_penguiflow_adapter_maps_event_type(
+    adapter_factory: AdapterFactory,
+    planner_events: list[PlannerEvent],
+    expected_type: EventType,
+) -> None:
+    adapter, _ = adapter_factory(planner_events)
+    observed = await _observe(adapter)
+
+    assert expected_type in observed.types
+
+
+@pytest.mark.parametrize(
+    ("planner_event", "custom_name"),
+    [
+        pytest.param(_ARTIFACT_STORED, "artifact_stored", id="artifact_stored"),
+        pytest.param(_ARTIFACT_CHUNK, "artifact_chunk", id="artifact_chunk"),
+        pytest.param(_RESOURCE_UPDATED, "resource_updated", id="resource_updated"),
+    ],
+)
+async def test_penguiflow_adapter_maps_custom_event(
+    adapter_factory: AdapterFactory,
+    planner_event: PlannerEvent,
+    custom_name: str,
+) -> None:
+    adapter, _ = adapter_factory([planner_event])
+    observed = await _observe(adapter)
+
+    assert custom_name in observed.custom_names
+
+
+async def test_penguiflow_adapter_maps_events(adapter_factory: AdapterFactory) -> None:
+    adapter, wrapper = adapter_factory(_MAPPING_TEST_EVENTS)
+
+    observed = await _observe(adapter, _FORWARDED_INPUT)
+
+    assert _MAPPING_EXPECTED <= observed.types
+    assert {"artifact_stored", "artifact_chunk", "resource_updated"} <= observed.custom_names
+    assert "Hello" in observed.deltas
 
     assert wrapper.last_llm_context == {"tone": "test"}
     assert wrapper.last_tool_context == {"tenant_id": "t1"}
     assert wrapper.last_query == "Hi"
 
 
-@pytest.mark.asyncio
-async def test_penguiflow_adapter_extracts_text_from_content_list() -> None:
-    wrapper = FakeAgentWrapper([])
-    adapter = PenguiFlowAdapter(wrapper)
-
-    input_payload = RunAgentInput(
-        thread_id="thread-4",
-        run_id="run-4",
-        messages=[
-            {
-                "id": "msg-1",
-                "role": "user",
-                "content": [{"type": "text", "text": "Hello from list"}],
-            }
-        ],
-        tools=[],
-        context=[],
-        state={},
-        forwarded_props={},
+async def test_penguiflow_adapter_extracts_text_from_content_list(adapter_factory: AdapterFactory) -> None:
+    adapter, wrapper = adapter_factory()
+    input_payload = _INPUT.model_copy(
+        update={
+            "messages": [
+                {
+                    "id": "msg-1",
+                    "role": "user",
+                    "content": [{"type": "text", "text": "Hello from list"}],
+                }
+            ],
+        }
     )
 
-    async for _event in adapter.run(input_payload):
-        pass
+    await _observe(adapter, input_payload)
 
     assert wrapper.last_query == "Hello from list"
 
 
-@pytest.mark.asyncio
 async def test_agui_adapter_does_not_suppress_final_answer_on_empty_done_chunk() -> None:
     """Regression: providers may emit an answer-channel done marker with empty text.
 
@@ -224,59 +321,13 @@ async def test_agui_adapter_does_not_suppress_final_answer_on_empty_done_chunk()
     emitting the final answer payload and the UI shows nothing.
     """
 
-    class DoneOnlyChunkAgentWrapper(AgentWrapper):
-        async def initialize(self) -> None:
-            pass
-
-        async def shutdown(self) -> None:
-            pass
-
-        async def resume(
-            self,
-            resume_token: str,
-            *,
-            session_id: str,
-            user_input: str | None = None,
-            tool_context: Mapping[str, Any] | None = None,
-            event_consumer: Any = None,
-            trace_id_hint: str | None = None,
-            steering: Any = None,
-        ) -> ChatResult:
-            del resume_token, session_id, user_input, tool_context, event_consumer, trace_id_hint, steering
-            raise RuntimeError("resume not supported in DoneOnlyChunkAgentWrapper")
-
-        async def chat(
-            self,
-            query: str,
-            *,
-            session_id: str,
-            llm_context: Mapping[str, Any] | None = None,
-            tool_context: Mapping[str, Any] | None = None,
-            event_consumer: Any = None,
-            trace_id_hint: str | None = None,
-            steering: Any = None,
-        ) -> ChatResult:
-            del query, llm_context, tool_context, steering
-            if event_consumer is not None:
-                event_consumer(
-                    PlannerEvent(
-                        event_type="llm_stream_chunk",
-                        ts=0.01,
-                        trajectory_step=0,
-                        extra={"channel": "answer", "text": "", "done": True, "phase": "answer"},
-                    ),
-                    trace_id_hint,
-                )
-            return ChatResult(
-                answer="Final answer should be emitted.",
-                trace_id=trace_id_hint or "trace",
-                session_id=session_id,
-                metadata={},
-                pause=None,
-            )
-
-    wrapper = DoneOnlyChunkAgentWrapper()
-    adapter = PenguiFlowAdapter(wrapper)
+    done_only_chunk = PlannerEvent(
+        event_type="llm_stream_chunk",
+        ts=0.01,
+        trajectory_step=0,
+        extra={"channel": "answer", "text": "", "done": True, "phase": "answer"},
+    )
+    adapter = PenguiFlowAdapter(_ScriptedWrapper([done_only_chunk], answer="Final answer should be emitted."))
 
     input_payload = RunAgentInput(
         thread_id="thread-x",
@@ -288,141 +339,46 @@ async def test_agui_adapter_does_not_suppress_final_answer_on_empty_done_chunk()
         forwarded_props={},
     )
 
-    output_events = []
-    async for event in adapter.run(input_payload):
-        output_events.append(event)
+    observed = await _observe(adapter, input_payload)
 
-    message_chunks = [event for event in output_events if event.type == EventType.TEXT_MESSAGE_CONTENT]
-    assert any(event.delta == "Final answer should be emitted." for event in message_chunks)
+    assert "Final answer should be emitted." in observed.deltas
 
 
-@pytest.mark.asyncio
 async def test_penguiflow_adapter_emits_pause_custom_event() -> None:
-    class PauseAgentWrapper(AgentWrapper):
-        async def initialize(self) -> None:
-            pass
-
-        async def shutdown(self) -> None:
-            pass
-
-        async def resume(
-            self,
-            resume_token: str,
-            *,
-            session_id: str,
-            user_input: str | None = None,
-            tool_context: Mapping[str, Any] | None = None,
-            event_consumer: Any = None,
-            trace_id_hint: str | None = None,
-            steering: Any = None,
-        ) -> ChatResult:
-            del steering
-            raise RuntimeError("resume not supported in PauseAgentWrapper")
-
-        async def chat(
-            self,
-            query: str,
-            *,
-            session_id: str,
-            llm_context: Mapping[str, Any] | None = None,
-            tool_context: Mapping[str, Any] | None = None,
-            event_consumer: Any = None,
-            trace_id_hint: str | None = None,
-            steering: Any = None,
-        ) -> ChatResult:
-            del steering
-            return ChatResult(
-                answer=None,
-                trace_id=trace_id_hint or "trace-2",
-                session_id=session_id,
-                metadata={},
-                pause={
-                    "reason": "oauth",
-                    "payload": {"provider": "github", "auth_url": "https://example.com"},
-                    "resume_token": "resume-123",
-                },
-            )
-
-    adapter = PenguiFlowAdapter(PauseAgentWrapper())
-    input_payload = RunAgentInput(
-        thread_id="thread-2",
-        run_id="run-2",
-        messages=[{"id": "msg-1", "role": "user", "content": "Hi"}],
-        tools=[],
-        context=[],
-        state={},
-        forwarded_props={},
+    wrapper = _ScriptedWrapper(
+        answer=None,
+        pause={
+            "reason": "oauth",
+            "payload": {"provider": "github", "auth_url": "https://example.com"},
+            "resume_token": "resume-123",
+        },
     )
+    adapter = PenguiFlowAdapter(wrapper)
+    input_payload = _INPUT.model_copy(update={"thread_id": "thread-2", "run_id": "run-2"})
 
-    output_events = []
-    async for event in adapter.run(input_payload):
-        output_events.append(event)
-
-    custom_events = [event for event in output_events if event.type == EventType.CUSTOM]
-    assert any(event.name == "pause" for event in custom_events)
+    observed = await _observe(adapter, input_payload)
 
-    message_chunks = [event for event in output_events if event.type == EventType.TEXT_MESSAGE_CONTENT]
-    assert any("Planner paused" in event.delta for event in message_chunks)
+    assert "pause" in observed.custom_names
+    assert any("Planner paused" in delta for delta in observed.deltas)
 
 
-@pytest.mark.asyncio
 async def test_penguiflow_adapter_emits_run_error() -> None:
-    class ErrorAgentWrapper(AgentWrapper):
-        async def initialize(self) -> None:
-            pass
-
-        async def shutdown(self) -> None:
-            pass
-
-        async def resume(
-            self,
-            resume_token: str,
-            *,
-            session_id: str,
-            user_input: str | None = None,
-            tool_context: Mapping[str, Any] | None = None,
-            event_consumer: Any = None,
-            trace_id_hint: str | None = None,
-            steering: Any = None,
-        ) -> ChatResult:
-            del steering
-            raise RuntimeError("resume not supported in ErrorAgentWrapper")
-
-        async def chat(
-            self,
-            query: str,
-            *,
-            session_id: str,
-            llm_context: Mapping[str, Any] | None = None,
-            tool_context: Mapping[str, Any] | None = None,
-            event_consumer: Any = None,
-            trace_id_hint: str | None = None,
-            steering: Any = None,
-        ) -> ChatResult:
-            del steering
-            raise RuntimeError("boom")
-
-    adapter = PenguiFlowAdapter(ErrorAgentWrapper())
-    input_payload = RunAgentInput(
-        thread_id="thread-3",
-        run_id="run-3",
-        messages=[{"id": "msg-1", "role": "user", "content": "Hi"}],
-        tools=[],
-        context=[],
-        state={},
-        forwarded_props={},
-    )
+    adapter = PenguiFlowAdapter(_ScriptedWrapper(error=RuntimeError("boom")))
+    input_payload = _INPUT.model_copy(update={"thread_id": "thread-3", "run_id": "run-3"})
 
-    events: list[Any] = []
+    # The adapter re-raises after RUN_ERROR, so keep draining until it does.
+    found_error = False
     with pytest.raises(RuntimeError):
         async for event in adapter.run(input_payload):
-            events.append(event)
+            if event.type == EventType.RUN_ERROR:
+                found_error = True
 
-    assert any(event.type == EventType.RUN_ERROR for event in events)
+    assert found_error
 
 
-@pytest.mark.asyncio
-async def test_penguiflow_adapter_registers_foreground_task_when_session_manager_provided() -> None:
+async def test_penguiflow_adapter_registers_foreground_task_when_session_manager_provided(
+    adapter_factory: AdapterFactory,
+) -> None:
     class FakeRegistry:
         def __init__(self) -> None:
             self.created: list[dict[str, Any]] = []
@@ -470,21 +426,9 @@ async def test_penguiflow_adapter_registers_foreground_task_when_session_manager
             return self.sessions[session_id]
 
     session_manager = FakeSessionManager()
-    wrapper = FakeAgentWrapper([])
-    adapter = PenguiFlowAdapter(wrapper, session_manager=session_manager)
-
-    input_payload = RunAgentInput(
-        thread_id="thread-1",
-        run_id="run-1",
-        messages=[{"id": "msg-1", "role": "user", "content": "Hi"}],
-        tools=[],
-        context=[],
-        state={},
-        forwarded_props={"penguiflow": {"llm_context": {"tone": "test"}, "tool_context": {"tenant_id": "t1"}}},
-    )
+    adapter, wrapper = adapter_factory(session_manager=session_manager)
 
-    async for _event in adapter.run(input_payload):
-        pass
+    await _observe(adapter, _FORWARDED_INPUT)
 
     session = session_manager.sessions["thread-1"]
     assert session.context_updates == [{"llm_context": {"tone": "test"}, "tool_context": {"tenant_id": "t1"}}]
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import json
 from collections.abc import Callable, Mapping, Sequence
+from types import MappingProxyType
 from typing import Any
 
 import pytest
 from pydantic import BaseModel
 
-from penguiflow.catalog import build_catalog, tool
+from penguiflow.catalog import NodeSpec, build_catalog, tool
 from penguiflow.node import Node
 from penguiflow.planner import PlannerAction, ReactPlanner, ToolPolicy, Trajectory, TrajectoryStep
 from penguiflow.planner.react_runtime import _detect_deterministic_transition, _emit_auto_seq_detection_event
@@ -70,9 +71,69 @@ async def uppercase(args: UpperArgs, ctx: Any) -> UpperOut:
     return UpperOut(result=args.text.upper())
 
 
+@tool(desc="Echo with upper payload.", extra={"auto_seq": False})
+async def echo_upper(args: EchoArgs, ctx: Any) -> UpperArgs:
+    _ = ctx
+    return UpperArgs(text=args.text)
+
+
+@tool(desc="Uppercase text (no auto-exec).", extra={"auto_seq": True})
+async def uppercase_no_exec(args: UpperArgs, ctx: Any) -> UpperOut:
+    _ = ctx
+    return UpperOut(result=args.text.upper())
+
+
+@tool(desc="No-op tool.", extra={"auto_seq": True, "auto_seq_execute": True})
+async def noop(args: NoOpArgs, ctx: Any) -> NoOpOut:
+    _ = ctx
+    return NoOpOut(ok=args.ok)
+
+
+# name -> (tool, args model, out model); catalogs are built from subsets of this table.
+_TOOLS: dict[str, tuple[Any, type[BaseModel], type[BaseModel]]] = {
+    "echo": (echo, EchoArgs, EchoOut),
+    "shout": (shout, EchoArgs, EchoOut),
+    "count_items": (count_items, CountArgs, CountOut),
+    "uppercase": (uppercase, UpperArgs, UpperOut),
+    "echo_upper": (echo_upper, EchoArgs, UpperArgs),
+    "uppercase_no_exec": (uppercase_no_exec, UpperArgs, UpperOut),
+    "noop": (noop, NoOpArgs, NoOpOut),
+}
+
+CatalogFor = Callable[..., list[NodeSpec]]
+
+
+@pytest.fixture(scope="session")
+def shared_registry() -> ModelRegistry:
+    """Register every tool model once; catalogs pick the subset they need."""
+    registry = ModelRegistry()
+    for name, (_, args_model, out_model) in _TOOLS.items():
+        registry.register(name, args_model, out_model)
+    return registry
+
+
+@pytest.fixture(scope="module")
+def catalog_for(shared_registry: ModelRegistry) -> CatalogFor:
+    """Build each distinct node-set catalog once per module."""
+    cache: dict[tuple[str, ...], list[NodeSpec]] = {}
+
+    def _catalog_for(*names: str) -> list[NodeSpec]:
+        catalog = cache.get(names)
+        if catalog is None:
+            catalog = build_catalog([Node(_TOOLS[name][0], name=name) for name in names], shared_registry)
+            cache[names] = catalog
+        return catalog
+
+    return _catalog_for
+
+
+# Serialized once; every planner run in this module ends with the same finish action.
+_FINISH_RESPONSE = json.dumps({"thought": "finish", "next_node": None, "args": {"raw_answer": "done"}})
+
+
 class StubClient:
-    def __init__(self, responses: list[Mapping[str, object]]) -> None:
-        self._responses = [json.dumps(item) for item in responses]
+    def __init__(self, responses: list[Mapping[str, object] | str]) -> None:
+        self._responses = [item if isinstance(item, str) else json.dumps(item) for item in responses]
         self.calls: list[list[Mapping[str, str]]] = []
 
     async def complete(
@@ -90,86 +151,101 @@ class StubClient:
         return self._responses.pop(0), 0.0
 
 
-def _build_planner(nodes: list[Node], *, event_callback: Any | None = None) -> ReactPlanner:
-    registry = ModelRegistry()
-    for node in nodes:
-        node_name = node.name or node.func.__name__
-        if node_name == "echo" or node_name == "shout":
-            registry.register(node_name, EchoArgs, EchoOut)
-        elif node_name == "count_items":
-            registry.register(node_name, CountArgs, CountOut)
-        elif node_name == "uppercase":
-            registry.register(node_name, UpperArgs, UpperOut)
-    catalog = build_catalog(nodes, registry)
+def _build_planner(catalog: list[NodeSpec], *, event_callback: Any | None = None) -> ReactPlanner:
     return ReactPlanner(llm="stub-llm", catalog=catalog, event_callback=event_callback)
 
 
-def _trajectory_with_step(action: PlannerAction, observation: Any) -> Trajectory:
-    trajectory = Trajectory(query="test")
-    trajectory.steps.append(TrajectoryStep(action=action, observation=observation))
-    return trajectory
-
-
-def test_auto_seq_detector_skips_non_mapping_observation() -> None:
-    planner = _build_planner([Node(echo, name="echo")])
-    trajectory = _trajectory_with_step(PlannerAction(next_node="echo"), observation="raw text")
-
-    result = _detect_deterministic_transition(planner, trajectory)
-
-    assert result.status == "skipped"
-    assert result.reason == "non_structured_observation"
-
-
-def test_auto_seq_detector_skips_after_parallel_action() -> None:
-    planner = _build_planner([Node(echo, name="echo")])
-    trajectory = _trajectory_with_step(
-        PlannerAction(next_node="parallel", args={"steps": []}),
-        observation={"text": "hello"},
-    )
-
-    result = _detect_deterministic_transition(planner, trajectory)
+# Every end-to-end test runs with auto-seq on; tests override individual flags as needed.
+_DEFAULT_PLANNER_KW: Mapping[str, Any] = MappingProxyType({"auto_seq_enabled": True, "auto_seq_execute": True})
 
-    assert result.status == "skipped"
-    assert result.reason == "previous_step_parallel"
 
-
-def test_auto_seq_detector_returns_none_when_no_candidates() -> None:
-    planner = _build_planner([Node(count_items, name="count_items")])
-    trajectory = _trajectory_with_step(
-        PlannerAction(next_node="count_items"),
-        observation={"count": 3},
+def _make_planner(events: list[Any], client: StubClient, catalog: list[NodeSpec], **overrides: Any) -> ReactPlanner:
+    return ReactPlanner(
+        llm_client=client,
+        catalog=catalog,
+        event_callback=events.append,
+        **{**_DEFAULT_PLANNER_KW, **overrides},
     )
 
-    result = _detect_deterministic_transition(planner, trajectory)
-
-    assert result.status == "none"
-
 
-def test_auto_seq_detector_returns_ambiguous_when_multiple_candidates() -> None:
-    planner = _build_planner([Node(echo, name="echo"), Node(shout, name="shout")])
-    trajectory = _trajectory_with_step(PlannerAction(next_node="echo"), observation={"text": "hi"})
-
-    result = _detect_deterministic_transition(planner, trajectory)
-
-    assert result.status == "ambiguous"
-    assert set(result.candidates or []) == {"echo", "shout"}
+def _trajectory_with_step(action: PlannerAction, observation: Any) -> Trajectory:
+    trajectory = Trajectory(query="test")
+    trajectory.steps.append(TrajectoryStep(action=action, observation=observation))
+    return trajectory
 
 
-def test_auto_seq_detector_returns_unique_action_with_validated_args() -> None:
-    planner = _build_planner([Node(echo, name="echo"), Node(count_items, name="count_items")])
-    trajectory = _trajectory_with_step(PlannerAction(next_node="echo"), observation={"text": "hey"})
+@pytest.mark.parametrize(
+    ("node_names", "action", "observation", "expected_status", "expected_reason"),
+    [
+        pytest.param(
+            ("echo",),
+            PlannerAction(next_node="echo"),
+            "raw text",
+            "skipped",
+            "non_structured_observation",
+            id="skips_non_mapping_observation",
+        ),
+        pytest.param(
+            ("echo",),
+            PlannerAction(next_node="parallel", args={"steps": []}),
+            {"text": "hello"},
+            "skipped",
+            "previous_step_parallel",
+            id="skips_after_parallel_action",
+        ),
+        pytest.param(
+            ("count_items",),
+            PlannerAction(next_node="count_items"),
+            {"count": 3},
+            "none",
+            None,
+            id="none_when_no_candidates",
+        ),
+        pytest.param(
+            ("echo", "shout"),
+            PlannerAction(next_node="echo"),
+            {"text": "hi"},
+            "ambiguous",
+            None,
+            id="ambiguous_when_multiple_candidates",
+        ),
+        pytest.param(
+            ("echo", "count_items"),
+            PlannerAction(next_node="echo"),
+            {"text": "hey"},
+            "unique",
+            None,
+            id="unique_action_with_validated_args",
+        ),
+    ],
+)
+def test_auto_seq_detector(
+    catalog_for: CatalogFor,
+    node_names: tuple[str, ...],
+    action: PlannerAction,
+    observation: Any,
+    expected_status: str,
+    expected_reason: str | None,
+) -> None:
+    planner = _build_planner(catalog_for(*node_names))
+    trajectory = _trajectory_with_step(action, observation=observation)
 
     result = _detect_deterministic_transition(planner, trajectory)
 
-    assert result.status == "unique"
-    assert result.selected_action is not None
-    assert result.selected_action.next_node == "echo"
-    assert result.selected_action.args == {"text": "hey"}
+    assert result.status == expected_status
+    if expected_reason is not None:
+        assert result.reason == expected_reason
+    if expected_status == "ambiguous":
+        assert set(result.candidates or []) == set(node_names)
+    if expected_status == "unique":
+        assert result.selected_action is not None
+        assert result.selected_action.next_node == "echo"
+        assert result.selected_action.args == {"text": "hey"}
 
 
-def test_auto_seq_emits_unique_detection_event() -> None:
+def test_auto_seq_emits_unique_detection_event(catalog_for: CatalogFor) -> None:
     events: list[Any] = []
-    planner = _build_planner([Node(echo, name="echo")], event_callback=events.append)
+    planner = _build_planner(catalog_for("echo"), event_callback=events.append)
     trajectory = _trajectory_with_step(PlannerAction(next_node="echo"), observation={"text": "hey"})
 
     result = _detect_deterministic_transition(planner, trajectory)
@@ -184,12 +260,9 @@ def test_auto_seq_emits_unique_detection_event() -> None:
     assert "payload" not in event.extra
 
 
-def test_auto_seq_emits_ambiguous_detection_event_with_tool_names() -> None:
+def test_auto_seq_emits_ambiguous_detection_event_with_tool_names(catalog_for: CatalogFor) -> None:
     events: list[Any] = []
-    planner = _build_planner(
-        [Node(echo, name="echo"), Node(shout, name="shout")],
-        event_callback=events.append,
-    )
+    planner = _build_planner(catalog_for("echo", "shout"), event_callback=events.append)
     trajectory = _trajectory_with_step(PlannerAction(next_node="echo"), observation={"text": "hi"})
 
     result = _detect_deterministic_transition(planner, trajectory)
@@ -202,27 +275,17 @@ def test_auto_seq_emits_ambiguous_detection_event_with_tool_names() -> None:
     assert set(event.extra.get("candidates", [])) == {"echo", "shout"}
 
 
-@pytest.mark.asyncio()
-async def test_auto_seq_detection_does_not_reduce_llm_calls_when_auto_exec_disabled() -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_auto_seq_detection_does_not_reduce_llm_calls_when_auto_exec_disabled(catalog_for: CatalogFor) -> None:
     events: list[Any] = []
     client = StubClient(
         [
             {"thought": "echo", "next_node": "echo", "args": {"text": "first"}},
             {"thought": "count", "next_node": "count_items", "args": {"count": 1}},
-            {"thought": "finish", "next_node": None, "args": {"raw_answer": "done"}},
+            _FINISH_RESPONSE,
         ]
     )
-    registry = ModelRegistry()
-    registry.register("echo", EchoArgs, EchoOut)
-    registry.register("count_items", CountArgs, CountOut)
-    catalog = build_catalog([Node(echo, name="echo"), Node(count_items, name="count_items")], registry)
-    planner = ReactPlanner(
-        llm_client=client,
-        catalog=catalog,
-        event_callback=events.append,
-        auto_seq_enabled=True,
-        auto_seq_execute=False,
-    )
+    planner = _make_planner(events, client, catalog_for("echo", "count_items"), auto_seq_execute=False)
 
     await planner.run("Test auto-seq detection")
 
@@ -236,32 +299,16 @@ async def test_auto_seq_detection_does_not_reduce_llm_calls_when_auto_exec_disab
     assert detection_events
 
 
-@tool(desc="Echo with upper payload.", extra={"auto_seq": False})
-async def echo_upper(args: EchoArgs, ctx: Any) -> UpperArgs:
-    _ = ctx
-    return UpperArgs(text=args.text)
-
-
-@pytest.mark.asyncio()
-async def test_auto_seq_auto_exec_reduces_llm_calls_by_one() -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_auto_seq_auto_exec_reduces_llm_calls_by_one(catalog_for: CatalogFor) -> None:
     events: list[Any] = []
     client = StubClient(
         [
             {"thought": "echo", "next_node": "echo_upper", "args": {"text": "hi"}},
-            {"thought": "finish", "next_node": None, "args": {"raw_answer": "done"}},
+            _FINISH_RESPONSE,
         ]
     )
-    registry = ModelRegistry()
-    registry.register("echo_upper", EchoArgs, UpperArgs)
-    registry.register("uppercase", UpperArgs, UpperOut)
-    catalog = build_catalog([Node(echo_upper, name="echo_upper"), Node(uppercase, name="uppercase")], registry)
-    planner = ReactPlanner(
-        llm_client=client,
-        catalog=catalog,
-        event_callback=events.append,
-        auto_seq_enabled=True,
-        auto_seq_execute=True,
-    )
+    planner = _make_planner(events, client, catalog_for("echo_upper", "uppercase"))
 
     await planner.run("Test auto-exec")
 
@@ -271,42 +318,17 @@ async def test_auto_seq_auto_exec_reduces_llm_calls_by_one() -> None:
     assert any(event.event_type == "auto_seq_executed" for event in events)
 
 
-@tool(desc="Uppercase text (no auto-exec).", extra={"auto_seq": True})
-async def uppercase_no_exec(args: UpperArgs, ctx: Any) -> UpperOut:
-    _ = ctx
-    return UpperOut(result=args.text.upper())
-
-
-@tool(desc="No-op tool.", extra={"auto_seq": True, "auto_seq_execute": True})
-async def noop(args: NoOpArgs, ctx: Any) -> NoOpOut:
-    _ = ctx
-    return NoOpOut(ok=args.ok)
-
-
-@pytest.mark.asyncio()
-async def test_auto_seq_auto_exec_requires_tool_opt_in() -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_auto_seq_auto_exec_requires_tool_opt_in(catalog_for: CatalogFor) -> None:
     events: list[Any] = []
     client = StubClient(
         [
             {"thought": "echo", "next_node": "echo_upper", "args": {"text": "hi"}},
             {"thought": "uppercase", "next_node": "uppercase_no_exec", "args": {"text": "hi"}},
-            {"thought": "finish", "next_node": None, "args": {"raw_answer": "done"}},
+            _FINISH_RESPONSE,
         ]
     )
-    registry = ModelRegistry()
-    registry.register("echo_upper", EchoArgs, UpperArgs)
-    registry.register("uppercase_no_exec", UpperArgs, UpperOut)
-    catalog = build_catalog(
-        [Node(echo_upper, name="echo_upper"), Node(uppercase_no_exec, name="uppercase_no_exec")],
-        registry,
-    )
-    planner = ReactPlanner(
-        llm_client=client,
-        catalog=catalog,
-        event_callback=events.append,
-        auto_seq_enabled=True,
-        auto_seq_execute=True,
-    )
+    planner = _make_planner(events, client, catalog_for("echo_upper", "uppercase_no_exec"))
 
     await planner.run("Test auto-exec tool opt-in")
 
@@ -314,25 +336,16 @@ async def test_auto_seq_auto_exec_requires_tool_opt_in() -> None:
     assert not any(event.event_type == "auto_seq_executed" for event in events)
 
 
-@pytest.mark.asyncio()
-async def test_auto_seq_respects_tool_visibility_scope() -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_auto_seq_respects_tool_visibility_scope(catalog_for: CatalogFor) -> None:
     events: list[Any] = []
     client = StubClient(
         [
             {"thought": "noop", "next_node": "noop", "args": {"ok": True}},
-            {"thought": "finish", "next_node": None, "args": {"raw_answer": "done"}},
+            _FINISH_RESPONSE,
         ]
     )
-    registry = ModelRegistry()
-    registry.register("noop", NoOpArgs, NoOpOut)
-    catalog = build_catalog([Node(noop, name="noop")], registry)
-    planner = ReactPlanner(
-        llm_client=client,
-        catalog=catalog,
-        event_callback=events.append,
-        auto_seq_enabled=True,
-        auto_seq_execute=True,
-    )
+    planner = _make_planner(events, client, catalog_for("noop"))
 
     class HideAllTools:
         def visible_tools(self, specs: Sequence[Any], tool_context: Mapping[str, Any]) -> Sequence[Any]:
@@ -345,50 +358,31 @@ async def test_auto_seq_respects_tool_visibility_scope() -> None:
     assert not any(event.event_type == "auto_seq_executed" for event in events)
 
 
-@pytest.mark.asyncio()
-async def test_auto_seq_respects_tool_policy_filtering() -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_auto_seq_respects_tool_policy_filtering(catalog_for: CatalogFor) -> None:
     events: list[Any] = []
     client = StubClient(
         [
             {"thought": "noop", "next_node": "noop", "args": {"ok": True}},
-            {"thought": "finish", "next_node": None, "args": {"raw_answer": "done"}},
+            _FINISH_RESPONSE,
         ]
     )
-    registry = ModelRegistry()
-    registry.register("noop", NoOpArgs, NoOpOut)
-    catalog = build_catalog([Node(noop, name="noop")], registry)
-    planner = ReactPlanner(
-        llm_client=client,
-        catalog=catalog,
-        event_callback=events.append,
-        auto_seq_enabled=True,
-        auto_seq_execute=True,
-        tool_policy=ToolPolicy(denied_tools={"noop"}),
-    )
+    planner = _make_planner(events, client, catalog_for("noop"), tool_policy=ToolPolicy(denied_tools={"noop"}))
 
     await planner.run("Test tool policy")
 
     assert not any(event.event_type == "auto_seq_executed" for event in events)
 
 
-@pytest.mark.asyncio()
-async def test_auto_seq_skips_when_pending_actions_present() -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_auto_seq_skips_when_pending_actions_present(catalog_for: CatalogFor) -> None:
     events: list[Any] = []
     client = StubClient(
         [
-            {"thought": "finish", "next_node": None, "args": {"raw_answer": "done"}},
+            _FINISH_RESPONSE,
         ]
     )
-    registry = ModelRegistry()
-    registry.register("noop", NoOpArgs, NoOpOut)
-    catalog = build_catalog([Node(noop, name="noop")], registry)
-    planner = ReactPlanner(
-        llm_client=client,
-        catalog=catalog,
-        event_callback=events.append,
-        auto_seq_enabled=True,
-        auto_seq_execute=True,
-    )
+    planner = _make_planner(events, client, catalog_for("noop"))
     trajectory = Trajectory(query="Test pending")
     trajectory.metadata["pending_actions"] = [{"next_node": "noop", "args": {"ok": True}}]
     trajectory.steps.append(TrajectoryStep(action=PlannerAction(next_node="noop"), observation={"ok": True}))
@@ -399,24 +393,15 @@ async def test_auto_seq_skips_when_pending_actions_present() -> None:
     assert not any(event.event_type == "auto_seq_executed" for event in events)
 
 
-@pytest.mark.asyncio()
-async def test_auto_seq_never_auto_executes_after_parallel() -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_auto_seq_never_auto_executes_after_parallel(catalog_for: CatalogFor) -> None:
     events: list[Any] = []
     client = StubClient(
         [
-            {"thought": "finish", "next_node": None, "args": {"raw_answer": "done"}},
+            _FINISH_RESPONSE,
         ]
     )
-    registry = ModelRegistry()
-    registry.register("noop", NoOpArgs, NoOpOut)
-    catalog = build_catalog([Node(noop, name="noop")], registry)
-    planner = ReactPlanner(
-        llm_client=client,
-        catalog=catalog,
-        event_callback=events.append,
-        auto_seq_enabled=True,
-        auto_seq_execute=True,
-    )
+    planner = _make_planner(events, client, catalog_for("noop"))
     trajectory = Trajectory(query="Test parallel")
     trajectory.steps.append(
         TrajectoryStep(
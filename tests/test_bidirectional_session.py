@@ -5,6 +5,8 @@ import asyncio
 import pytest
 
 from penguiflow.sessions import StreamingSession, TaskResult, TaskType, UpdateType
+from penguiflow.sessions.models import StateUpdate
+from penguiflow.sessions.persistence import InMemorySessionStateStore
 from penguiflow.steering import SteeringEvent, SteeringEventType
 
 
@@ -52,3 +54,29 @@ async def test_control_policy_requires_confirmation() -> None:
     )
     accepted = await session.steer(event)
     assert accepted is False
+
+
+@pytest.mark.asyncio
+async def test_session_persists_published_updates_in_order_through_single_writer() -> None:
+    saved: list[str] = []
+
+    class _Store(InMemorySessionStateStore):
+        async def save_update(self, update: StateUpdate) -> None:
+            if update.content == {"n": 1}:
+                raise RuntimeError("boom")
+            saved.append(update.update_id)
+            await super().save_update(update)
+
+    session = StreamingSession("session-persist", state_store=_Store())
+    published = [
+        StateUpdate(session_id="session-persist", task_id="t", update_type=UpdateType.THINKING, content={"n": n})
+        for n in range(5)
+    ]
+    for update in published:
+        session._publish(update)  # noqa: SLF001 - exercising the publish path directly
+
+    # close() waits for the writer to flush everything that was published.
+    await session.close()
+
+    # A failing save is logged and skipped without stopping the writer.
+    assert saved == [u.update_id for u in published if u.content != {"n": 1}]
@@ -1,5 +1,3 @@
-import time
-
 import pytest
 
 from penguiflow import (
@@ -12,8 +10,13 @@ from penguiflow import (
     create,
 )
 
+# Share one event loop across the module; these tests do not depend on a fresh loop.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Epoch timestamp that is always in the past; avoids coupling tests to the wall clock.
+_EXPIRED_DEADLINE_S = 1.0
+
 
-@pytest.mark.asyncio
 async def test_deadline_prevents_node_execution() -> None:
     calls = 0
 
@@ -29,7 +32,7 @@ async def test_deadline_prevents_node_execution() -> None:
     expired_message = Message(
         payload=WM(query="q"),
         headers=Headers(tenant="acme"),
-        deadline_s=time.time() - 0.1,
+        deadline_s=_EXPIRED_DEADLINE_S,
     )
 
     await flow.emit(expired_message)
@@ -44,7 +47,6 @@ async def test_deadline_prevents_node_execution() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
 async def test_deadline_finalizes_when_first_node_has_successors() -> None:
     ingress_calls = 0
 
@@ -70,7 +72,7 @@ async def test_deadline_finalizes_when_first_node_has_successors() -> None:
     expired = Message(
         payload=WM(query="q"),
         headers=Headers(tenant="acme"),
-        deadline_s=time.time() - 1,
+        deadline_s=_EXPIRED_DEADLINE_S,
     )
 
     await flow.emit(expired)
@@ -85,7 +87,6 @@ async def test_deadline_finalizes_when_first_node_has_successors() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
 async def test_controller_enforces_token_budget() -> None:
     async def controller(msg: Message, ctx) -> Message:
         wm = msg.payload
@@ -117,7 +118,6 @@ async def test_controller_enforces_token_budget() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
 async def test_controller_allows_unbounded_when_budget_disabled() -> None:
     async def controller(msg: Message, ctx) -> Message:
         wm = msg.payload
@@ -1,5 +1,4 @@
 import asyncio
-from collections import Counter
 from typing import Any
 
 import pytest
@@ -7,25 +6,41 @@ import pytest
 from penguiflow import Headers, Message, Node, NodePolicy, create
 from penguiflow.metrics import FlowEvent
 
+# Share one event loop across the module; these tests do not depend on a fresh loop.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
-@pytest.mark.asyncio
 async def test_cancel_trace_stops_inflight_run_without_affecting_others() -> None:
     release = asyncio.Event()
-    slow_started = asyncio.Event()
-    cancelled_flag = asyncio.Event()
-    cancel_started = asyncio.Event()
-    cancel_finished = asyncio.Event()
+    # One condition guards every barrier flag so each transition is a single notify.
+    barrier = asyncio.Condition()
+    state = {
+        "slow_started": False,
+        "cancelled": False,
+        "cancel_started": False,
+        "cancel_finished": False,
+    }
     processed: list[str] = []
-    cancel_events: Counter[str] = Counter()
+    cancel_starts = 0
+    cancel_finishes = 0
     payloads: dict[str, dict[str, object]] = {}
 
+    async def mark(flag: str) -> None:
+        async with barrier:
+            state[flag] = True
+            barrier.notify_all()
+
+    async def wait_for_flags(*flags: str) -> None:
+        async with barrier:
+            await barrier.wait_for(lambda: all(state[flag] for flag in flags))
+
     async def slow(message: Message, _ctx) -> Message:
         if message.payload == "cancel-me":
-            slow_started.set()
+            await mark("slow_started")
             try:
                 await release.wait()
             except asyncio.CancelledError:
-                cancelled_flag.set()
+                await mark("cancelled")
                 raise
         return message
 
@@ -39,14 +54,15 @@ async def test_cancel_trace_stops_inflight_run_without_affecting_others() -> Non
     flow = create(slow_node.to(sink_node))
 
     async def recorder(event: FlowEvent) -> None:
-        payload = event.to_payload()
+        nonlocal cancel_starts, cancel_finishes
         if event.event_type == "trace_cancel_start":
-            cancel_started.set()
-        if event.event_type == "trace_cancel_finish":
-            cancel_finished.set()
-        if event.event_type.startswith("trace_cancel"):
-            cancel_events[event.event_type] += 1
-            payloads[event.event_type] = payload
+            cancel_starts += 1
+            payloads[event.event_type] = event.to_payload()
+            await mark("cancel_started")
+        elif event.event_type == "trace_cancel_finish":
+            cancel_finishes += 1
+            payloads[event.event_type] = event.to_payload()
+            await mark("cancel_finished")
 
     flow.add_middleware(recorder)
     flow.run()
@@ -56,23 +72,22 @@ async def test_cancel_trace_stops_inflight_run_without_affecting_others() -> Non
     other_msg = Message(payload="other", headers=headers)
 
     await flow.emit(cancel_msg)
-    await slow_started.wait()
+    await wait_for_flags("slow_started")
     await flow.emit(other_msg)
 
     assert await flow.cancel(cancel_msg.trace_id) is True
 
-    await cancel_started.wait()
-    await cancelled_flag.wait()
+    await asyncio.wait_for(
+        wait_for_flags("slow_started", "cancelled", "cancel_started", "cancel_finished"),
+        timeout=2.0,
+    )
 
     result = await flow.fetch()
     assert result == "other"
 
-    await cancel_finished.wait()
-
     assert processed == ["other"]
-    assert cancel_events == Counter(
-        {"trace_cancel_start": 1, "trace_cancel_finish": 1}
-    )
+    assert cancel_starts == 1
+    assert cancel_finishes == 1
 
     start_payload = payloads["trace_cancel_start"]
     finish_payload = payloads["trace_cancel_finish"]
@@ -92,7 +107,6 @@ async def test_cancel_trace_stops_inflight_run_without_affecting_others() -> Non
     await flow.stop()
 
 
-@pytest.mark.asyncio
 async def test_cancel_propagates_to_subflow() -> None:
     started = asyncio.Event()
     sub_cancelled = asyncio.Event()
@@ -154,7 +168,6 @@ async def test_cancel_propagates_to_subflow() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
 async def test_cancel_unknown_trace_returns_false() -> None:
     async def passthrough(message: Message, _ctx) -> Message:
         return message
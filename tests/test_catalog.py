@@ -1,58 +1,39 @@
 from __future__ import annotations
 
-import json
+from collections.abc import Callable, Sequence
 
 import pytest
-from pydantic import BaseModel
 
-from penguiflow.catalog import build_catalog, tool
+from penguiflow.catalog import NodeSpec
 from penguiflow.node import Node
 from penguiflow.registry import ModelRegistry
 
+from ._tool_fixtures import EchoArgs, EchoOut, describe, echo, echo_with_examples
 
-class EchoArgs(BaseModel):
-    message: str
+# Shared node instances let cached_build_catalog reuse specs across tests and reruns.
+_ECHO_NODE = Node(echo, name="echo")
+_DESCRIBE_NODE = Node(describe, name="describe")
+_EXAMPLES_NODE = Node(echo_with_examples, name="echo_with_examples")
 
+CatalogBuilder = Callable[[Sequence[Node], ModelRegistry], list[NodeSpec]]
 
-class EchoOut(BaseModel):
-    echoed: str
 
-
-@tool(desc="Echo a message", tags=["utility", "utility"], side_effects="read")
-async def echo(args: EchoArgs, ctx: object) -> EchoOut:
-    """Echo helper."""
-
-    return EchoOut(echoed=args.message)
-
-
-async def describe(args: EchoArgs, ctx: object) -> EchoOut:
-    """Describe the payload."""
-
-    return EchoOut(echoed=f"desc:{args.message}")
-
-
-@tool(
-    desc="Echo with examples",
-    examples=[
-        {"args": {"message": "hello"}, "description": "Basic echo", "tags": ["minimal"]},
-        {"args": {"message": "hi"}, "description": "Short input", "tags": ["common"]},
-    ],
-)
-async def echo_with_examples(args: EchoArgs, ctx: object) -> EchoOut:
-    return EchoOut(echoed=args.message)
-
-
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def registry() -> ModelRegistry:
     reg = ModelRegistry()
     reg.register("echo", EchoArgs, EchoOut)
     reg.register("describe", EchoArgs, EchoOut)
+    reg.register("echo_with_examples", EchoArgs, EchoOut)
     return reg
 
 
-def test_build_catalog_uses_metadata(registry: ModelRegistry) -> None:
-    node = Node(echo, name="echo")
-    specs = build_catalog([node], registry)
+@pytest.fixture(scope="module")
+def echo_specs(registry: ModelRegistry, cached_build_catalog: CatalogBuilder) -> list[NodeSpec]:
+    return cached_build_catalog([_ECHO_NODE], registry)
+
+
+def test_build_catalog_uses_metadata(echo_specs: list[NodeSpec]) -> None:
+    specs = echo_specs
     assert len(specs) == 1
     spec = specs[0]
     assert spec.name == "echo"
@@ -61,22 +42,18 @@ def test_build_catalog_uses_metadata(registry: ModelRegistry) -> None:
     assert spec.tags == ("utility",)
     record = spec.to_tool_record()
     assert record["args_schema"]["title"] == "EchoArgs"
-    assert json.loads(json.dumps(record["out_schema"]))["title"] == "EchoOut"
+    assert record["out_schema"]["title"] == "EchoOut"
 
 
-def test_build_catalog_falls_back_to_docstring(registry: ModelRegistry) -> None:
-    node = Node(describe, name="describe")
-    specs = build_catalog([node], registry)
+def test_build_catalog_falls_back_to_docstring(registry: ModelRegistry, cached_build_catalog: CatalogBuilder) -> None:
+    specs = cached_build_catalog([_DESCRIBE_NODE], registry)
     spec = specs[0]
     assert spec.desc == "Describe the payload."
     assert spec.side_effects == "pure"
 
 
-def test_build_catalog_includes_tool_examples() -> None:
-    registry = ModelRegistry()
-    registry.register("echo_with_examples", EchoArgs, EchoOut)
-    node = Node(echo_with_examples, name="echo_with_examples")
-    specs = build_catalog([node], registry)
+def test_build_catalog_includes_tool_examples(registry: ModelRegistry, cached_build_catalog: CatalogBuilder) -> None:
+    specs = cached_build_catalog([_EXAMPLES_NODE], registry)
     spec = specs[0]
     record = spec.to_tool_record()
     assert record["examples"][0]["args"] == {"message": "hello"}
@@ -1,13 +1,36 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+
 import pytest
+import pytest_asyncio
 
 from penguiflow.sessions import ContextPatch, MergeStrategy, StreamingSession
 
+# The shared session's queues bind to the first loop that uses them, so the module shares one loop.
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
-@pytest.mark.asyncio
-async def test_human_gated_merge_creates_pending_patch() -> None:
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_session() -> AsyncIterator[StreamingSession]:
     session = StreamingSession("session-merge")
+    yield session
+    await session.close()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def session(shared_session: StreamingSession) -> StreamingSession:
+    """Hand out the shared session with its merge state reset through the public API."""
+    for patch_id in list(shared_session.pending_patches):
+        await shared_session.apply_pending_patch(patch_id=patch_id)
+    await shared_session.mark_background_consumed(task_ids=list(shared_session.get_background_results()))
+    shared_session.update_context(llm_context={}, tool_context={})
+    assert not shared_session.pending_patches
+    assert not shared_session.get_background_results()
+    return shared_session
+
+
+async def test_human_gated_merge_creates_pending_patch(session: StreamingSession) -> None:
     session.update_context(llm_context={"state": "v1"})
     patch = ContextPatch(
         task_id="task-1",
@@ -21,9 +44,7 @@ async def test_human_gated_merge_creates_pending_patch() -> None:
     assert pending.patch.context_diverged is True
 
 
-@pytest.mark.asyncio
-async def test_apply_pending_patch_updates_context() -> None:
-    session = StreamingSession("session-merge-apply")
+async def test_apply_pending_patch_updates_context(session: StreamingSession) -> None:
     patch = ContextPatch(
         task_id="task-2",
         digest=["summary"],
@@ -38,9 +59,7 @@ async def test_apply_pending_patch_updates_context() -> None:
     assert "background_results" not in llm_context
 
 
-@pytest.mark.asyncio
-async def test_mark_background_consumed_removes_entries() -> None:
-    session = StreamingSession("session-merge-consume")
+async def test_mark_background_consumed_removes_entries(session: StreamingSession) -> None:
     append_patch = ContextPatch(task_id="task-append", digest=["summary"])
     replace_patch = ContextPatch(task_id="task-replace", digest=["latest"])
     await session.apply_context_patch(patch=append_patch, strategy=MergeStrategy.APPEND)
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 import pytest
+import pytest_asyncio
 
 from penguiflow import (
     WM,
@@ -15,106 +17,74 @@ from penguiflow import (
     Message,
     Node,
     NodePolicy,
+    PenguiFlow,
     call_playbook,
     create,
 )
 from penguiflow.core import TraceCancelled
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.mark.asyncio
-async def test_controller_loops_until_final_answer() -> None:
-    async def controller(msg: Message, ctx) -> Message:
-        wm = msg.payload
-        if isinstance(wm, WM) and wm.hops >= 2:
-            final = FinalAnswer(text=f"done@{wm.hops}")
-            return msg.model_copy(update={"payload": final})
-        return msg
 
-    controller_node = Node(
-        controller,
-        name="controller",
-        allow_cycle=True,
-        policy=NodePolicy(validate="none"),
-    )
+def _msg(payload: Any, *, tenant: str = "acme", **fields: Any) -> Message:
+    """Build a trusted fixture message without re-validating hand-written literals."""
+    return Message.model_construct(payload=payload, headers=Headers.model_construct(tenant=tenant), **fields)
 
-    flow = create(controller_node.to(controller_node))
-    flow.run()
 
-    wm = WM(query="q", budget_hops=4)
-    message = Message(payload=wm, headers=Headers(tenant="acme"))
+async def _controller(msg: Message, ctx) -> Message:
+    wm = msg.payload
+    if isinstance(wm, WM) and wm.hops >= 2:
+        final = FinalAnswer(text=f"done@{wm.hops}")
+        return msg.model_copy(update={"payload": final})
+    return msg
 
-    await flow.emit(message)
-    result = await flow.fetch()
-
-    assert isinstance(result, Message)
-    final = result.payload
-    assert isinstance(final, FinalAnswer)
-    assert final.text == "done@2"
-
-    await flow.stop()
-
-
-@pytest.mark.asyncio
-async def test_controller_enforces_hop_budget() -> None:
-    async def controller(msg: Message, ctx) -> Message:
-        return msg
 
+@pytest_asyncio.fixture(loop_scope="session")
+async def controller_flow() -> AsyncIterator[PenguiFlow]:
+    """Looping controller flow; each case gets its own so finished loops cannot leak into the next trace."""
     controller_node = Node(
-        controller,
+        _controller,
         name="controller",
         allow_cycle=True,
         policy=NodePolicy(validate="none"),
     )
-
     flow = create(controller_node.to(controller_node))
     flow.run()
-
-    wm = WM(query="q", budget_hops=1)
-    message = Message(payload=wm, headers=Headers(tenant="acme"))
-
-    await flow.emit(message)
-    result = await flow.fetch()
-
-    assert isinstance(result, Message)
-    final = result.payload
-    assert isinstance(final, FinalAnswer)
-    assert final.text == "Hop budget exhausted"
-
+    yield flow
     await flow.stop()
 
 
-@pytest.mark.asyncio
-async def test_controller_enforces_deadline() -> None:
-    async def controller(msg: Message, ctx) -> Message:
-        await asyncio.sleep(0.05)
-        return msg
-
-    controller_node = Node(
-        controller,
-        name="controller",
-        allow_cycle=True,
-        policy=NodePolicy(validate="none"),
-    )
-
-    flow = create(controller_node.to(controller_node))
-    flow.run()
-
-    deadline = time.time() + 0.02
-    wm = WM(query="q")
-    message = Message(payload=wm, headers=Headers(tenant="acme"), deadline_s=deadline)
-
-    await flow.emit(message)
-    result = await flow.fetch()
+@pytest.mark.parametrize(
+    ("budget_hops", "deadline_offset", "expected_text"),
+    [
+        pytest.param(4, None, "done@2", id="loops_until_final_answer"),
+        pytest.param(1, None, "Hop budget exhausted", id="enforces_hop_budget"),
+        # Already expired, so the deadline fires on the first hop without any wall-clock wait.
+        pytest.param(8, -1.0, "Deadline exceeded", id="enforces_deadline"),
+    ],
+)
+async def test_controller_terminates(
+    controller_flow: PenguiFlow,
+    budget_hops: int,
+    deadline_offset: float | None,
+    expected_text: str,
+) -> None:
+    wm = WM.model_construct(query="q", budget_hops=budget_hops)
+    if deadline_offset is None:
+        message = _msg(wm)
+    else:
+        # Left validated: the deadline case exercises deadline_s as a real Message field.
+        message = Message(payload=wm, headers=Headers(tenant="acme"), deadline_s=time.time() + deadline_offset)
+
+    await controller_flow.emit(message)
+    result = await controller_flow.fetch()
 
     assert isinstance(result, Message)
     final = result.payload
     assert isinstance(final, FinalAnswer)
-    assert final.text == "Deadline exceeded"
+    assert final.text == expected_text
 
-    await flow.stop()
 
-
-@pytest.mark.asyncio
 async def test_call_playbook_returns_payload_and_preserves_metadata() -> None:
     observed: dict[str, object] = {}
 
@@ -129,7 +99,7 @@ async def test_call_playbook_returns_payload_and_preserves_metadata() -> None:
         flow = create(retrieve_node.to())
         return flow, None
 
-    parent = Message(payload="doc", headers=Headers(tenant="acme"))
+    parent = _msg("doc")
 
     result = await call_playbook(playbook, parent)
 
@@ -138,7 +108,6 @@ async def test_call_playbook_returns_payload_and_preserves_metadata() -> None:
     assert observed["headers"] == parent.headers
 
 
-@pytest.mark.asyncio
 async def test_call_playbook_cancellation_stops_subflow() -> None:
     started = asyncio.Event()
     blocker = asyncio.Event()
@@ -155,7 +124,7 @@ async def test_call_playbook_cancellation_stops_subflow() -> None:
         flow_holder.append(flow)
         return flow, None
 
-    parent = Message(payload="task", headers=Headers(tenant="acme"))
+    parent = _msg("task")
 
     task = asyncio.create_task(call_playbook(playbook, parent))
     await started.wait()
@@ -172,7 +141,6 @@ async def test_call_playbook_cancellation_stops_subflow() -> None:
     assert not flow._tasks
 
 
-@pytest.mark.asyncio
 async def test_call_playbook_respects_pre_cancelled_trace() -> None:
     subflow_started = asyncio.Event()
     flow_holder: list[Any] = []
@@ -193,11 +161,7 @@ async def test_call_playbook_respects_pre_cancelled_trace() -> None:
     cancel_event.set()
     runtime._trace_events[trace_id] = cancel_event  # noqa: SLF001 test sets state
 
-    parent = Message(
-        payload="task",
-        headers=Headers(tenant="acme"),
-        trace_id=trace_id,
-    )
+    parent = _msg("task", trace_id=trace_id)
 
     with pytest.raises(TraceCancelled):
         await call_playbook(playbook, parent, runtime=runtime)
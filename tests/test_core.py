@@ -16,7 +16,7 @@ from penguiflow.registry import ModelRegistry
 from penguiflow.types import Headers, Message
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_pass_through_flow() -> None:
     async def shout(msg: str, ctx) -> str:
         return msg.upper()
@@ -34,7 +34,7 @@ async def test_pass_through_flow() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_trace_scoped_fetch_isolated_across_concurrent_traces() -> None:
     async def work(msg: Message, ctx) -> str:
         if msg.payload == "slow":
@@ -64,7 +64,7 @@ async def test_trace_scoped_fetch_isolated_across_concurrent_traces() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_trace_scoped_roundtrip_serializes_same_trace_id() -> None:
     async def work(msg: Message, ctx) -> str:
         return f"done:{msg.payload}"
@@ -110,7 +110,7 @@ async def test_trace_scoped_roundtrip_serializes_same_trace_id() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_fan_out_to_multiple_nodes() -> None:
     async def fan(msg: str, ctx) -> str:
         return msg
@@ -132,13 +132,14 @@ async def test_fan_out_to_multiple_nodes() -> None:
 
     await flow.emit("hop")
 
+    # Fetches stay sequential: fetch_any buffers surplus results, which a concurrent waiter would never see.
     results = {await flow.fetch() for _ in range(2)}
     assert results == {"left:hop", "right:hop"}
 
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_backpressure_blocks_when_queue_full() -> None:
     release = asyncio.Event()
     processed: list[str] = []
@@ -157,9 +158,13 @@ async def test_backpressure_blocks_when_queue_full() -> None:
     emit_two = asyncio.create_task(flow.emit("two"))
     emit_three = asyncio.create_task(flow.emit("three"))
 
-    await asyncio.sleep(0)
-    assert emit_two.done()
-    assert not emit_three.done()
+    done, pending = await asyncio.wait(
+        {emit_two, emit_three},
+        timeout=0,
+        return_when=asyncio.FIRST_COMPLETED,
+    )
+    assert emit_two in done
+    assert emit_three in pending
 
     release.set()
 
@@ -172,7 +177,7 @@ async def test_backpressure_blocks_when_queue_full() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_graceful_stop_cancels_nodes() -> None:
     started = asyncio.Event()
     cancelled = asyncio.Event()
@@ -212,7 +217,7 @@ def test_cycle_detection() -> None:
         )
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_retry_on_failure_logs_and_succeeds(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
@@ -252,7 +257,7 @@ async def test_retry_on_failure_logs_and_succeeds(
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_timeout_retries_and_drops_after_max(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
@@ -302,7 +307,7 @@ async def test_timeout_retries_and_drops_after_max(
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_middlewares_receive_events() -> None:
     events: list[tuple[str, int]] = []
 
@@ -328,7 +333,7 @@ async def test_middlewares_receive_events() -> None:
     assert "node_success" in events_names
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_run_with_registry_requires_registered_nodes() -> None:
     async def handler(msg: str, ctx) -> str:
         return msg
@@ -343,7 +348,7 @@ async def test_run_with_registry_requires_registered_nodes() -> None:
     assert "handler" in str(exc.value)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_run_with_registry_accepts_registered_nodes() -> None:
     class EchoModel(BaseModel):
         text: str
@@ -369,7 +374,7 @@ async def test_run_with_registry_accepts_registered_nodes() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_flow_run_twice_raises_error() -> None:
     """Running an already running flow should raise RuntimeError."""
 
@@ -386,7 +391,7 @@ async def test_flow_run_twice_raises_error() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_cycle_detection_without_allow_cycles() -> None:
     """Cycles should raise CycleError when not explicitly allowed."""
     from penguiflow import CycleError
@@ -405,7 +410,7 @@ async def test_cycle_detection_without_allow_cycles() -> None:
         create(a.to(b), b.to(a), allow_cycles=False)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_context_emit_to_unknown_target() -> None:
     """Emitting to an unknown target should raise KeyError."""
 
@@ -422,7 +427,7 @@ async def test_context_emit_to_unknown_target() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_context_fetch_from_nonexistent_source() -> None:
     """Fetching from a nonexistent source should raise appropriate error."""
 
@@ -439,7 +444,7 @@ async def test_context_fetch_from_nonexistent_source() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_timeout_with_retries() -> None:
     """Node timeout should trigger retries."""
     attempt_count = 0
@@ -463,7 +468,7 @@ async def test_timeout_with_retries() -> None:
     assert attempt_count == 2  # First attempt timed out, second succeeded
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_max_retries_exhausted() -> None:
     """Node should stop retrying after max_retries attempts."""
     attempt_count = 0
@@ -489,7 +494,7 @@ async def test_max_retries_exhausted() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_queue_full_backpressure() -> None:
     """Full queue should cause backpressure."""
     received = []
@@ -518,7 +523,7 @@ async def test_queue_full_backpressure() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_emit_nowait_queue_full() -> None:
     """emit_nowait should raise QueueFull when queue is full."""
 
@@ -539,7 +544,7 @@ async def test_emit_nowait_queue_full() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_fetch_nowait_queue_empty() -> None:
     """fetch_nowait should raise QueueEmpty when no messages available."""
 
@@ -561,7 +566,7 @@ async def test_fetch_nowait_queue_empty() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_message_to_message_warning_for_bare_payload() -> None:
     registry = ModelRegistry()
     registry.register("annotate", Message, Message)
@@ -585,7 +590,7 @@ async def test_message_to_message_warning_for_bare_payload() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_message_to_message_no_warning_when_envelope_preserved() -> None:
     registry = ModelRegistry()
     registry.register("annotate", Message, Message)
@@ -611,7 +616,7 @@ async def test_message_to_message_no_warning_when_envelope_preserved() -> None:
     await flow.stop()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_registry_missing_validation_nodes() -> None:
     """Flow should raise error when registry is missing required nodes."""
 
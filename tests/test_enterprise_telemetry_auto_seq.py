@@ -4,10 +4,12 @@ from examples.planner_enterprise_agent_v2.config import AgentConfig
 from examples.planner_enterprise_agent_v2.telemetry import AgentTelemetry
 from penguiflow.planner import PlannerEvent
 
+# AgentConfig is a frozen dataclass, so a single env parse can be shared safely.
+_CONFIG = AgentConfig.from_env()
+
 
 def test_agent_telemetry_counts_auto_seq_events() -> None:
-    config = AgentConfig.from_env()
-    telemetry = AgentTelemetry(config)
+    telemetry = AgentTelemetry(_CONFIG)
 
     telemetry.record_planner_event(
         PlannerEvent(
@@ -1,99 +1,83 @@
 from __future__ import annotations
 
-from pathlib import Path
+from collections.abc import Callable, Sequence
 
-from pydantic import BaseModel
+import pytest
 
-from penguiflow.catalog import build_catalog, tool
+from penguiflow.catalog import NodeSpec
 from penguiflow.node import Node
 from penguiflow.planner.tool_search_cache import ToolSearchCache
 from penguiflow.registry import ModelRegistry
 from penguiflow.skills.local_store import LocalSkillStore
 from penguiflow.skills.models import SkillDefinition
 
+from ._tool_fixtures import ChartArgs, ChartOut, DummyArgs, DummyOut, charting_tool, dummy_tool
 
-class _Args(BaseModel):
-    text: str
+_PUNCTUATED_QUERY = "Hey! I want an SOV comparison please!"
+_NAME_TOKEN_QUERY = "start_analysis charting"
+_UNRELATED_TOOL_QUERY = "completely_unrelated_query"
+_EXTRA_TERMS_QUERY = "sov_comparison overlap activity share audience"
+_UNRELATED_SKILL_QUERY = "unrelated_query"
 
 
-class _Out(BaseModel):
-    text: str
-
-
-@tool(desc="Dummy tool")
-async def dummy_tool(args: _Args, ctx):
-    del ctx
-    return _Out(text=args.text)
-
-
-def test_tool_search_fts_sanitizes_punctuation(tmp_path: Path) -> None:
+@pytest.fixture(scope="module")
+def tool_cache(
+    tmp_path_factory: pytest.TempPathFactory,
+    cached_build_catalog: Callable[[Sequence[Node], ModelRegistry], list[NodeSpec]],
+) -> ToolSearchCache:
+    """Index the tool catalog once; the tool search tests below only read from it."""
     registry = ModelRegistry()
-    registry.register("dummy_tool", _Args, _Out)
-    specs = build_catalog([Node(dummy_tool, name="dummy_tool")], registry)
-    cache = ToolSearchCache(cache_dir=str(tmp_path))
-    cache.sync_tools(specs)
-
-    # Should not raise sqlite fts syntax errors.
-    results, effective = cache.search(
-        "Hey! I want an SOV comparison please!",
-        search_type="fts",
-        limit=8,
-        include_always_loaded=True,
-        allowed_names=None,
+    registry.register("dummy_tool", DummyArgs, DummyOut)
+    registry.register("charting.start_chart_analysis", ChartArgs, ChartOut)
+    specs = cached_build_catalog(
+        [
+            Node(dummy_tool, name="dummy_tool"),
+            Node(charting_tool, name="charting.start_chart_analysis"),
+        ],
+        registry,
     )
-    assert effective in {"fts", "regex", "exact"}
-    assert isinstance(results, list)
-
-
-def test_tool_search_fts_matches_name_tokens(tmp_path: Path) -> None:
-    class A(BaseModel):
-        x: str
-
-    class Out(BaseModel):
-        y: str
-
-    @tool(desc="Charting tool", tags=["mcp", "charting"])
-    async def charting_tool(args: A, ctx):
-        del ctx
-        return Out(y=args.x)
-
-    registry = ModelRegistry()
-    registry.register("charting.start_chart_analysis", A, Out)
-    specs = build_catalog([Node(charting_tool, name="charting.start_chart_analysis")], registry)
-    cache = ToolSearchCache(cache_dir=str(tmp_path))
+    cache = ToolSearchCache(cache_dir=str(tmp_path_factory.mktemp("fts")))
     cache.sync_tools(specs)
-
-    results, effective = cache.search(
-        "start_analysis charting",
+    # Pay the first-query cost (FTS probe, page cache fill) here instead of in whichever test runs first.
+    cache.search(_UNRELATED_TOOL_QUERY, search_type="fts", limit=1, include_always_loaded=True)
+    return cache
+
+
+@pytest.mark.parametrize(
+    ("query", "allowed_effective", "expected_name", "expect_empty"),
+    [
+        # Should not raise sqlite fts syntax errors.
+        pytest.param(_PUNCTUATED_QUERY, {"fts", "regex", "exact"}, None, False, id="sanitizes_punctuation"),
+        pytest.param(_NAME_TOKEN_QUERY, {"fts"}, "charting.start_chart_analysis", False, id="matches_name_tokens"),
+        pytest.param(_UNRELATED_TOOL_QUERY, {"fts"}, None, True, id="no_matches_does_not_force_fallback"),
+    ],
+)
+def test_tool_search_fts(
+    tool_cache: ToolSearchCache,
+    query: str,
+    allowed_effective: set[str],
+    expected_name: str | None,
+    expect_empty: bool,
+) -> None:
+    results, effective = tool_cache.search(
+        query,
         search_type="fts",
         limit=10,
         include_always_loaded=True,
         allowed_names=None,
     )
-    assert effective == "fts"
-    assert any(item["name"] == "charting.start_chart_analysis" for item in results)
-
-
-def test_tool_search_fts_no_matches_does_not_force_fallback(tmp_path: Path) -> None:
-    registry = ModelRegistry()
-    registry.register("dummy_tool", _Args, _Out)
-    specs = build_catalog([Node(dummy_tool, name="dummy_tool")], registry)
-    cache = ToolSearchCache(cache_dir=str(tmp_path))
-    cache.sync_tools(specs)
-
-    results, effective = cache.search(
-        "completely_unrelated_query",
-        search_type="fts",
-        limit=8,
-        include_always_loaded=True,
-        allowed_names=None,
-    )
-    assert effective == "fts"
-    assert results == []
+    assert effective in allowed_effective
+    assert isinstance(results, list)
+    if expected_name is not None:
+        assert expected_name in [item["name"] for item in results]
+    if expect_empty:
+        assert results == []
 
 
-def test_skill_search_fts_sanitizes_punctuation(tmp_path: Path) -> None:
-    store = LocalSkillStore(db_path=tmp_path / "skills.db")
+@pytest.fixture(scope="module")
+def skill_store(tmp_path_factory: pytest.TempPathFactory) -> LocalSkillStore:
+    """Create the skill DB and its FTS index once; the skill search tests below only read from it."""
+    store = LocalSkillStore(db_path=tmp_path_factory.mktemp("skills") / "skills.db")
     store.upsert_pack_skill(
         SkillDefinition(
             name="pack.ads.sov_comparison",
@@ -104,9 +88,12 @@ def test_skill_search_fts_sanitizes_punctuation(tmp_path: Path) -> None:
         scope_mode="project",
         update_existing=True,
     )
+    return store
+
 
-    results, effective = store.search(
-        "Hey! I want an SOV comparison please!",
+def test_skill_search_fts_sanitizes_punctuation(skill_store: LocalSkillStore) -> None:
+    results, effective = skill_store.search(
+        _PUNCTUATED_QUERY,
         search_type="fts",
         limit=8,
         task_type=None,
@@ -117,21 +104,9 @@ def test_skill_search_fts_sanitizes_punctuation(tmp_path: Path) -> None:
     assert isinstance(results, list)
 
 
-def test_skill_search_fuzzy_text_matches_with_extra_terms(tmp_path: Path) -> None:
-    store = LocalSkillStore(db_path=tmp_path / "skills.db")
-    store.upsert_pack_skill(
-        SkillDefinition(
-            name="pack.ads.sov_comparison",
-            trigger="SOV comparison",
-            steps=["Step 1"],
-        ),
-        pack_name="ads",
-        scope_mode="project",
-        update_existing=True,
-    )
-
-    results, effective = store.search(
-        "sov_comparison overlap activity share audience",
+def test_skill_search_fuzzy_text_matches_with_extra_terms(skill_store: LocalSkillStore) -> None:
+    results, effective = skill_store.search(
+        _EXTRA_TERMS_QUERY,
         search_type="fts",
         limit=8,
         task_type=None,
@@ -142,20 +117,9 @@ def test_skill_search_fuzzy_text_matches_with_extra_terms(tmp_path: Path) -> Non
     assert any(item["name"] == "pack.ads.sov_comparison" for item in results)
 
 
-def test_skill_search_fts_no_matches_does_not_force_fallback(tmp_path: Path) -> None:
-    store = LocalSkillStore(db_path=tmp_path / "skills.db")
-    store.upsert_pack_skill(
-        SkillDefinition(
-            name="pack.ads.sov_comparison",
-            trigger="SOV comparison",
-            steps=["Step 1"],
-        ),
-        pack_name="ads",
-        scope_mode="project",
-        update_existing=True,
-    )
-    results, effective = store.search(
-        "unrelated_query",
+def test_skill_search_fts_no_matches_does_not_force_fallback(skill_store: LocalSkillStore) -> None:
+    results, effective = skill_store.search(
+        _UNRELATED_SKILL_QUERY,
         search_type="fts",
         limit=8,
         task_type=None,
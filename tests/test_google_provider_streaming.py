@@ -3,6 +3,21 @@ import types
 import pytest
 
 
+def _response(*parts: tuple[str | None, bool | None]) -> types.SimpleNamespace:
+    """Stand-in for ``GenerateContentResponse`` exposing only the attributes the provider reads."""
+    return types.SimpleNamespace(
+        candidates=[
+            types.SimpleNamespace(
+                content=types.SimpleNamespace(
+                    role="model",
+                    parts=[types.SimpleNamespace(text=text, thought=thought) for text, thought in parts],
+                ),
+                finish_reason=None,
+            )
+        ]
+    )
+
+
 @pytest.mark.asyncio
 async def test_google_provider_streaming_emits_deltas_for_cumulative_text() -> None:
     from google.genai import types as genai_types
@@ -11,28 +26,7 @@ async def test_google_provider_streaming_emits_deltas_for_cumulative_text() -> N
 
     provider = GoogleProvider("gemini-3-flash-preview", api_key="test")
 
-    chunks = [
-        genai_types.GenerateContentResponse(
-            candidates=[
-                genai_types.Candidate(
-                    content=genai_types.Content(
-                        role="model",
-                        parts=[genai_types.Part(text='{"a"', thought=None)],
-                    )
-                )
-            ]
-        ),
-        genai_types.GenerateContentResponse(
-            candidates=[
-                genai_types.Candidate(
-                    content=genai_types.Content(
-                        role="model",
-                        parts=[genai_types.Part(text='{"a":1}', thought=None)],
-                    )
-                )
-            ]
-        ),
-    ]
+    chunks = [_response(('{"a"', None)), _response(('{"a":1}', None))]
 
     class _FakeModels:
         async def generate_content_stream(self, **_kwargs):  # type: ignore[no-untyped-def]
@@ -76,21 +70,7 @@ async def test_google_provider_streaming_routes_thought_parts_to_reasoning() ->
 
     provider = GoogleProvider("gemini-3-flash-preview", api_key="test")
 
-    chunks = [
-        genai_types.GenerateContentResponse(
-            candidates=[
-                genai_types.Candidate(
-                    content=genai_types.Content(
-                        role="model",
-                        parts=[
-                            genai_types.Part(text="THINK", thought=True),
-                            genai_types.Part(text="ANSWER", thought=False),
-                        ],
-                    )
-                )
-            ]
-        )
-    ]
+    chunks = [_response(("THINK", True), ("ANSWER", False))]
 
     class _FakeModels:
         async def generate_content_stream(self, **_kwargs):  # type: ignore[no-untyped-def]
@@ -128,25 +108,11 @@ async def test_google_provider_streaming_routes_thought_parts_to_reasoning() ->
 
 
 def test_google_provider_non_stream_separates_thought_parts() -> None:
-    from google.genai import types as genai_types
-
     from penguiflow.llm.providers.google import GoogleProvider
 
     provider = GoogleProvider("gemini-3-flash-preview", api_key="test")
-    response = genai_types.GenerateContentResponse(
-        candidates=[
-            genai_types.Candidate(
-                content=genai_types.Content(
-                    role="model",
-                    parts=[
-                        genai_types.Part(text="THINK", thought=True),
-                        genai_types.Part(thought=True, thought_signature=b"sig"),
-                        genai_types.Part(text="ANSWER", thought=False),
-                    ],
-                )
-            )
-        ]
-    )
+    # The middle part is a signature-only thought part: no text to route.
+    response = _response(("THINK", True), (None, True), ("ANSWER", False))
 
     converted = provider._from_google_response(response)  # type: ignore[attr-defined]
     assert converted.message.text == "ANSWER"
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections.abc import Iterator
+from dataclasses import replace
 
 import pytest
 
 from penguiflow.planner.guardrails import (
     AsyncRuleEvaluator,
+    ContextSnapshotBuilder,
     ContextSnapshotV1,
     DefaultDecisionPolicy,
+    GatewayConfig,
     GuardrailAction,
     GuardrailContext,
     GuardrailDecision,
@@ -16,9 +21,16 @@ from penguiflow.planner.guardrails import (
     GuardrailSeverity,
     RuleCost,
     RuleRegistry,
+    ToolAllowlistRule,
 )
 from penguiflow.steering import InMemoryGuardInbox, SteeringGuardEvent
 
+# DefaultDecisionPolicy.resolve never mutates its inputs, so the decisions can be built once.
+_REDACT_DECISIONS = (
+    GuardrailDecision(action=GuardrailAction.REDACT, rule_id="a", reason="r1", effects=("flag",)),
+    GuardrailDecision(action=GuardrailAction.REDACT, rule_id="b", reason="r2", effects=("alert",)),
+)
+
 
 class _SyncAllowRule:
     rule_id = "allow"
@@ -44,6 +56,46 @@ class _AsyncStopRule:
         return GuardrailDecision(action=GuardrailAction.STOP, rule_id=self.rule_id, reason="blocked")
 
 
+class _AsyncHangRule:
+    rule_id = "async-hang"
+    version = "1"
+    supports_event_types = frozenset({"llm_before"})
+    cost = RuleCost.DEEP
+    enabled = True
+    severity = GuardrailSeverity.LOW
+
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    async def evaluate(self, event: GuardrailEvent, context_snapshot: ContextSnapshotV1) -> GuardrailDecision | None:
+        del event, context_snapshot
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return None
+
+
+class _AsyncSlowCriticalStopRule:
+    rule_id = "async-slow-critical"
+    version = "1"
+    supports_event_types = frozenset({"llm_before"})
+    cost = RuleCost.DEEP
+    enabled = True
+    severity = GuardrailSeverity.CRITICAL
+
+    async def evaluate(self, event: GuardrailEvent, context_snapshot: ContextSnapshotV1) -> GuardrailDecision | None:
+        del event, context_snapshot
+        await asyncio.sleep(0.01)
+        return GuardrailDecision(
+            action=GuardrailAction.STOP,
+            rule_id=self.rule_id,
+            reason="critical",
+            severity=GuardrailSeverity.CRITICAL,
+        )
+
+
 class _SyncErrorRule:
     rule_id = "sync-error"
     version = "1"
@@ -71,48 +123,216 @@ class _SyncSlowRule:
         return GuardrailDecision(action=GuardrailAction.ALLOW, rule_id=self.rule_id, reason="late")
 
 
-@pytest.mark.asyncio
-async def test_gateway_default_allows_when_no_rules() -> None:
+class _SnapshotRecorderRule:
+    version = "1"
+    supports_event_types = frozenset({"llm_before"})
+    cost = RuleCost.FAST
+    enabled = True
+    severity = GuardrailSeverity.LOW
+
+    def __init__(self, rule_id: str, seen: list[ContextSnapshotV1]) -> None:
+        self.rule_id = rule_id
+        self._seen = seen
+
+    async def evaluate(self, event: GuardrailEvent, context_snapshot: ContextSnapshotV1) -> GuardrailDecision | None:
+        del event
+        self._seen.append(context_snapshot)
+        return None
+
+
+class _SyncOnlyRule:
+    version = "1"
+    supports_event_types = frozenset({"llm_before"})
+    cost = RuleCost.FAST
+    enabled = True
+    severity = GuardrailSeverity.LOW
+
+    def __init__(self, rule_id: str, *, fail: bool = False, delay_s: float = 0.0) -> None:
+        self.rule_id = rule_id
+        self._fail = fail
+        self._delay_s = delay_s
+
+    async def evaluate(self, event: GuardrailEvent, context_snapshot: ContextSnapshotV1) -> GuardrailDecision | None:
+        raise AssertionError("evaluate_sync should be preferred")
+
+    def evaluate_sync(self, event: GuardrailEvent, context_snapshot: ContextSnapshotV1) -> GuardrailDecision | None:
+        del event, context_snapshot
+        if self._fail:
+            raise RuntimeError("boom")
+        time.sleep(self._delay_s)
+        return GuardrailDecision(action=GuardrailAction.REDACT, rule_id=self.rule_id, reason="inline")
+
+
+class _CustomAllowlistRule(ToolAllowlistRule):
+    """Overrides only the async entry point; the inherited evaluate_sync must not bypass it."""
+
+    async def evaluate(self, event: GuardrailEvent, context_snapshot: ContextSnapshotV1) -> GuardrailDecision | None:
+        del context_snapshot
+        return GuardrailDecision(action=GuardrailAction.STOP, rule_id="custom-allowlist", reason=str(event.tool_name))
+
+
+@pytest.fixture(scope="module")
+def gateway() -> GuardrailGateway:
     registry = RuleRegistry()
     inbox = InMemoryGuardInbox(AsyncRuleEvaluator(registry))
-    gateway = GuardrailGateway(registry=registry, guard_inbox=inbox)
+    return GuardrailGateway(registry=registry, guard_inbox=inbox)
 
-    decision = await gateway.evaluate(GuardrailContext(run_id="run"), GuardrailEvent("llm_before", "run"))
+
+@pytest.fixture
+def gw(gateway: GuardrailGateway) -> Iterator[GuardrailGateway]:
+    """The shared gateway, with its rules and config restored after each test."""
+    saved_rules = gateway.registry.snapshot()
+    saved_config = replace(gateway.config)
+    yield gateway
+    gateway.registry.restore(saved_rules)
+    gateway.config = saved_config
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_gateway_default_allows_when_no_rules(gw: GuardrailGateway) -> None:
+    decision = await gw.evaluate(GuardrailContext(run_id="run"), GuardrailEvent("llm_before", "run"))
     assert decision.action == GuardrailAction.ALLOW
 
 
-@pytest.mark.asyncio
-async def test_gateway_sync_fail_closed_on_rule_error() -> None:
+class _UnusedSnapshotBuilder(ContextSnapshotBuilder):
+    def build(self, event: GuardrailEvent, ctx: GuardrailContext) -> ContextSnapshotV1:
+        raise AssertionError("snapshot should not be built when no rule can fire")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_gateway_skips_snapshot_when_no_rules_can_fire() -> None:
     registry = RuleRegistry()
-    registry.register(_SyncErrorRule())
-    inbox = InMemoryGuardInbox(AsyncRuleEvaluator(registry))
-    gateway = GuardrailGateway(registry=registry, guard_inbox=inbox)
-    gateway.config.sync_fail_open = False
+    registry.register(_AsyncStopRule())
+    gateway = GuardrailGateway(
+        registry=registry,
+        guard_inbox=InMemoryGuardInbox(AsyncRuleEvaluator(registry)),
+        config=GatewayConfig(async_enabled=False),
+        context_builder=_UnusedSnapshotBuilder(),
+    )
 
     decision = await gateway.evaluate(GuardrailContext(run_id="run"), GuardrailEvent("llm_before", "run"))
+    assert decision.action == GuardrailAction.ALLOW
+    assert decision.rule_id == "__default__"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_gateway_sync_fail_closed_on_rule_error(gw: GuardrailGateway) -> None:
+    gw.registry.register(_SyncErrorRule())
+    gw.config.sync_fail_open = False
+
+    decision = await gw.evaluate(GuardrailContext(run_id="run"), GuardrailEvent("llm_before", "run"))
     assert decision.action == GuardrailAction.STOP
     assert decision.rule_id == "sync-error"
     assert decision.stop is not None
     assert decision.stop.error_code == "GUARDRAIL_SYNC_ERROR"
 
 
-@pytest.mark.asyncio
-async def test_gateway_sync_fail_closed_on_rule_timeout() -> None:
+@pytest.mark.asyncio(loop_scope="session")
+async def test_gateway_shares_one_snapshot_across_rules(gw: GuardrailGateway) -> None:
+    seen: list[ContextSnapshotV1] = []
+    gw.registry.register(_SnapshotRecorderRule("recorder-a", seen))
+    gw.registry.register(_SnapshotRecorderRule("recorder-b", seen))
+
+    await gw.evaluate(GuardrailContext(run_id="run"), GuardrailEvent("llm_before", "run"))
+    assert len(seen) == 2
+    assert seen[0] is seen[1]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_gateway_prefers_evaluate_sync(gw: GuardrailGateway) -> None:
+    gw.registry.register(_SyncOnlyRule("inline"))
+
+    decision = await gw.evaluate(GuardrailContext(run_id="run"), GuardrailEvent("llm_before", "run"))
+    assert decision.action == GuardrailAction.REDACT
+    assert decision.rule_id == "inline"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_gateway_evaluate_sync_error_fails_closed(gw: GuardrailGateway) -> None:
+    gw.registry.register(_SyncOnlyRule("inline-error", fail=True))
+    gw.config.sync_fail_open = False
+
+    decision = await gw.evaluate(GuardrailContext(run_id="run"), GuardrailEvent("llm_before", "run"))
+    assert decision.action == GuardrailAction.STOP
+    assert decision.stop is not None
+    assert decision.stop.error_code == "GUARDRAIL_SYNC_ERROR"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_gateway_evaluate_sync_overrun_fails_closed(gw: GuardrailGateway) -> None:
+    gw.registry.register(_SyncOnlyRule("inline-slow", delay_s=0.01))
+    gw.config.sync_fail_open = False
+    gw.config.sync_timeout_ms = 1
+
+    decision = await gw.evaluate(GuardrailContext(run_id="run"), GuardrailEvent("llm_before", "run"))
+    assert decision.action == GuardrailAction.STOP
+    assert decision.stop is not None
+    assert decision.stop.error_code == "GUARDRAIL_SYNC_TIMEOUT"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_gateway_runs_evaluate_override_on_builtin_rule_subclass(gw: GuardrailGateway) -> None:
+    gw.registry.register(_CustomAllowlistRule())
+
+    decision = await gw.evaluate(
+        GuardrailContext(run_id="run"),
+        GuardrailEvent("tool_call_start", "run", tool_name="search"),
+    )
+    assert decision.rule_id == "custom-allowlist"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_async_evaluator_runs_evaluate_override_on_builtin_rule_subclass() -> None:
     registry = RuleRegistry()
-    registry.register(_SyncSlowRule())
-    inbox = InMemoryGuardInbox(AsyncRuleEvaluator(registry))
-    gateway = GuardrailGateway(registry=registry, guard_inbox=inbox)
-    gateway.config.sync_fail_open = False
-    gateway.config.sync_timeout_ms = 1
+    registry.register(_CustomAllowlistRule(cost=RuleCost.DEEP))
+    evaluator = AsyncRuleEvaluator(registry)
 
-    decision = await gateway.evaluate(GuardrailContext(run_id="run"), GuardrailEvent("llm_before", "run"))
+    decisions = await evaluator.evaluate(
+        SteeringGuardEvent(event_type="tool_call_start", run_id="run", payload={"tool_name": "search"})
+    )
+    assert [decision.rule_id for decision in decisions] == ["custom-allowlist"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_gateway_sync_fail_closed_on_rule_timeout(gw: GuardrailGateway) -> None:
+    gw.registry.register(_SyncSlowRule())
+    gw.config.sync_fail_open = False
+    gw.config.sync_timeout_ms = 1
+
+    decision = await gw.evaluate(GuardrailContext(run_id="run"), GuardrailEvent("llm_before", "run"))
     assert decision.action == GuardrailAction.STOP
     assert decision.rule_id == "sync-slow"
     assert decision.stop is not None
     assert decision.stop.error_code == "GUARDRAIL_SYNC_TIMEOUT"
 
 
-@pytest.mark.asyncio
+def test_registry_looks_up_rules_by_event_type_and_enabled() -> None:
+    registry = RuleRegistry()
+    allow_rule = _SyncAllowRule()
+    registry.register(allow_rule)
+    registry.register(_AsyncStopRule())
+
+    assert registry.get_sync_rules("llm_before") == [allow_rule]
+    assert registry.get_sync_rules("tool_call_start") == []
+    assert [rule.rule_id for rule in registry.get_async_rules("llm_before")] == ["async-stop"]
+
+    allow_rule.enabled = False
+    assert registry.get_sync_rules("llm_before") == []
+
+
+def test_registry_all_rules_is_cached_until_registration() -> None:
+    registry = RuleRegistry()
+    allow_rule = _SyncAllowRule()
+    registry.register(allow_rule)
+    first = registry.all_rules()
+    assert registry.all_rules() is first
+
+    stop_rule = _AsyncStopRule()
+    registry.register(stop_rule)
+    assert registry.all_rules() == (allow_rule, stop_rule)
+
+
+@pytest.mark.asyncio(loop_scope="session")
 async def test_async_evaluator_filters_required_rules() -> None:
     registry = RuleRegistry()
     registry.register(_AsyncStopRule())
@@ -123,24 +343,54 @@ async def test_async_evaluator_filters_required_rules() -> None:
     assert decisions == []
 
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_async_evaluator_cancels_pending_rules_after_stop() -> None:
+    registry = RuleRegistry()
+    hang_rule = _AsyncHangRule()
+    registry.register(hang_rule)
+    registry.register(_AsyncStopRule())
+    evaluator = AsyncRuleEvaluator(registry)
+
+    decisions = await asyncio.wait_for(
+        evaluator.evaluate(SteeringGuardEvent(event_type="llm_before", run_id="run")),
+        timeout=1.0,
+    )
+    assert [decision.rule_id for decision in decisions] == ["async-stop"]
+    assert hang_rule.cancelled
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_async_evaluator_waits_for_more_severe_rules_and_keeps_registry_order() -> None:
+    registry = RuleRegistry()
+    registry.register(_AsyncSlowCriticalStopRule())
+    registry.register(_AsyncStopRule())
+    evaluator = AsyncRuleEvaluator(registry)
+
+    decisions = await evaluator.evaluate(SteeringGuardEvent(event_type="llm_before", run_id="run"))
+
+    # The fast MEDIUM STOP must not cancel the slower CRITICAL rule, and the
+    # decisions follow registry order rather than completion order.
+    assert [decision.rule_id for decision in decisions] == ["async-slow-critical", "async-stop"]
+
+
 def test_decision_policy_combines_effects() -> None:
     policy = DefaultDecisionPolicy()
     event = GuardrailEvent("llm_before", "run")
     context = ContextSnapshotV1()
-    decisions = [
-        GuardrailDecision(
-            action=GuardrailAction.REDACT,
-            rule_id="a",
-            reason="r1",
-            effects=("flag",),
-        ),
-        GuardrailDecision(
-            action=GuardrailAction.REDACT,
-            rule_id="b",
-            reason="r2",
-            effects=("alert",),
-        ),
-    ]
-    resolved = policy.resolve(decisions, event, context)
+    resolved = policy.resolve(list(_REDACT_DECISIONS), event, context)
     assert resolved.action == GuardrailAction.REDACT
     assert set(resolved.effects) == {"flag", "alert"}
+
+
+def test_registry_restore_drops_rules_registered_after_snapshot() -> None:
+    registry = RuleRegistry()
+    allow_rule = _SyncAllowRule()
+    registry.register(allow_rule)
+    saved = registry.snapshot()
+
+    registry.register(_AsyncStopRule())
+    registry.restore(saved)
+
+    assert registry.all_rules() == (allow_rule,)
+    assert registry.get_sync_rules("llm_before") == [allow_rule]
+    assert registry.get_async_rules("llm_before") == []
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from penguiflow.planner.guardrails import (
@@ -46,3 +48,105 @@ async def test_inmemory_guard_inbox_roundtrip() -> None:
 
     drained = inbox.drain_responses("run")
     assert drained
+
+
+class _GatedEvaluator:
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+
+    async def evaluate(self, event: SteeringGuardEvent) -> list[GuardrailDecision]:
+        await self.release.wait()
+        return [GuardrailDecision(action=GuardrailAction.ALLOW, rule_id=event.run_id, reason="late")]
+
+
+@pytest.mark.asyncio
+async def test_inmemory_guard_inbox_timeout_keeps_evaluation_and_drains_per_run() -> None:
+    evaluator = _GatedEvaluator()
+    inbox = InMemoryGuardInbox(evaluator)  # type: ignore[arg-type]
+
+    slow_id = await inbox.submit(SteeringGuardEvent(event_type="llm_before", run_id="run-a"))
+    other_id = await inbox.submit(SteeringGuardEvent(event_type="llm_before", run_id="run-b"))
+    with pytest.raises(TimeoutError):
+        await inbox.await_response(slow_id, timeout_s=0.01)
+
+    evaluator.release.set()
+    response = await inbox.await_response(slow_id, timeout_s=1.0)
+    assert response.decisions[0].rule_id == "run-a"
+    await inbox.await_response(other_id, timeout_s=1.0)
+
+    assert [item.correlation_id for item in inbox.drain_responses("run-a")] == [slow_id]
+    assert inbox.drain_responses("run-a") == []
+    assert [item.correlation_id for item in inbox.drain_responses("run-b")] == [other_id]
+
+
+class _CountingEvaluator:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def evaluate(self, event: SteeringGuardEvent) -> list[GuardrailDecision]:
+        del event
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0)
+        self.active -= 1
+        return []
+
+
+@pytest.mark.asyncio
+async def test_inmemory_guard_inbox_bounds_concurrent_evaluations() -> None:
+    evaluator = _CountingEvaluator()
+    inbox = InMemoryGuardInbox(evaluator, max_concurrency=2)  # type: ignore[arg-type]
+
+    correlation_ids = [await inbox.submit(SteeringGuardEvent(event_type="llm_before", run_id="run")) for _ in range(6)]
+    await asyncio.gather(*(inbox.await_response(cid, timeout_s=1.0) for cid in correlation_ids))
+
+    assert evaluator.peak == 2
+    assert len(inbox.drain_responses("run")) == 6
+
+
+@pytest.mark.asyncio
+async def test_inmemory_guard_inbox_submit_waits_when_queue_is_full() -> None:
+    evaluator = _GatedEvaluator()
+    inbox = InMemoryGuardInbox(evaluator, max_concurrency=1, max_queued=1)  # type: ignore[arg-type]
+
+    first = await inbox.submit(SteeringGuardEvent(event_type="llm_before", run_id="run"))
+    await asyncio.sleep(0)  # the single worker takes the first event off the queue
+    second = await inbox.submit(SteeringGuardEvent(event_type="llm_before", run_id="run"))
+
+    third = asyncio.create_task(inbox.submit(SteeringGuardEvent(event_type="llm_before", run_id="run")))
+    await asyncio.sleep(0.01)
+    assert not third.done()
+
+    evaluator.release.set()
+    third_id = await asyncio.wait_for(third, timeout=1.0)
+    for cid in (first, second, third_id):
+        await inbox.await_response(cid, timeout_s=1.0)
+    assert len(inbox.drain_responses("run")) == 3
+
+
+@pytest.mark.asyncio
+async def test_inmemory_guard_inbox_submit_batch_preserves_order() -> None:
+    registry = RuleRegistry()
+    registry.register(_AsyncRedactRule())
+    inbox = InMemoryGuardInbox(AsyncRuleEvaluator(registry))
+
+    events = [SteeringGuardEvent(event_type="tool_call_result", run_id="run") for _ in range(3)]
+    correlation_ids = await inbox.submit_batch(events)
+    assert correlation_ids == [event.correlation_id for event in events]
+
+    responses = [await inbox.await_response(cid, timeout_s=1.0) for cid in correlation_ids]
+    assert all(response.decisions[0].action == GuardrailAction.REDACT for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_inmemory_guard_inbox_submit_batch_larger_than_queue() -> None:
+    evaluator = _CountingEvaluator()
+    inbox = InMemoryGuardInbox(evaluator, max_concurrency=2, max_queued=2)  # type: ignore[arg-type]
+
+    events = [SteeringGuardEvent(event_type="llm_before", run_id="run") for _ in range(5)]
+    correlation_ids = await asyncio.wait_for(inbox.submit_batch(events), timeout=1.0)
+    await asyncio.gather(*(inbox.await_response(cid, timeout_s=1.0) for cid in correlation_ids))
+
+    assert evaluator.peak <= 2
+    assert len(inbox.drain_responses("run")) == 5
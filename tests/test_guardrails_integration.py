@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import logging
 
 import pytest
 from pydantic import BaseModel
@@ -10,6 +11,8 @@ from penguiflow.node import Node
 from penguiflow.planner import ReactPlanner
 from penguiflow.planner.guardrails import (
     AsyncRuleEvaluator,
+    ContextSnapshotV1,
+    GatewayConfig,
     GuardrailAction,
     GuardrailDecision,
     GuardrailEvent,
@@ -24,10 +27,16 @@ from penguiflow.planner.memory import MemoryKey, ShortTermMemoryConfig
 from penguiflow.registry import ModelRegistry
 from penguiflow.steering import InMemoryGuardInbox
 
+# Serialized once at import; each test builds its own stub because responses are consumed.
+_ANSWER_ONE = json.dumps({"thought": "answer", "next_node": "final_response", "args": {"answer": "one"}})
+_ANSWER_TWO = json.dumps({"thought": "answer", "next_node": "final_response", "args": {"answer": "two"}})
+_CALL_DEMO = json.dumps({"thought": "call demo", "next_node": "demo", "args": {"value": "hi"}})
+_CALL_SECRET = json.dumps({"thought": "call secret", "next_node": "secret", "args": {"value": "hi"}})
+
 
 class _StubClient:
-    def __init__(self, responses: list[dict[str, object]]) -> None:
-        self._responses = [json.dumps(item) for item in responses]
+    def __init__(self, *responses: str) -> None:
+        self._responses = list(responses)
 
     async def complete(
         self,
@@ -81,6 +90,23 @@ class _ConversationHistoryRule:
         return GuardrailDecision(action=GuardrailAction.ALLOW, rule_id=self.rule_id, reason="ok")
 
 
+class _ViolationRecorderRule:
+    rule_id = "violation-recorder"
+    version = "1"
+    supports_event_types = frozenset({"llm_before"})
+    enabled = True
+    cost = RuleCost.FAST
+    severity = GuardrailSeverity.LOW
+
+    def __init__(self) -> None:
+        self.seen: list[int] = []
+
+    async def evaluate(self, event: GuardrailEvent, context_snapshot: ContextSnapshotV1) -> GuardrailDecision | None:
+        del event
+        self.seen.append(context_snapshot.previous_violations)
+        return None
+
+
 @pytest.mark.asyncio
 async def test_guardrail_payload_includes_conversation_history_from_memory() -> None:
     registry = ModelRegistry()
@@ -94,12 +120,7 @@ async def test_guardrail_payload_includes_conversation_history_from_memory() ->
     )
 
     planner = ReactPlanner(
-        llm_client=_StubClient(
-            [
-                {"thought": "answer", "next_node": "final_response", "args": {"answer": "one"}},
-                {"thought": "answer", "next_node": "final_response", "args": {"answer": "two"}},
-            ]
-        ),
+        llm_client=_StubClient(_ANSWER_ONE, _ANSWER_TWO),
         catalog=catalog,
         max_iters=1,
         short_term_memory=ShortTermMemoryConfig(strategy="truncation"),
@@ -126,15 +147,7 @@ async def test_guardrail_tool_allowlist_stop() -> None:
     )
 
     planner = ReactPlanner(
-        llm_client=_StubClient(
-            [
-                {
-                    "thought": "call demo",
-                    "next_node": "demo",
-                    "args": {"value": "hi"},
-                }
-            ]
-        ),
+        llm_client=_StubClient(_CALL_DEMO),
         catalog=catalog,
         max_iters=1,
         guardrail_gateway=gateway,
@@ -162,15 +175,7 @@ async def test_guardrail_secret_redaction_on_tool_result() -> None:
     )
 
     planner = ReactPlanner(
-        llm_client=_StubClient(
-            [
-                {
-                    "thought": "call secret",
-                    "next_node": "secret",
-                    "args": {"value": "hi"},
-                }
-            ]
-        ),
+        llm_client=_StubClient(_CALL_SECRET),
         catalog=catalog,
         max_iters=1,
         guardrail_gateway=gateway,
@@ -181,3 +186,65 @@ async def test_guardrail_secret_redaction_on_tool_result() -> None:
     assert steps
     observation = steps[0].get("observation") or {}
     assert "OPENAI_KEY" in str(observation.get("result"))
+
+
+@pytest.mark.asyncio
+async def test_guardrail_shadow_mode_logs_without_blocking(caplog: pytest.LogCaptureFixture) -> None:
+    registry = ModelRegistry()
+    registry.register("demo", ToolArgs, ToolOut)
+    catalog = build_catalog([Node(demo_tool, name="demo")], registry)
+
+    guard_registry = RuleRegistry()
+    guard_registry.register(ToolAllowlistRule(denied_tools=frozenset({"demo"})))
+    gateway = GuardrailGateway(
+        registry=guard_registry,
+        guard_inbox=InMemoryGuardInbox(AsyncRuleEvaluator(guard_registry)),
+        config=GatewayConfig(mode="shadow"),
+    )
+
+    planner = ReactPlanner(
+        llm_client=_StubClient(_CALL_DEMO),
+        catalog=catalog,
+        max_iters=1,
+        guardrail_gateway=gateway,
+    )
+
+    with caplog.at_level(logging.INFO, logger="penguiflow.planner"):
+        result = await planner.run("hi")
+
+    assert "guardrail" not in result.metadata
+    assert "echo:hi" in str(result.metadata["steps"][0].get("observation"))
+    shadow = [record for record in caplog.records if record.getMessage() == "guardrail_decision_shadow"]
+    assert any(
+        record.__dict__["rule_id"] == "tool-allowlist" and record.__dict__["action"] == "STOP" for record in shadow
+    )
+    decisions = [record for record in caplog.records if record.getMessage() == "guardrail_decision"]
+    assert decisions
+    assert all(record.__dict__["enforced"] is False for record in decisions)
+
+
+@pytest.mark.asyncio
+async def test_guardrail_shadow_mode_snapshots_context_when_scheduled() -> None:
+    recorder = _ViolationRecorderRule()
+    guard_registry = RuleRegistry()
+    guard_registry.register(recorder)
+    gateway = GuardrailGateway(
+        registry=guard_registry,
+        guard_inbox=InMemoryGuardInbox(AsyncRuleEvaluator(guard_registry)),
+        config=GatewayConfig(mode="shadow"),
+    )
+    planner = ReactPlanner(
+        llm_client=_StubClient(),
+        catalog=build_catalog([], ModelRegistry()),
+        guardrail_gateway=gateway,
+    )
+    ctx = planner._guardrail_context
+    assert ctx is not None
+
+    event = planner._build_guardrail_event(event_type="llm_before", text_content="hi")
+    assert await planner._evaluate_guardrail(event) is None
+    # A strike recorded after scheduling must not reach the earlier event's decision.
+    ctx.strike_counts["jailbreak"] = 3
+    await planner.flush_guardrail_shadow_tasks()
+
+    assert recorder.seen == [0]
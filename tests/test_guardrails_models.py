@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from penguiflow.planner.guardrails import (
     ContextSnapshotBuilder,
     GuardrailAction,
@@ -40,3 +44,5 @@ def test_context_snapshot_builder_signals() -> None:
     assert snapshot.contains_untrusted is True
     assert snapshot.max_tool_risk == ToolRiskTier.HIGH
     assert snapshot.previous_violations == 2
+    with pytest.raises(FrozenInstanceError):
+        snapshot.previous_violations = 0  # type: ignore[misc]
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import json
 import textwrap
 
 from penguiflow.planner.guardrails import (
     AsyncRuleEvaluator,
     ContextSnapshotBuilder,
+    ContextSnapshotV1,
     DefaultRiskRouter,
     GatewayConfig,
+    GuardrailDecision,
+    GuardrailEvent,
     GuardrailGateway,
+    GuardrailSeverity,
+    RuleCost,
     RuleRegistry,
     SecretRedactionRule,
     ToolAllowlistRule,
@@ -38,6 +44,39 @@ def test_load_policy_pack_env_override(tmp_path) -> None:
     assert pack.data["gateway"]["mode"] == "shadow"
 
 
+def test_load_policy_pack_reads_json(tmp_path) -> None:
+    path = tmp_path / "policy.json"
+    path.write_text(
+        json.dumps(
+            {
+                "policy_pack": "default",
+                "version": "1.0.0",
+                "gateway": {"mode": "enforce"},
+                "environments": {"dev": {"gateway": {"mode": "shadow"}}},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    pack = load_policy_pack(path, env="dev")
+    assert pack.policy_id == "default"
+    assert pack.data["gateway"]["mode"] == "shadow"
+
+
+def test_load_policy_pack_reparses_changed_file_and_copies_data(tmp_path) -> None:
+    path = tmp_path / "policy.yaml"
+    path.write_text('policy_pack: "default"\nversion: "1.0.0"\ngateway:\n  mode: "enforce"\n', encoding="utf-8")
+
+    first = load_policy_pack(path)
+    first.data["gateway"]["mode"] = "mutated"
+    assert load_policy_pack(path).data["gateway"]["mode"] == "enforce"
+
+    path.write_text('policy_pack: "default"\nversion: "2.0.0"\ngateway:\n  mode: "shadow"\n', encoding="utf-8")
+    reloaded = load_policy_pack(path)
+    assert reloaded.version == "2.0.0"
+    assert reloaded.data["gateway"]["mode"] == "shadow"
+
+
 def test_apply_policy_config_updates_rules_and_gateway(tmp_path) -> None:
     content = textwrap.dedent(
         """
@@ -85,3 +124,41 @@ def test_apply_policy_config_updates_rules_and_gateway(tmp_path) -> None:
     assert allowlist.denied_tools == frozenset({"tool.a"})
     secret = next(rule for rule in registry.all_rules() if rule.rule_id == "secret-redaction")
     assert secret.enabled is False
+
+
+class _KeywordRule:
+    rule_id = "keyword"
+    version = "1"
+    cost = RuleCost.FAST
+    enabled = True
+    severity = GuardrailSeverity.LOW
+
+    def __init__(self) -> None:
+        self.supports_event_types = frozenset({"llm_before"})
+
+    async def evaluate(self, event: GuardrailEvent, context_snapshot: ContextSnapshotV1) -> GuardrailDecision | None:
+        del event, context_snapshot
+        return None
+
+
+def test_apply_policy_config_reindexes_changed_event_types(tmp_path) -> None:
+    path = tmp_path / "policy.json"
+    path.write_text(
+        json.dumps(
+            {
+                "policy_pack": "default",
+                "version": "1.0.0",
+                "sync_rules": [{"id": "keyword", "config": {"supports_event_types": ["tool_call_start"]}}],
+            }
+        ),
+        encoding="utf-8",
+    )
+    registry = RuleRegistry()
+    rule = _KeywordRule()
+    registry.register(rule)
+    gateway = GuardrailGateway(registry=registry, guard_inbox=InMemoryGuardInbox(AsyncRuleEvaluator(registry)))
+
+    apply_policy_config(registry, gateway, ContextSnapshotBuilder(), DefaultRiskRouter(), load_policy_pack(path))
+
+    assert registry.get_sync_rules("tool_call_start") == [rule]
+    assert registry.get_sync_rules("llm_before") == []
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import dataclasses
+from typing import Any
+
+import pytest
+
 from penguiflow.llm.profiles import (
     ModelProfile,
     get_profile,
     get_profiles,
     get_schema_transformer,
     register_profile,
+    registry_version,
+    unregister_profile,
 )
 
 
@@ -32,6 +39,12 @@ class TestGetProfileForModel:
         assert profile is not None
         assert profile.supports_tools is True
 
+    def test_versioned_model_prefers_longest_base_model(self) -> None:
+        """Test that versioned models resolve to the most specific registered base model."""
+        profiles = get_profiles()
+        assert get_profile("gpt-4.1-mini-2025-04-14") is profiles["gpt-4.1-mini"]
+        assert get_profile("openai/gpt-5.4-mini-2026-01-01") is profiles["openai/gpt-5.4-mini"]
+
     def test_versioned_model_with_provider_prefix(self) -> None:
         """Test versioned model with provider prefix."""
         profile = get_profile("openai/gpt-4o-2024-08-06")
@@ -48,6 +61,7 @@ class TestGetProfileForModel:
     def test_unknown_model_returns_default(self) -> None:
         """Test that unknown models return default profile."""
         profile = get_profile("unknown-model-xyz")
+        assert profile is get_profile("another-unknown-model")
         assert profile is not None
         # Default profile has minimal capabilities
         assert isinstance(profile, ModelProfile)
@@ -109,9 +123,28 @@ class TestRegisterProfile:
         assert profile is custom_profile
         assert profile.max_output_tokens == 1000
 
-        # Clean up by removing from profiles dict
-        profiles = get_profiles()
-        del profiles["my-custom-model"]
+        # Clean up so the cached lookup doesn't outlive the registration
+        unregister_profile("my-custom-model")
+        assert get_profile("my-custom-model") is not custom_profile
+
+    def test_registry_version_changes_on_register_and_unregister(self) -> None:
+        """Caches keyed on registry_version() see every registry change."""
+        before = registry_version()
+        register_profile("my-versioned-model", ModelProfile())
+        registered = registry_version()
+        unregister_profile("my-versioned-model")
+        assert before != registered != registry_version()
+
+    def test_profiles_view_is_read_only(self) -> None:
+        """The registry can only be changed through register/unregister."""
+        with pytest.raises(TypeError):
+            get_profiles()["my-custom-model"] = ModelProfile()  # type: ignore[index]
+
+    def test_profiles_are_immutable(self) -> None:
+        """Shared profile instances cannot be mutated in place."""
+        profile = get_profile("gpt-4o")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            profile.max_output_tokens = 1  # type: ignore[misc]
 
 
 class TestGetSchemaTransformer:
@@ -129,6 +162,27 @@ class TestGetSchemaTransformer:
         transformer = get_schema_transformer(profile, {"type": "object"})
         assert transformer is not None
 
+    def test_registered_custom_transformer(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that profiles can name transformers registered outside the built-ins."""
+        from penguiflow.llm.schema import transformer as transformer_mod
+
+        monkeypatch.setattr(transformer_mod, "_TRANSFORMER_REGISTRY", dict(transformer_mod._TRANSFORMER_REGISTRY))
+
+        @transformer_mod.register_transformer
+        class PassthroughTransformer(transformer_mod.JsonSchemaTransformer):
+            def _transform_node(self, node: dict[str, Any]) -> dict[str, Any]:
+                return node
+
+        profile = ModelProfile(schema_transformer_name="PassthroughTransformer")
+        transformer = get_schema_transformer(profile, {"type": "object"})
+        assert isinstance(transformer, PassthroughTransformer)
+
+    def test_transformer_instances_are_not_shared(self) -> None:
+        """Each call gets its own transformer since transform() records per-run state."""
+        profile = ModelProfile(schema_transformer_name="OpenAIJsonSchemaTransformer")
+        schema = {"type": "object"}
+        assert get_schema_transformer(profile, schema) is not get_schema_transformer(profile, schema)
+
     def test_anthropic_transformer(self) -> None:
         """Test getting Anthropic schema transformer."""
         profile = ModelProfile(schema_transformer_name="AnthropicJsonSchemaTransformer")
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from penguiflow.llm import protocol
 from penguiflow.llm.protocol import (
     NativeLLMAdapter,
     create_native_adapter,
@@ -19,538 +20,452 @@ from penguiflow.llm.types import (
     Usage,
 )
 
-
-class TestNativeLLMAdapter:
-    @pytest.fixture
-    def mock_provider(self) -> MagicMock:
-        """Create a mock provider."""
-        provider = MagicMock()
-        provider.model = "test-model"
-        provider.provider_name = "test"
-        provider.complete = AsyncMock(
-            return_value=CompletionResponse(
-                message=LLMMessage(role="assistant", parts=[TextPart(text='{"result": "ok"}')]),
-                usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
-            )
+_USER_TEST_MESSAGES: list[dict[str, str]] = [{"role": "user", "content": "test"}]
+
+_PLANNER_ACTION_FORMAT: dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "planner_action",
+        "schema": {
+            "type": "object",
+            "properties": {"next_node": {"type": "string"}},
+            "required": ["next_node"],
+        },
+    },
+}
+
+
+class _ScriptedComplete:
+    """Stand-in for ``provider.complete`` that replays outcomes in order and records calls.
+
+    The last outcome repeats once the script runs out; exceptions are raised instead of returned.
+    """
+
+    def __init__(self, *outcomes: CompletionResponse | Exception) -> None:
+        self._outcomes = outcomes
+        self.requests: list[Any] = []
+        self.kwargs: list[dict[str, Any]] = []
+
+    async def __call__(self, request: Any, **kwargs: Any) -> CompletionResponse:
+        self.requests.append(request)
+        self.kwargs.append(kwargs)
+        outcome = self._outcomes[min(len(self.requests), len(self._outcomes)) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def mock_provider() -> MagicMock:
+    """Create a mock provider."""
+    provider = MagicMock()
+    provider.model = "test-model"
+    provider.provider_name = "test"
+    provider.complete = _ScriptedComplete(
+        CompletionResponse(
+            message=LLMMessage(role="assistant", parts=[TextPart(text='{"result": "ok"}')]),
+            usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
         )
-        return provider
+    )
+    return provider
 
-    def test_init(self) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "gpt-4o"
-            mock_create.return_value = mock_provider
 
-            adapter = NativeLLMAdapter("gpt-4o", temperature=0.5)
+@pytest.fixture(autouse=True)
+def create_provider(monkeypatch: pytest.MonkeyPatch, mock_provider: MagicMock) -> MagicMock:
+    """Build every adapter in this module around ``mock_provider``."""
+    factory = MagicMock(return_value=mock_provider)
+    monkeypatch.setattr(protocol, "create_provider", factory)
+    return factory
 
-            mock_create.assert_called_once_with(
-                "gpt-4o",
-                api_key=None,
-                base_url=None,
-            )
-            assert adapter._temperature == 0.5
 
-    def test_init_with_options(self) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "gpt-4o"
-            mock_create.return_value = mock_provider
+class TestNativeLLMAdapter:
+    def test_init(self, mock_provider: MagicMock, create_provider: MagicMock) -> None:
+        mock_provider.model = "gpt-4o"
 
-            adapter = NativeLLMAdapter(
-                "gpt-4o",
-                api_key="test-key",
-                base_url="https://api.example.com",
-                max_retries=5,
-                timeout_s=360.0,
-                json_schema_mode=False,
-            )
+        adapter = NativeLLMAdapter("gpt-4o", temperature=0.5)
 
-            mock_create.assert_called_once_with(
-                "gpt-4o",
-                api_key="test-key",
-                base_url="https://api.example.com",
-            )
-            assert adapter._max_retries == 5
-            assert adapter._timeout_s == 360.0
-            assert adapter._json_schema_mode is False
+        create_provider.assert_called_once_with(
+            "gpt-4o",
+            api_key=None,
+            base_url=None,
+        )
+        assert adapter._temperature == 0.5
 
-    @pytest.mark.asyncio
-    async def test_complete(self, mock_provider: MagicMock) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
+    def test_init_with_options(self, mock_provider: MagicMock, create_provider: MagicMock) -> None:
+        mock_provider.model = "gpt-4o"
 
-            adapter = NativeLLMAdapter("test-model")
-            content, cost = await adapter.complete(messages=[{"role": "user", "content": "Hello"}])
+        adapter = NativeLLMAdapter(
+            "gpt-4o",
+            api_key="test-key",
+            base_url="https://api.example.com",
+            max_retries=5,
+            timeout_s=360.0,
+            json_schema_mode=False,
+        )
 
-            assert content == '{"result": "ok"}'
-            mock_provider.complete.assert_called_once()
+        create_provider.assert_called_once_with(
+            "gpt-4o",
+            api_key="test-key",
+            base_url="https://api.example.com",
+        )
+        assert adapter._max_retries == 5
+        assert adapter._timeout_s == 360.0
+        assert adapter._json_schema_mode is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_complete(self, mock_provider: MagicMock) -> None:
+        adapter = NativeLLMAdapter("test-model")
+        content, cost = await adapter.complete(messages=[{"role": "user", "content": "Hello"}])
+
+        assert content == '{"result": "ok"}'
+        assert len(mock_provider.complete.requests) == 1
+
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_falls_back_to_tool_call_arguments_when_text_empty(self, mock_provider: MagicMock) -> None:
-        mock_provider.complete.return_value = CompletionResponse(
-            message=LLMMessage(
-                role="assistant",
-                parts=[
-                    ToolCallPart(
-                        name="json_output",
-                        arguments_json='{"next_node":"final_response","args":{"answer":"hi"}}',
-                    )
-                ],
-            ),
-            usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
+        mock_provider.complete = _ScriptedComplete(
+            CompletionResponse(
+                message=LLMMessage(
+                    role="assistant",
+                    parts=[
+                        ToolCallPart(
+                            name="json_output",
+                            arguments_json='{"next_node":"final_response","args":{"answer":"hi"}}',
+                        )
+                    ],
+                ),
+                usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
+            )
         )
 
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("test-model")
-            content, _ = await adapter.complete(messages=[{"role": "user", "content": "Hello"}])
-            assert content.startswith("{")
-            assert '"next_node"' in content
+        adapter = NativeLLMAdapter("test-model")
+        content, _ = await adapter.complete(messages=[{"role": "user", "content": "Hello"}])
+        assert content.startswith("{")
+        assert '"next_node"' in content
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_with_response_format(self, mock_provider: MagicMock) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("test-model", json_schema_mode=True)
-            content, cost = await adapter.complete(
-                messages=[{"role": "user", "content": "test"}],
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "test_schema",
-                        "schema": {"type": "object", "properties": {"x": {"type": "string"}}},
-                    },
+        adapter = NativeLLMAdapter("test-model", json_schema_mode=True)
+        content, cost = await adapter.complete(
+            messages=_USER_TEST_MESSAGES,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "test_schema",
+                    "schema": {"type": "object", "properties": {"x": {"type": "string"}}},
                 },
-            )
+            },
+        )
 
-            assert content is not None
-            call_args = mock_provider.complete.call_args[0][0]
-            assert call_args.structured_output is not None
-            assert call_args.structured_output.name == "test_schema"
+        assert content is not None
+        request = mock_provider.complete.requests[-1]
+        assert request.structured_output is not None
+        assert request.structured_output.name == "test_schema"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_with_json_object_format(self, mock_provider: MagicMock) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("test-model", json_schema_mode=True)
-            content, cost = await adapter.complete(
-                messages=[{"role": "user", "content": "test"}],
-                response_format={"type": "json_object"},
-            )
+        adapter = NativeLLMAdapter("test-model", json_schema_mode=True)
+        content, cost = await adapter.complete(
+            messages=_USER_TEST_MESSAGES,
+            response_format={"type": "json_object"},
+        )
 
-            assert content is not None
-            # json_object mode creates a generic JSON output schema
-            call_args = mock_provider.complete.call_args[0][0]
-            assert call_args.structured_output is not None
-            assert call_args.structured_output.name == "json_response"
-            assert call_args.structured_output.json_schema == {"type": "object"}
-            assert call_args.structured_output.strict is False
+        assert content is not None
+        # json_object mode creates a generic JSON output schema
+        request = mock_provider.complete.requests[-1]
+        assert request.structured_output is not None
+        assert request.structured_output.name == "json_response"
+        assert request.structured_output.json_schema == {"type": "object"}
+        assert request.structured_output.strict is False
 
     def test_build_request_normalizes_composed_schema_root_type(self) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "test-model"
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("test-model", json_schema_mode=True)
-            messages = adapter._convert_messages([{"role": "user", "content": "test"}])
-
-            request = adapter._build_request(
-                messages,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "planner_action",
-                        "schema": {
-                            "allOf": [
-                                {
-                                    "type": "object",
-                                    "properties": {"next_node": {"type": "string"}},
-                                    "required": ["next_node"],
+        adapter = NativeLLMAdapter("test-model", json_schema_mode=True)
+        messages = adapter._convert_messages(_USER_TEST_MESSAGES)
+
+        request = adapter._build_request(
+            messages,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "planner_action",
+                    "schema": {
+                        "allOf": [
+                            {
+                                "type": "object",
+                                "properties": {"next_node": {"type": "string"}},
+                                "required": ["next_node"],
+                            },
+                            {
+                                "if": {
+                                    "properties": {"next_node": {"const": "final_response"}},
                                 },
-                                {
-                                    "if": {
-                                        "properties": {"next_node": {"const": "final_response"}},
-                                    },
-                                    "then": {
-                                        "properties": {
-                                            "args": {
-                                                "type": "object",
-                                                "properties": {"answer": {"type": "string"}},
-                                                "required": ["answer"],
-                                            }
+                                "then": {
+                                    "properties": {
+                                        "args": {
+                                            "type": "object",
+                                            "properties": {"answer": {"type": "string"}},
+                                            "required": ["answer"],
                                         }
-                                    },
+                                    }
                                 },
-                            ]
-                        },
+                            },
+                        ]
                     },
                 },
-            )
+            },
+        )
 
-            assert request.structured_output is not None
-            assert request.structured_output.json_schema["type"] == "object"
-            assert "allOf" in request.structured_output.json_schema
-
-    def test_build_request_openrouter_non_allowlisted_route_uses_json_object(self) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "anthropic/claude-sonnet-4.5"
-            mock_provider.provider_name = "openrouter"
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("openrouter/anthropic/claude-sonnet-4.5", json_schema_mode=True)
-            messages = adapter._convert_messages([{"role": "user", "content": "test"}])
-
-            request = adapter._build_request(
-                messages,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "planner_action",
-                        "schema": {
-                            "type": "object",
-                            "properties": {"next_node": {"type": "string"}},
-                            "required": ["next_node"],
-                        },
-                    },
-                },
-            )
+        assert request.structured_output is not None
+        assert request.structured_output.json_schema["type"] == "object"
+        assert "allOf" in request.structured_output.json_schema
+
+    @pytest.mark.parametrize(
+        ("model", "expected"),
+        [
+            pytest.param(
+                "anthropic/claude-sonnet-4.5",
+                {"name": "json_response", "json_schema": {"type": "object"}, "strict": False},
+                id="non_allowlisted_route_uses_json_object",
+            ),
+            pytest.param(
+                "openai/gpt-5",
+                {"name": "planner_action", "strict": True},
+                id="openai_route_keeps_json_schema",
+            ),
+            pytest.param("stepfun/step-3.5-flash", None, id="stepfun_route_uses_text_mode"),
+        ],
+    )
+    def test_build_request_openrouter_routes(
+        self, mock_provider: MagicMock, model: str, expected: dict[str, Any] | None
+    ) -> None:
+        mock_provider.model = model
+        mock_provider.provider_name = "openrouter"
 
-            assert request.structured_output is not None
-            assert request.structured_output.name == "json_response"
-            assert request.structured_output.json_schema == {"type": "object"}
-            assert request.structured_output.strict is False
-
-    def test_build_request_openrouter_openai_route_keeps_json_schema(self) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "openai/gpt-5"
-            mock_provider.provider_name = "openrouter"
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("openrouter/openai/gpt-5", json_schema_mode=True)
-            messages = adapter._convert_messages([{"role": "user", "content": "test"}])
-
-            request = adapter._build_request(
-                messages,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "planner_action",
-                        "schema": {
-                            "type": "object",
-                            "properties": {"next_node": {"type": "string"}},
-                            "required": ["next_node"],
-                        },
-                    },
-                },
-            )
+        adapter = NativeLLMAdapter(f"openrouter/{model}", json_schema_mode=True)
+        messages = adapter._convert_messages(_USER_TEST_MESSAGES)
 
-            assert request.structured_output is not None
-            assert request.structured_output.name == "planner_action"
-            assert request.structured_output.strict is True
-
-    def test_build_request_openrouter_stepfun_route_uses_text_mode(self) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "stepfun/step-3.5-flash"
-            mock_provider.provider_name = "openrouter"
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("openrouter/stepfun/step-3.5-flash", json_schema_mode=True)
-            messages = adapter._convert_messages([{"role": "user", "content": "test"}])
-
-            request = adapter._build_request(
-                messages,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "planner_action",
-                        "schema": {
-                            "type": "object",
-                            "properties": {"next_node": {"type": "string"}},
-                            "required": ["next_node"],
-                        },
-                    },
-                },
-            )
+        request = adapter._build_request(messages, response_format=_PLANNER_ACTION_FORMAT)
 
+        if expected is None:
             assert request.structured_output is None
+            return
+        assert request.structured_output is not None
+        for field, value in expected.items():
+            assert getattr(request.structured_output, field) == value
 
-    def test_build_request_nim_structured_keeps_reasoning_effort_by_default(self) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "qwen/qwen3.5-397b-a17b"
-            mock_provider.provider_name = "nim"
-            mock_create.return_value = mock_provider
+    def test_build_request_nim_structured_keeps_reasoning_effort_by_default(self, mock_provider: MagicMock) -> None:
+        mock_provider.model = "qwen/qwen3.5-397b-a17b"
+        mock_provider.provider_name = "nim"
 
-            adapter = NativeLLMAdapter(
-                "nim/qwen/qwen3.5-397b-a17b",
-                json_schema_mode=True,
-                use_native_reasoning=True,
-                reasoning_effort="high",
-            )
-            messages = adapter._convert_messages([{"role": "user", "content": "test"}])
-
-            request = adapter._build_request(
-                messages,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "planner_action",
-                        "schema": {
-                            "type": "object",
-                            "properties": {"next_node": {"type": "string"}},
-                            "required": ["next_node"],
-                        },
-                    },
-                },
-            )
+        adapter = NativeLLMAdapter(
+            "nim/qwen/qwen3.5-397b-a17b",
+            json_schema_mode=True,
+            use_native_reasoning=True,
+            reasoning_effort="high",
+        )
+        messages = adapter._convert_messages(_USER_TEST_MESSAGES)
+
+        request = adapter._build_request(messages, response_format=_PLANNER_ACTION_FORMAT)
 
-            assert request.structured_output is not None
-            assert request.structured_output.name == "json_response"
-            assert request.extra is not None
-            assert request.extra["reasoning_effort"] == "high"
+        assert request.structured_output is not None
+        assert request.structured_output.name == "json_response"
+        assert request.extra is not None
+        assert request.extra["reasoning_effort"] == "high"
 
     def test_convert_messages(self) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "test-model"
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("test-model")
-            messages = [
-                {"role": "system", "content": "You are helpful."},
-                {"role": "user", "content": "Hello"},
-                {"role": "assistant", "content": "Hi there!"},
-            ]
+        adapter = NativeLLMAdapter("test-model")
+        messages = [
+            {"role": "system", "content": "You are helpful."},
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi there!"},
+        ]
 
-            result = adapter._convert_messages(messages)
+        result = adapter._convert_messages(messages)
 
-            assert len(result) == 3
-            assert result[0].role == "system"
-            assert result[0].text == "You are helpful."
-            assert result[1].role == "user"
-            assert result[2].role == "assistant"
+        assert len(result) == 3
+        assert result[0].role == "system"
+        assert result[0].text == "You are helpful."
+        assert result[1].role == "user"
+        assert result[2].role == "assistant"
 
     def test_convert_messages_invalid_role(self) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "test-model"
-            mock_create.return_value = mock_provider
+        adapter = NativeLLMAdapter("test-model")
+        messages = [{"role": "invalid_role", "content": "test"}]
 
-            adapter = NativeLLMAdapter("test-model")
-            messages = [{"role": "invalid_role", "content": "test"}]
+        result = adapter._convert_messages(messages)
 
-            result = adapter._convert_messages(messages)
+        # Invalid role should be mapped to "user"
+        assert result[0].role == "user"
 
-            # Invalid role should be mapped to "user"
-            assert result[0].role == "user"
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_with_reasoning_content(self, mock_provider: MagicMock) -> None:
-        mock_provider.complete.return_value = CompletionResponse(
-            message=LLMMessage(role="assistant", parts=[TextPart(text='{"result": "ok"}')]),
-            usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
-            reasoning_content="I thought about it...",
+        mock_provider.complete = _ScriptedComplete(
+            CompletionResponse(
+                message=LLMMessage(role="assistant", parts=[TextPart(text='{"result": "ok"}')]),
+                usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
+                reasoning_content="I thought about it...",
+            )
         )
 
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
+        reasoning_chunks: list[tuple[str, bool]] = []
 
-            reasoning_chunks: list[tuple[str, bool]] = []
-
-            def on_reasoning(text: str, done: bool) -> None:
-                reasoning_chunks.append((text, done))
+        def on_reasoning(text: str, done: bool) -> None:
+            reasoning_chunks.append((text, done))
 
-            adapter = NativeLLMAdapter("test-model")
-            content, cost = await adapter.complete(
-                messages=[{"role": "user", "content": "test"}],
-                on_reasoning_chunk=on_reasoning,
-            )
+        adapter = NativeLLMAdapter("test-model")
+        content, cost = await adapter.complete(
+            messages=_USER_TEST_MESSAGES,
+            on_reasoning_chunk=on_reasoning,
+        )
 
-            assert content == '{"result": "ok"}'
-            assert len(reasoning_chunks) == 2
-            assert reasoning_chunks[0] == ("I thought about it...", False)
-            assert reasoning_chunks[1] == ("", True)
+        assert content == '{"result": "ok"}'
+        assert len(reasoning_chunks) == 2
+        assert reasoning_chunks[0] == ("I thought about it...", False)
+        assert reasoning_chunks[1] == ("", True)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_reorders_nim_system_messages_before_request(self, mock_provider: MagicMock) -> None:
         mock_provider.provider_name = "nim"
         mock_provider.model = "qwen/qwen3.5-397b-a17b"
-        mock_provider.complete = AsyncMock(
-            return_value=CompletionResponse(
+        mock_provider.complete = _ScriptedComplete(
+            CompletionResponse(
                 message=LLMMessage(role="assistant", parts=[TextPart(text='{"ok": true}')]),
                 usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
             )
         )
 
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
-            adapter = NativeLLMAdapter("nim/qwen/qwen3.5-397b-a17b")
-            await adapter.complete(
-                messages=[
-                    {"role": "user", "content": "Hello"},
-                    {"role": "system", "content": "System guidance"},
-                ]
-            )
+        adapter = NativeLLMAdapter("nim/qwen/qwen3.5-397b-a17b")
+        await adapter.complete(
+            messages=[
+                {"role": "user", "content": "Hello"},
+                {"role": "system", "content": "System guidance"},
+            ]
+        )
 
-            request = mock_provider.complete.call_args.args[0]
-            assert [msg.role for msg in request.messages] == ["system", "user"]
+        request = mock_provider.complete.requests[-1]
+        assert [msg.role for msg in request.messages] == ["system", "user"]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_collapses_multiple_nim_system_messages(self, mock_provider: MagicMock) -> None:
         mock_provider.provider_name = "nim"
         mock_provider.model = "qwen/qwen3.5-397b-a17b"
-        mock_provider.complete = AsyncMock(
-            return_value=CompletionResponse(
+        mock_provider.complete = _ScriptedComplete(
+            CompletionResponse(
                 message=LLMMessage(role="assistant", parts=[TextPart(text='{"ok": true}')]),
                 usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
             )
         )
 
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
-            adapter = NativeLLMAdapter("nim/qwen/qwen3.5-397b-a17b")
-            await adapter.complete(
-                messages=[
-                    {"role": "system", "content": "System A"},
-                    {"role": "user", "content": "Hello"},
-                    {"role": "system", "content": "System B"},
-                ]
-            )
+        adapter = NativeLLMAdapter("nim/qwen/qwen3.5-397b-a17b")
+        await adapter.complete(
+            messages=[
+                {"role": "system", "content": "System A"},
+                {"role": "user", "content": "Hello"},
+                {"role": "system", "content": "System B"},
+            ]
+        )
 
-            request = mock_provider.complete.call_args.args[0]
-            assert [msg.role for msg in request.messages] == ["system", "user"]
-            assert "System A" in request.messages[0].text
-            assert "System B" in request.messages[0].text
+        request = mock_provider.complete.requests[-1]
+        assert [msg.role for msg in request.messages] == ["system", "user"]
+        assert "System A" in request.messages[0].text
+        assert "System B" in request.messages[0].text
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_downgrades_schema_after_invalid_json_schema_error(self, mock_provider: MagicMock) -> None:
-        mock_provider.complete = AsyncMock(
-            side_effect=[
-                RuntimeError("invalid_json_schema: strict provider rejected schema"),
-                CompletionResponse(
-                    message=LLMMessage(role="assistant", parts=[TextPart(text='{"result": "ok"}')]),
-                    usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
-                ),
-            ]
+        mock_provider.complete = _ScriptedComplete(
+            RuntimeError("invalid_json_schema: strict provider rejected schema"),
+            CompletionResponse(
+                message=LLMMessage(role="assistant", parts=[TextPart(text='{"result": "ok"}')]),
+                usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
+            ),
         )
 
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("test-model", json_schema_mode=True)
-            content, _ = await adapter.complete(
-                messages=[{"role": "user", "content": "test"}],
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "planner_action",
-                        "schema": {
-                            "type": "object",
-                            "properties": {
-                                "args": {"type": "object"},
-                            },
-                            "required": ["args"],
+        adapter = NativeLLMAdapter("test-model", json_schema_mode=True)
+        content, _ = await adapter.complete(
+            messages=_USER_TEST_MESSAGES,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "planner_action",
+                    "schema": {
+                        "type": "object",
+                        "properties": {
+                            "args": {"type": "object"},
                         },
+                        "required": ["args"],
                     },
                 },
-            )
+            },
+        )
 
-            assert content == '{"result": "ok"}'
-            assert mock_provider.complete.call_count == 2
-            retry_request = mock_provider.complete.call_args_list[1].args[0]
-            assert retry_request.structured_output is not None
-            assert retry_request.structured_output.name == "json_response"
-            assert retry_request.structured_output.json_schema == {"type": "object"}
-            assert retry_request.structured_output.strict is False
+        assert content == '{"result": "ok"}'
+        assert len(mock_provider.complete.requests) == 2
+        retry_request = mock_provider.complete.requests[1]
+        assert retry_request.structured_output is not None
+        assert retry_request.structured_output.name == "json_response"
+        assert retry_request.structured_output.json_schema == {"type": "object"}
+        assert retry_request.structured_output.strict is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_downgrades_json_object_to_text_mode(self, mock_provider: MagicMock) -> None:
         mock_provider.provider_name = "openrouter"
         mock_provider.model = "meta-llama/llama-3.3-70b-instruct"
-        mock_provider.complete = AsyncMock(
-            side_effect=[
-                RuntimeError("response_format json_object is not supported for this model"),
-                CompletionResponse(
-                    message=LLMMessage(role="assistant", parts=[TextPart(text='{"result": "ok"}')]),
-                    usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
-                ),
-            ]
+        mock_provider.complete = _ScriptedComplete(
+            RuntimeError("response_format json_object is not supported for this model"),
+            CompletionResponse(
+                message=LLMMessage(role="assistant", parts=[TextPart(text='{"result": "ok"}')]),
+                usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
+            ),
         )
 
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("openrouter/meta-llama/llama-3.3-70b-instruct", json_schema_mode=True)
-            content, _ = await adapter.complete(
-                messages=[{"role": "user", "content": "test"}],
-                response_format={"type": "json_object"},
-            )
+        adapter = NativeLLMAdapter("openrouter/meta-llama/llama-3.3-70b-instruct", json_schema_mode=True)
+        content, _ = await adapter.complete(
+            messages=_USER_TEST_MESSAGES,
+            response_format={"type": "json_object"},
+        )
 
-            assert content == '{"result": "ok"}'
-            assert mock_provider.complete.call_count == 2
-            retry_request = mock_provider.complete.call_args_list[1].args[0]
-            assert retry_request.structured_output is None
+        assert content == '{"result": "ok"}'
+        assert len(mock_provider.complete.requests) == 2
+        retry_request = mock_provider.complete.requests[1]
+        assert retry_request.structured_output is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_nim_structured_disables_reasoning_after_error(self, mock_provider: MagicMock) -> None:
         mock_provider.provider_name = "nim"
         mock_provider.model = "qwen/qwen3.5-397b-a17b"
-        mock_provider.complete = AsyncMock(
-            side_effect=[
-                RuntimeError("provider rejected first structured request"),
-                CompletionResponse(
-                    message=LLMMessage(role="assistant", parts=[TextPart(text='{"result": "ok"}')]),
-                    usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
-                    reasoning_content="hidden reasoning",
-                ),
-            ]
+        mock_provider.complete = _ScriptedComplete(
+            RuntimeError("provider rejected first structured request"),
+            CompletionResponse(
+                message=LLMMessage(role="assistant", parts=[TextPart(text='{"result": "ok"}')]),
+                usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
+                reasoning_content="hidden reasoning",
+            ),
         )
 
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
+        reasoning_chunks: list[tuple[str, bool]] = []
 
-            reasoning_chunks: list[tuple[str, bool]] = []
-
-            def on_reasoning(text: str, done: bool) -> None:
-                reasoning_chunks.append((text, done))
+        def on_reasoning(text: str, done: bool) -> None:
+            reasoning_chunks.append((text, done))
 
-            adapter = NativeLLMAdapter(
-                "nim/qwen/qwen3.5-397b-a17b",
-                json_schema_mode=True,
-                use_native_reasoning=True,
-                reasoning_effort="high",
-            )
-            content, _ = await adapter.complete(
-                messages=[{"role": "user", "content": "test"}],
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "planner_action",
-                        "schema": {
-                            "type": "object",
-                            "properties": {"next_node": {"type": "string"}},
-                            "required": ["next_node"],
-                        },
-                    },
-                },
-                on_reasoning_chunk=on_reasoning,
-            )
+        adapter = NativeLLMAdapter(
+            "nim/qwen/qwen3.5-397b-a17b",
+            json_schema_mode=True,
+            use_native_reasoning=True,
+            reasoning_effort="high",
+        )
+        content, _ = await adapter.complete(
+            messages=_USER_TEST_MESSAGES,
+            response_format=_PLANNER_ACTION_FORMAT,
+            on_reasoning_chunk=on_reasoning,
+        )
 
-            assert content == '{"result": "ok"}'
-            assert mock_provider.complete.call_count == 2
-            first_request = mock_provider.complete.call_args_list[0].args[0]
-            second_request = mock_provider.complete.call_args_list[1].args[0]
-            assert first_request.extra is not None
-            assert first_request.extra["reasoning_effort"] == "high"
-            assert second_request.extra is None
-            assert reasoning_chunks == []
+        assert content == '{"result": "ok"}'
+        assert len(mock_provider.complete.requests) == 2
+        first_request = mock_provider.complete.requests[0]
+        second_request = mock_provider.complete.requests[1]
+        assert first_request.extra is not None
+        assert first_request.extra["reasoning_effort"] == "high"
+        assert second_request.extra is None
+        assert reasoning_chunks == []
 
 
 class TestCreateNativeAdapter:
@@ -656,21 +571,7 @@ class TestCreateNativeAdapter:
 class TestNativeLLMAdapterStreaming:
     """Additional streaming tests for NativeLLMAdapter."""
 
-    @pytest.fixture
-    def mock_provider(self) -> MagicMock:
-        """Create a mock provider."""
-        provider = MagicMock()
-        provider.model = "test-model"
-        provider.provider_name = "test"
-        provider.complete = AsyncMock(
-            return_value=CompletionResponse(
-                message=LLMMessage(role="assistant", parts=[TextPart(text='{"result": "ok"}')]),
-                usage=Usage(input_tokens=10, output_tokens=5, total_tokens=15),
-            )
-        )
-        return provider
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_streaming_callback_wrapper(self, mock_provider: MagicMock) -> None:
         """Test that streaming callback wrapper forwards events correctly."""
         from penguiflow.llm.types import StreamEvent
@@ -699,16 +600,13 @@ class TestNativeLLMAdapterStreaming:
 
         mock_provider.complete = mock_complete
 
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("test-model", streaming_enabled=True)
-            await adapter.complete(
-                messages=[{"role": "user", "content": "Hi"}],
-                stream=True,
-                on_stream_chunk=on_chunk,
-                on_reasoning_chunk=on_reasoning,
-            )
+        adapter = NativeLLMAdapter("test-model", streaming_enabled=True)
+        await adapter.complete(
+            messages=[{"role": "user", "content": "Hi"}],
+            stream=True,
+            on_stream_chunk=on_chunk,
+            on_reasoning_chunk=on_reasoning,
+        )
 
         assert ("Hello", False) in received_chunks
         assert (" world", False) in received_chunks
@@ -716,34 +614,31 @@ class TestNativeLLMAdapterStreaming:
         assert ("Because...", False) in received_reasoning
         assert ("", True) in received_reasoning
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_streaming_disabled_ignores_callback(self, mock_provider: MagicMock) -> None:
         """Test that streaming disabled doesn't use callback."""
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("test-model", streaming_enabled=False)
+        adapter = NativeLLMAdapter("test-model", streaming_enabled=False)
 
-            called = False
+        called = False
 
-            def on_chunk(text: str, done: bool) -> None:
-                nonlocal called
-                called = True
+        def on_chunk(text: str, done: bool) -> None:
+            nonlocal called
+            called = True
 
-            await adapter.complete(
-                messages=[{"role": "user", "content": "Hi"}],
-                stream=True,  # Requested but disabled
-                on_stream_chunk=on_chunk,
-            )
+        await adapter.complete(
+            messages=[{"role": "user", "content": "Hi"}],
+            stream=True,  # Requested but disabled
+            on_stream_chunk=on_chunk,
+        )
 
-            # stream should be False when streaming_enabled=False
-            call_kwargs = mock_provider.complete.call_args[1]
-            assert call_kwargs["stream"] is False
+        # stream should be False when streaming_enabled=False
+        call_kwargs = mock_provider.complete.kwargs[-1]
+        assert call_kwargs["stream"] is False
 
 
 class TestNativeLLMAdapterStreamEvents:
-    @pytest.mark.asyncio
-    async def test_stream_events_yields_provider_events(self) -> None:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_stream_events_yields_provider_events(self, mock_provider: MagicMock) -> None:
         from penguiflow.llm.types import StreamEvent
 
         async def mock_complete(request: Any, **kwargs: Any) -> CompletionResponse:
@@ -759,37 +654,25 @@ class TestNativeLLMAdapterStreamEvents:
                 reasoning_content="Thinking...",
             )
 
-        mock_provider = MagicMock()
-        mock_provider.model = "test-model"
-        mock_provider.provider_name = "test"
         mock_provider.complete = mock_complete
 
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
-            adapter = NativeLLMAdapter("test-model", streaming_enabled=True)
+        adapter = NativeLLMAdapter("test-model", streaming_enabled=True)
 
-            events: list[Any] = []
-            async for event in adapter.stream_events(messages=[{"role": "user", "content": "Hi"}]):
-                events.append(event)
+        events: list[Any] = []
+        async for event in adapter.stream_events(messages=[{"role": "user", "content": "Hi"}]):
+            events.append(event)
 
         assert any(e.delta_text == "Hello" for e in events)
         assert any(e.delta_reasoning == "Thinking..." for e in events)
         assert events[-1].done is True
 
-    @pytest.mark.asyncio
-    async def test_stream_events_raises_when_disabled(self) -> None:
-        mock_provider = MagicMock()
-        mock_provider.model = "test-model"
-        mock_provider.provider_name = "test"
-        mock_provider.complete = AsyncMock()
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_stream_events_raises_when_disabled(self, mock_provider: MagicMock) -> None:
+        adapter = NativeLLMAdapter("test-model", streaming_enabled=False)
 
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
-            adapter = NativeLLMAdapter("test-model", streaming_enabled=False)
-
-            with pytest.raises(RuntimeError, match="Streaming is disabled"):
-                async for _ in adapter.stream_events(messages=[{"role": "user", "content": "Hi"}]):
-                    pass
+        with pytest.raises(RuntimeError, match="Streaming is disabled"):
+            async for _ in adapter.stream_events(messages=[{"role": "user", "content": "Hi"}]):
+                pass
 
 
 class TestNativeLLMAdapterBuildRequest:
@@ -797,213 +680,173 @@ class TestNativeLLMAdapterBuildRequest:
 
     def test_build_request_no_response_format(self) -> None:
         """Test request building without response format."""
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "test-model"
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("test-model", temperature=0.5)
-            messages = [LLMMessage(role="user", parts=[TextPart(text="Hello")])]
+        adapter = NativeLLMAdapter("test-model", temperature=0.5)
+        messages = [LLMMessage(role="user", parts=[TextPart(text="Hello")])]
 
-            request = adapter._build_request(messages, None)
+        request = adapter._build_request(messages, None)
 
-            assert request.model == "test-model"
-            assert request.temperature == 0.5
-            assert request.structured_output is None
+        assert request.model == "test-model"
+        assert request.temperature == 0.5
+        assert request.structured_output is None
 
     def test_build_request_json_schema_mode_disabled(self) -> None:
         """Test request building with json_schema_mode disabled."""
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "test-model"
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("test-model", json_schema_mode=False)
-            messages = [LLMMessage(role="user", parts=[TextPart(text="Hello")])]
-
-            # Pass response_format but mode is disabled
-            request = adapter._build_request(
-                messages,
-                {"type": "json_schema", "json_schema": {"name": "test", "schema": {}}},
-            )
+        adapter = NativeLLMAdapter("test-model", json_schema_mode=False)
+        messages = [LLMMessage(role="user", parts=[TextPart(text="Hello")])]
 
-            # structured_output should be None when mode is disabled
-            assert request.structured_output is None
+        # Pass response_format but mode is disabled
+        request = adapter._build_request(
+            messages,
+            {"type": "json_schema", "json_schema": {"name": "test", "schema": {}}},
+        )
+
+        # structured_output should be None when mode is disabled
+        assert request.structured_output is None
 
-    def test_build_request_with_reasoning_effort(self) -> None:
+    def test_build_request_with_reasoning_effort(self, mock_provider: MagicMock) -> None:
         """Test request building includes reasoning effort in extra."""
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "o1"
-            mock_create.return_value = mock_provider
+        mock_provider.model = "o1"
 
-            adapter = NativeLLMAdapter(
-                "o1",
-                use_native_reasoning=True,
-                reasoning_effort="medium",
-            )
-            messages = [LLMMessage(role="user", parts=[TextPart(text="Think")])]
+        adapter = NativeLLMAdapter(
+            "o1",
+            use_native_reasoning=True,
+            reasoning_effort="medium",
+        )
+        messages = [LLMMessage(role="user", parts=[TextPart(text="Think")])]
 
-            request = adapter._build_request(messages, None)
+        request = adapter._build_request(messages, None)
 
-            assert request.extra is not None
-            assert request.extra["reasoning_effort"] == "medium"
+        assert request.extra is not None
+        assert request.extra["reasoning_effort"] == "medium"
 
-    def test_build_request_with_reasoning_effort_for_nim_model(self) -> None:
+    def test_build_request_with_reasoning_effort_for_nim_model(self, mock_provider: MagicMock) -> None:
         """NIM models should use the same canonical reasoning_effort request knob."""
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "qwen/qwen3.5-397b-a17b"
-            mock_create.return_value = mock_provider
+        mock_provider.model = "qwen/qwen3.5-397b-a17b"
 
-            adapter = NativeLLMAdapter(
-                "nim/qwen/qwen3.5-397b-a17b",
-                use_native_reasoning=True,
-                reasoning_effort="high",
-            )
-            messages = [LLMMessage(role="user", parts=[TextPart(text="Think")])]
+        adapter = NativeLLMAdapter(
+            "nim/qwen/qwen3.5-397b-a17b",
+            use_native_reasoning=True,
+            reasoning_effort="high",
+        )
+        messages = [LLMMessage(role="user", parts=[TextPart(text="Think")])]
 
-            request = adapter._build_request(messages, None)
+        request = adapter._build_request(messages, None)
 
-            assert request.extra is not None
-            assert request.extra["reasoning_effort"] == "high"
+        assert request.extra is not None
+        assert request.extra["reasoning_effort"] == "high"
 
-    def test_build_request_openrouter_xai_injects_reasoning_enabled(self) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "x-ai/grok-4.1-fast"
-            mock_provider.provider_name = "openrouter"
-            mock_create.return_value = mock_provider
+    def test_build_request_openrouter_xai_injects_reasoning_enabled(self, mock_provider: MagicMock) -> None:
+        mock_provider.model = "x-ai/grok-4.1-fast"
+        mock_provider.provider_name = "openrouter"
 
-            adapter = NativeLLMAdapter(
-                "openrouter/x-ai/grok-4.1-fast",
-                use_native_reasoning=True,
-            )
-            messages = [LLMMessage(role="user", parts=[TextPart(text="Think")])]
+        adapter = NativeLLMAdapter(
+            "openrouter/x-ai/grok-4.1-fast",
+            use_native_reasoning=True,
+        )
+        messages = [LLMMessage(role="user", parts=[TextPart(text="Think")])]
 
-            request = adapter._build_request(messages, None)
+        request = adapter._build_request(messages, None)
 
-            assert request.extra is not None
-            assert request.extra["reasoning_enabled"] is True
-            assert "reasoning_effort" not in request.extra
+        assert request.extra is not None
+        assert request.extra["reasoning_enabled"] is True
+        assert "reasoning_effort" not in request.extra
 
-    def test_build_request_openrouter_xai_reasoning_effort_off_sets_disabled(self) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "x-ai/grok-4.1-fast"
-            mock_provider.provider_name = "openrouter"
-            mock_create.return_value = mock_provider
+    def test_build_request_openrouter_xai_reasoning_effort_off_sets_disabled(self, mock_provider: MagicMock) -> None:
+        mock_provider.model = "x-ai/grok-4.1-fast"
+        mock_provider.provider_name = "openrouter"
 
-            adapter = NativeLLMAdapter(
-                "openrouter/x-ai/grok-4.1-fast",
-                use_native_reasoning=True,
-                reasoning_effort="off",
-            )
-            messages = [LLMMessage(role="user", parts=[TextPart(text="Think")])]
+        adapter = NativeLLMAdapter(
+            "openrouter/x-ai/grok-4.1-fast",
+            use_native_reasoning=True,
+            reasoning_effort="off",
+        )
+        messages = [LLMMessage(role="user", parts=[TextPart(text="Think")])]
 
-            request = adapter._build_request(messages, None)
+        request = adapter._build_request(messages, None)
 
-            assert request.extra is not None
-            assert request.extra["reasoning_enabled"] is False
-            assert request.extra["reasoning_effort"] == "off"
+        assert request.extra is not None
+        assert request.extra["reasoning_enabled"] is False
+        assert request.extra["reasoning_effort"] == "off"
 
-    def test_build_request_openrouter_non_xai_does_not_inject_reasoning_enabled(self) -> None:
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "anthropic/claude-sonnet-4.5"
-            mock_provider.provider_name = "openrouter"
-            mock_create.return_value = mock_provider
+    def test_build_request_openrouter_non_xai_does_not_inject_reasoning_enabled(self, mock_provider: MagicMock) -> None:
+        mock_provider.model = "anthropic/claude-sonnet-4.5"
+        mock_provider.provider_name = "openrouter"
 
-            adapter = NativeLLMAdapter(
-                "openrouter/anthropic/claude-sonnet-4.5",
-                use_native_reasoning=True,
-            )
-            messages = [LLMMessage(role="user", parts=[TextPart(text="Think")])]
+        adapter = NativeLLMAdapter(
+            "openrouter/anthropic/claude-sonnet-4.5",
+            use_native_reasoning=True,
+        )
+        messages = [LLMMessage(role="user", parts=[TextPart(text="Think")])]
 
-            request = adapter._build_request(messages, None)
+        request = adapter._build_request(messages, None)
 
-            assert request.extra is None
+        assert request.extra is None
 
-    def test_build_request_no_reasoning_when_disabled(self) -> None:
+    def test_build_request_no_reasoning_when_disabled(self, mock_provider: MagicMock) -> None:
         """Test request building omits reasoning when disabled."""
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_provider = MagicMock()
-            mock_provider.model = "o1"
-            mock_create.return_value = mock_provider
+        mock_provider.model = "o1"
 
-            adapter = NativeLLMAdapter(
-                "o1",
-                use_native_reasoning=False,
-                reasoning_effort="medium",
-            )
-            messages = [LLMMessage(role="user", parts=[TextPart(text="Think")])]
+        adapter = NativeLLMAdapter(
+            "o1",
+            use_native_reasoning=False,
+            reasoning_effort="medium",
+        )
+        messages = [LLMMessage(role="user", parts=[TextPart(text="Think")])]
 
-            request = adapter._build_request(messages, None)
+        request = adapter._build_request(messages, None)
 
-            # extra should be None when use_native_reasoning is False
-            assert request.extra is None
+        # extra should be None when use_native_reasoning is False
+        assert request.extra is None
 
 
 class TestNativeLLMAdapterCost:
     """Tests for cost calculation in adapter."""
 
-    @pytest.mark.asyncio
-    async def test_cost_from_usage(self) -> None:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_cost_from_usage(self, mock_provider: MagicMock) -> None:
         """Test cost calculated from usage."""
-        mock_provider = MagicMock()
         mock_provider.model = "gpt-4o"
-        mock_provider.complete = AsyncMock(
-            return_value=CompletionResponse(
+        mock_provider.complete = _ScriptedComplete(
+            CompletionResponse(
                 message=LLMMessage(role="assistant", parts=[TextPart(text="Response")]),
                 usage=Usage(input_tokens=1000, output_tokens=500, total_tokens=1500),
             )
         )
 
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("gpt-4o")
-            content, cost = await adapter.complete(messages=[{"role": "user", "content": "Hello"}])
+        adapter = NativeLLMAdapter("gpt-4o")
+        content, cost = await adapter.complete(messages=[{"role": "user", "content": "Hello"}])
 
-            # Cost should be positive for known model
-            assert cost > 0
+        # Cost should be positive for known model
+        assert cost > 0
 
-    @pytest.mark.asyncio
-    async def test_estimated_cost_no_usage_for_known_model(self) -> None:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_estimated_cost_no_usage_for_known_model(self, mock_provider: MagicMock) -> None:
         """Test cost estimation when usage is missing but pricing is known."""
-        mock_provider = MagicMock()
         mock_provider.model = "claude-haiku-4.5"
-        mock_provider.complete = AsyncMock(
-            return_value=CompletionResponse(
+        mock_provider.complete = _ScriptedComplete(
+            CompletionResponse(
                 message=LLMMessage(role="assistant", parts=[TextPart(text="Response " * 200)]),
                 usage=Usage.zero(),
             )
         )
 
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
+        adapter = NativeLLMAdapter("claude-haiku-4.5")
+        content, cost = await adapter.complete(messages=[{"role": "user", "content": "Hello " * 500}])
 
-            adapter = NativeLLMAdapter("claude-haiku-4.5")
-            content, cost = await adapter.complete(messages=[{"role": "user", "content": "Hello " * 500}])
+        assert cost > 0.0
 
-            assert cost > 0.0
-
-    @pytest.mark.asyncio
-    async def test_zero_cost_no_usage_for_unknown_model(self) -> None:
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_zero_cost_no_usage_for_unknown_model(self, mock_provider: MagicMock) -> None:
         """Test zero cost when usage is missing and pricing is unknown."""
-        mock_provider = MagicMock()
         mock_provider.model = "totally-unknown-model"
-        mock_provider.complete = AsyncMock(
-            return_value=CompletionResponse(
+        mock_provider.complete = _ScriptedComplete(
+            CompletionResponse(
                 message=LLMMessage(role="assistant", parts=[TextPart(text="Response")]),
                 usage=None,
             )
         )
 
-        with patch("penguiflow.llm.protocol.create_provider") as mock_create:
-            mock_create.return_value = mock_provider
-
-            adapter = NativeLLMAdapter("totally-unknown-model")
-            content, cost = await adapter.complete(messages=[{"role": "user", "content": "Hello"}])
+        adapter = NativeLLMAdapter("totally-unknown-model")
+        content, cost = await adapter.complete(messages=[{"role": "user", "content": "Hello"}])
 
-            assert cost == 0.0
+        assert cost == 0.0
@@ -13,6 +13,7 @@ from penguiflow.llm.schema.plan import (
 )
 from penguiflow.llm.schema.transformer import (
     JsonSchemaTransformer,
+    copy_schema,
     estimate_object_key_count,
     has_composition_keywords,
     has_refs,
@@ -35,6 +36,14 @@ class TestJsonSchemaTransformer:
         assert result["type"] == "object"
         assert "properties" in result
 
+    def test_original_schema_is_independent_copy(self) -> None:
+        schema = {"type": "object", "required": ["name"], "properties": {"name": {"enum": ["a", "b"]}}}
+        transformer = ConcreteTransformer(schema)
+        transformer.original_schema["required"].append("extra")
+        transformer.original_schema["properties"]["name"]["enum"].append("c")
+
+        assert schema == {"type": "object", "required": ["name"], "properties": {"name": {"enum": ["a", "b"]}}}
+
     def test_is_strict_compatible_default(self) -> None:
         schema = {"type": "object"}
         transformer = ConcreteTransformer(schema)
@@ -167,6 +176,18 @@ class TestJsonSchemaTransformer:
         assert result.get("additionalProperties") is False
 
 
+class TestCopySchema:
+    def test_copies_containers_and_keeps_other_values_equal(self) -> None:
+        marker = {("tuple", "key")}
+        schema = {"a": [{"b": 1}], "c": None, "d": marker}
+        copied = copy_schema(schema)
+
+        assert copied == schema
+        assert copied["a"] is not schema["a"]
+        assert copied["a"][0] is not schema["a"][0]
+        assert copied["d"] is not marker
+
+
 class TestEstimateObjectKeyCount:
     def test_simple_object(self) -> None:
         schema = {
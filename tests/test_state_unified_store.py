@@ -188,3 +188,33 @@ async def test_adapters_planner_event_compat_uses_legacy_playground_names() -> N
     event = PlannerEvent(event_type="finish", ts=time.time(), trajectory_step=1)
     await save_planner_event_compat(store, "trace", event)
     assert await list_planner_events_compat(store, "trace") == [event]
+
+
+@pytest.mark.asyncio
+async def test_inmemory_statestore_bulk_save_matches_individual_saves() -> None:
+    store = InMemoryStateStore(max_updates_per_session=2)
+    task = TaskState(
+        task_id="t",
+        session_id="s",
+        status=TaskStatus.PENDING,
+        task_type=TaskType.FOREGROUND,
+        priority=0,
+        context_snapshot=TaskContextSnapshot(session_id="s", task_id="t"),
+    )
+    steering = SteeringEvent(
+        session_id="s",
+        task_id="t",
+        event_type=SteeringEventType.INJECT_CONTEXT,
+        payload={"text": "x" * 5000},
+    )
+    updates = [
+        StateUpdate(session_id="s", task_id="t", update_type=UpdateType.THINKING, content={"n": n}) for n in range(3)
+    ]
+
+    await store.bulk_save({"tasks": [task], "steering": [steering], "updates": updates})
+
+    assert [t.task_id for t in await store.list_tasks("s")] == ["t"]
+    assert [u.content for u in await store.list_updates("s")] == [{"n": 1}, {"n": 2}]
+    stored_steering = await store.list_steering("s")
+    assert len(stored_steering) == 1
+    assert len(stored_steering[0].payload["text"]) < 5000